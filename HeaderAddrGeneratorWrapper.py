@@ -77,30 +77,97 @@ class HeaderAddrGeneratorWrapper():
     # Use kernel compliant wrapper or not
     use_kern_style = False
 
-    def do_update(self):
-        with open(self.xactSpec) as f:
-            name = None
-            offset = 0
-            
-            component = Component()
-            component.load(f)
-
-            with open_output(self.outFile) as of:
-                header_gen = None
-                if self.use_kern_style:
-                    header_gen = KernHeaderAddrGenerator(component, self.memMap, self.wordWidth)
-                else:
-                    header_gen = HeaderAddrGenerator(component, self.memMap, self.wordWidth)
-                header_gen.set_of(of)
-
-                if self.licPath != "":
-                    lic_text = load_license(self.licPath)
-                    write_license(lic_text, '*', of)
-
-                header_gen.prefix = "ctu_can_fd"
+    # When set to "True" kernel style header contains Linux regmap tables
+    # (readable, writeable, volatile and precious ranges, register defaults).
+    regmap_tables = False
+
+    # When set to "True" header contains "_MASK" / "_SHIFT" macros and inline
+    # get / set / update helpers of register fields instead of bitfield unions.
+    field_accessors = False
+
+    # Directory with cache of loaded IP-XACT components. When set, XML parsing
+    # is skipped if the specification did not change since last run.
+    cacheDir = None
+
+    # When set to "True" output is regenerated only if its inputs changed
+    # since last run. Fingerprint of inputs is kept in manifest next to output.
+    incremental = False
+
+    # When set to "True" output is streamed to a temporary file while it
+    # is generated, instead of being kept in memory until it is complete.
+    streamOutput = False
+
+    # Path of JSON report with durations of generation phases (load,
+    # construct, write_* methods, commit). Phases are timed only when set.
+    timingReport = None
+
+    # Profiler run during generation when timing report is enabled:
+    # "cprofile" or "tracemalloc". Its results are part of the timing report.
+    profile = None
+
+    def generate(self, component):
+        """
+        Generate C header from already loaded IP-XACT component.
+        """
+        # Kernel style header has no field accessors
+        if (self.use_kern_style and
+            str_arg_to_bool(str(self.field_accessors))):
+            print("ERROR: field_accessors can't be used with use_kern_style")
+            sys.exit(1)
+
+        header_gen = None
+        with timed_phase("construct"):
+            if self.use_kern_style:
+                header_gen = KernHeaderAddrGenerator(component, self.memMap, self.wordWidth)
+            else:
+                header_gen = HeaderAddrGenerator(component, self.memMap, self.wordWidth)
+        header_gen.prefix = "ctu_can_fd"
+        regmap_tables = str_arg_to_bool(str(self.regmap_tables))
+        field_accessors = str_arg_to_bool(str(self.field_accessors))
+        if self.use_kern_style:
+            header_gen.regmap_tables = regmap_tables
+        else:
+            header_gen.field_accessors = field_accessors
+        time_generator_methods(header_gen)
+        stream = str_arg_to_bool(str(self.streamOutput))
+        header_gen.streamOutput = stream
+
+        lic_text = ""
+        if self.licPath != "":
+            lic_text = load_license(self.licPath)
+
+        # Skip generation when inputs did not change
+        incremental = str_arg_to_bool(str(self.incremental))
+        fingerprint = calc_output_fingerprint(header_gen.calc_mem_map_fingerprint(),
+                                              self.headName, header_gen.prefix,
+                                              self.use_kern_style, regmap_tables,
+                                              field_accessors, lic_text)
+        if incremental and check_output_up_to_date(self.outFile, fingerprint):
+            return
+
+        with open_output(self.outFile, stream) as of:
+            header_gen.set_of(of)
+
+            if self.licPath != "":
+                write_license(lic_text, '*', of)
+
+            with timed_phase("create_addrMap_package"):
                 header_gen.create_addrMap_package(self.headName)
 
+            with timed_phase("commit"):
                 header_gen.commit_to_file()
 
+        if incremental:
+            update_output_fingerprint(self.outFile, fingerprint)
+
+    def do_update(self):
+        start_phase_timing(self.timingReport != None, self.profile)
+        with timed_phase("load"):
+            component = load_component(self.xactSpec, self.cacheDir)
+        with timed_phase("generate"):
+            self.generate(component)
+        print_output_summary()
+        stop_phase_timing(self.timingReport)
+
     if __name__ == '__main__':
         self.do_update()
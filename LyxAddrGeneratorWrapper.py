@@ -79,35 +79,82 @@ class LyxAddrGeneratorWrapper():
 	# Path to configuration of generics
 	configPath = None
 
-	def do_update(self):
-
-		args = parse_args()
-		with open(self.xactSpec) as f:
-			name = None
-			offset = 0
-			addrMap = None
-			fieldMap = None
-
-			component = Component()
-			component.load(f)
+	# Directory with cache of loaded IP-XACT components. When set, XML parsing
+	# is skipped if the specification did not change since last run.
+	cacheDir = None
+
+	# When set to "True" output is regenerated only if its inputs changed
+	# since last run. Fingerprint of inputs is kept in manifest next to output.
+	incremental = False
+
+	# When set to "True" output is streamed to a temporary file while it
+	# is generated, instead of being kept in memory until it is complete.
+	streamOutput = False
+
+	# Path of JSON report with durations of generation phases (load,
+	# construct, write_* methods, commit). Phases are timed only when set.
+	timingReport = None
+
+	# Profiler run during generation when timing report is enabled:
+	# "cprofile" or "tracemalloc". Its results are part of the timing report.
+	profile = None
+
+	def generate(self, component):
+		"""
+		Generate Lyx documentation from already loaded IP-XACT component.
+		"""
+		with timed_phase("construct"):
+			lyxGen = LyxAddrGenerator(component, self.memMap, self.wordWidth, 
+										genRegions=self.genRegions,
+										genFiDesc=self.genFiDesc)
+		time_generator_methods(lyxGen)
+		stream = str_arg_to_bool(str(self.streamOutput))
+		lyxGen.streamOutput = stream
+
+		with open(self.configPath, 'rt') as f:
+			config_text = f.read()
+
+		# Skip generation when inputs did not change. Template and config
+		# are part of the inputs.
+		incremental = str_arg_to_bool(str(self.incremental))
+		if (incremental):
+			with open(self.lyxTemplate, 'rt') as f:
+				template_text = f.read()
+			fingerprint = calc_output_fingerprint(lyxGen.calc_mem_map_fingerprint(),
+							str(self.genRegions), str(self.genFiDesc),
+							template_text, config_text)
+			if (check_output_up_to_date(self.outFile, fingerprint)):
+				return
+
+		with open_output(self.outFile, stream) as of:
+
+			lyxGen.set_of(of)
+			lyxGen.lyxGen.load_lyx_template(self.lyxTemplate)
+
+			lyxGen.config = yaml.safe_load(config_text)
+
+			# Write the documentation
+			lyxGen.write_mem_map_both()
+
+			with timed_phase("commit"):
+				lyxGen.lyxGen.commit_append_lines_all()
+				lyxGen.commit_to_file()
+
+		if (incremental):
+			update_output_fingerprint(self.outFile, fingerprint)
 
-			with open_output(self.outFile) as of:
 
-				lyxGen = LyxAddrGenerator(component, self.memMap, self.wordWidth, 
-											genRegions=self.genRegions,
-											genFiDesc=self.genFiDesc)
-				lyxGen.set_of(of)
-				lyxGen.lyxGen.load_lyx_template(self.lyxTemplate)
-
-				with open(self.configPath, 'rt') as f:
-					lyxGen.config = yaml.safe_load(f)
-
-					# Write the documentation
-					lyxGen.write_mem_map_both()
+	def do_update(self):
 
-					lyxGen.lyxGen.commit_append_lines_all()
+		args = parse_args()
 
-					lyxGen.commit_to_file()
+		start_phase_timing(self.timingReport != None, self.profile)
+		with timed_phase("load"):
+			component = load_component(self.xactSpec, self.cacheDir)
+		with timed_phase("generate"):
+			self.generate(component)
+		print_output_summary()
+		stop_phase_timing(self.timingReport)
 
 	if __name__ == '__main__':
 		self.do_update()
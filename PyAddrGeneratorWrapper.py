@@ -0,0 +1,151 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##   
+##   Class for generation of Python register model module from IP-XACT
+##   specification. Module contains addresses, field masks, reset values
+##   and enums as constants, so test harnesses can import it without
+##   parsing IP-XACT.
+##
+##	Revision history:
+##      18.10.2026  First implementation
+##
+################################################################################
+
+import argparse
+import sys
+import time
+import importlib.util
+import os
+import inspect
+import math
+
+from .gen_lib import *
+from .ip_xact.py_addr_generator import PyAddrGenerator
+
+
+class PyAddrGeneratorWrapper():
+
+    # File with license which should be placed to header of the all source code files
+    licPath = ""
+
+    # Path to a IP-XACT specification file with register maps
+    xactSpec = ""
+
+    # Name of the IP-XACT Memory map which should be used for Python module generation.
+    memMap = None
+
+    # Size of the access bus word. Registers are grouped to memory words of
+    # this size in "WORDS" dictionary of the module.
+    wordWidth = 32
+
+    # Name of the register map written to the module docstring
+    modName = ""
+
+    # Prefix of constant names within the module
+    prefix = ""
+
+    # Output where to write the Python module.
+    outFile = ""
+
+    # Directory with cache of loaded IP-XACT components. When set, XML parsing
+    # is skipped if the specification did not change since last run.
+    cacheDir = None
+
+    # When set to "True" output is regenerated only if its inputs changed
+    # since last run. Fingerprint of inputs is kept in manifest next to output.
+    incremental = False
+
+    # When set to "True" output is streamed to a temporary file while it
+    # is generated, instead of being kept in memory until it is complete.
+    streamOutput = False
+
+    # Path of JSON report with durations of generation phases (load,
+    # construct, write_* methods, commit). Phases are timed only when set.
+    timingReport = None
+
+    # Profiler run during generation when timing report is enabled:
+    # "cprofile" or "tracemalloc". Its results are part of the timing report.
+    profile = None
+
+
+    def generate(self, component):
+        """
+        Generate Python module from already loaded IP-XACT component.
+        """
+        with timed_phase("construct"):
+            pyGen = PyAddrGenerator(component, self.memMap, self.wordWidth)
+        pyGen.prefix = self.prefix
+        time_generator_methods(pyGen)
+        stream = str_arg_to_bool(str(self.streamOutput))
+        pyGen.streamOutput = stream
+
+        lic_text = ""
+        if (self.licPath != ""):
+            lic_text = load_license(self.licPath)
+
+        # Skip generation when inputs did not change
+        incremental = str_arg_to_bool(str(self.incremental))
+        fingerprint = calc_output_fingerprint(pyGen.calc_mem_map_fingerprint(),
+                                              self.modName, self.prefix, lic_text)
+        if (incremental and check_output_up_to_date(self.outFile, fingerprint)):
+            return
+
+        with open_output(self.outFile, stream) as of:
+
+            pyGen.set_of(of)
+
+            if (self.licPath != ""):
+                write_license(lic_text, '#', of)
+
+            with timed_phase("create_addrMap_package"):
+                pyGen.create_addrMap_package(self.modName)
+
+            with timed_phase("commit"):
+                pyGen.commit_to_file()
+
+        if (incremental):
+            update_output_fingerprint(self.outFile, fingerprint)
+
+
+    def do_update(self):
+
+        start_phase_timing(self.timingReport != None, self.profile)
+
+        # Load IP-Xact component
+        with timed_phase("load"):
+            component = load_component(self.xactSpec, self.cacheDir)
+
+        with timed_phase("generate"):
+            self.generate(component)
+
+        print_output_summary()
+
+        stop_phase_timing(self.timingReport)
+
+    if __name__ == '__main__':
+        self.do_update()
@@ -0,0 +1,109 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+
+###############################################################################
+##   
+##   Multi-target wrapper. Loads IP-XACT specification once and runs any
+##   subset of generator wrappers on the loaded component.
+##
+##	Revision history:
+##      18.10.2026  First implementation
+##
+################################################################################
+
+import argparse
+import sys
+import time
+import importlib.util
+import os
+import inspect
+import math
+
+from .gen_lib import *
+
+
+class RegMapGeneratorWrapper():
+
+	# Path to a IP-XACT specification file with register maps
+	xactSpec = ""
+
+	# Directory with cache of loaded IP-XACT components. When set, XML parsing
+	# is skipped if the specification did not change since last run.
+	cacheDir = None
+
+	# Path of JSON report with durations of generation phases (load,
+	# construct, write_* methods, commit). Phases are timed only when set.
+	timingReport = None
+
+	# Profiler run during generation when timing report is enabled:
+	# "cprofile" or "tracemalloc". Its results are part of the timing report.
+	profile = None
+
+	# List of generator wrappers to run (VhdlAddrGeneratorWrapper,
+	# VhdlRegMapGeneratorWrapper, HeaderAddrGeneratorWrapper,
+	# LyxAddrGeneratorWrapper, VhdlTbAddrGeneratorWrapper,
+	# PyAddrGeneratorWrapper). "xactSpec" of
+	# each wrapper is ignored, all of them use the component loaded here.
+	targets = None
+
+	def __init__(self):
+		self.targets = []
+
+
+	def add_target(self, target):
+		"""
+		Add generator wrapper to the list of generated targets.
+		"""
+		if (not hasattr(target, "generate")):
+			print("ERROR: {} can't generate from loaded component".format(
+					target.__class__.__name__))
+			return False
+
+		self.targets.append(target)
+		return True
+
+
+	def do_update(self):
+		"""
+		Load IP-XACT component and run all targets on it.
+		"""
+		start_phase_timing(self.timingReport != None, self.profile)
+
+		with timed_phase("load"):
+			component = load_component(self.xactSpec, self.cacheDir)
+
+		for target in self.targets:
+			print("Generating: {}".format(target.__class__.__name__))
+			with timed_phase(target.__class__.__name__):
+				target.generate(component)
+
+		print_output_summary()
+
+		stop_phase_timing(self.timingReport)
+
+	if __name__ == '__main__':
+		self.do_update()
@@ -73,29 +73,79 @@ class VhdlAddrGeneratorWrapper():
     # Output where to write the VHDL package.
     outFile = ""
 
+    # Directory with cache of loaded IP-XACT components. When set, XML parsing
+    # is skipped if the specification did not change since last run.
+    cacheDir = None
+
+    # When set to "True" output is regenerated only if its inputs changed
+    # since last run. Fingerprint of inputs is kept in manifest next to output.
+    incremental = False
+
+    # When set to "True" output is streamed to a temporary file while it
+    # is generated, instead of being kept in memory until it is complete.
+    streamOutput = False
+
+    # Path of JSON report with durations of generation phases (load,
+    # construct, write_* methods, commit). Phases are timed only when set.
+    timingReport = None
+
+    # Profiler run during generation when timing report is enabled:
+    # "cprofile" or "tracemalloc". Its results are part of the timing report.
+    profile = None
+
+
+    def generate(self, component):
+        """
+        Generate VHDL package from already loaded IP-XACT component.
+        """
+        with timed_phase("construct"):
+            vhdlGen = VhdlAddrGenerator(component, self.memMap, self.wordWidth)
+        time_generator_methods(vhdlGen)
+        stream = str_arg_to_bool(str(self.streamOutput))
+        vhdlGen.streamOutput = stream
+
+        lic_text = ""
+        if (self.licPath != ""):
+            lic_text = load_license(self.licPath)
+
+        # Skip generation when inputs did not change
+        incremental = str_arg_to_bool(str(self.incremental))
+        fingerprint = calc_output_fingerprint(vhdlGen.calc_mem_map_fingerprint(),
+                                              self.packName, lic_text)
+        if (incremental and check_output_up_to_date(self.outFile, fingerprint)):
+            return
+
+        with open_output(self.outFile, stream) as of:
+
+            vhdlGen.set_of(of)
+
+            if (self.licPath != ""):
+                write_license(lic_text, '-', of)
+
+            with timed_phase("create_addrMap_package"):
+                vhdlGen.create_addrMap_package(self.packName)
+
+            with timed_phase("commit"):
+                vhdlGen.commit_to_file()
+
+        if (incremental):
+            update_output_fingerprint(self.outFile, fingerprint)
+
 
     def do_update(self):
 
-	    with open(self.xactSpec) as spec_file:
-		    name = None
-		    offset = 0
-		    
-            # Load IP-Xact component
-		    component = Component()
-		    component.load(spec_file)
-			    
-		    with open_output(self.outFile) as of:
-			    
-			    vhdlGen = VhdlAddrGenerator(component, self.memMap, self.wordWidth)
-			    vhdlGen.set_of(of)
-			    
-			    if (self.licPath != ""):
-				    lic_text = load_license(self.licPath)
-				    write_license(lic_text, '-', of)
-			    
-			    vhdlGen.create_addrMap_package(self.packName)
-			    
-			    vhdlGen.commit_to_file()
+        start_phase_timing(self.timingReport != None, self.profile)
+
+        # Load IP-Xact component
+        with timed_phase("load"):
+            component = load_component(self.xactSpec, self.cacheDir)
+
+        with timed_phase("generate"):
+            self.generate(component)
+
+        print_output_summary()
+
+        stop_phase_timing(self.timingReport)
 
     if __name__ == '__main__':
         self.do_update()
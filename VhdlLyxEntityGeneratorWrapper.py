@@ -82,7 +82,7 @@ class VhdlLyxEntityGeneratorWrapper():
 
 			self.gen = VhdlLyxEntityGenerator()
 
-			out_f = open(cfg["lyx_output"], 'w') 
+			out_f = open_output(cfg["lyx_output"])
 			self.gen.set_of(out_f)
 
 			self.gen.lyxGen.load_lyx_template(self.lyxTemplate)
@@ -98,5 +98,7 @@ class VhdlLyxEntityGeneratorWrapper():
 			out_f.close()
 			in_f.close()
 
+		print_output_summary()
+
 	if __name__ == '__main__':
 		self.do_update()
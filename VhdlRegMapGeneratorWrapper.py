@@ -46,7 +46,36 @@ import math
 from .gen_lib import *
 from .ip_xact.vhdl_reg_map_generator import VhdlRegMapGenerator
 
-from shutil import copyfile
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Register map generator of a worker process in parallel block generation
+worker_gen = None
+
+def init_reg_block_worker(vhdlGen):
+	"""
+	Initialize worker process for parallel generation of register blocks.
+	"""
+	global worker_gen
+	worker_gen = vhdlGen
+
+
+def gen_reg_block_worker(block_index):
+	"""
+	Generate register block in worker process. Return generated text and
+	entity template cache hits and misses during generation of the block.
+	"""
+	before = worker_gen.hdlGen.get_entity_template_cache_stats()
+
+	block = worker_gen.memMap.addressBlock[block_index]
+	worker_gen.write_reg_block(block)
+	text = worker_gen.hdlGen.get_output()
+	worker_gen.hdlGen.clear_output()
+
+	after = worker_gen.hdlGen.get_entity_template_cache_stats()
+	stats = {key : after[key] - before[key] for key in after}
+	return (text, stats)
+
 
 class VhdlRegMapGeneratorWrapper():
 
@@ -68,28 +97,118 @@ class VhdlRegMapGeneratorWrapper():
 	# false read data are available within the same clock cycle
 	registeredRead = True
 
+	# Number of register stages in read data path. Read data multiplexor of
+	# large register blocks is split to smaller multiplexors with registers
+	# between them. Each stage adds one clock cycle of read latency, valid
+	# read data are signalled by "r_data_valid" output of register block.
+	# Stages beyond the number of word address bits of a block only add
+	# latency, they can't split the multiplexor further.
+	readPipelineStages = 0
+
+	# When set to "True" address decoder is hierarchical: high address bits
+	# select a group of words, low address bits a word within the group.
+	hierAddrDecoder = False
+
+	# When set to "True" output of address decoder is registered. Memory bus
+	# signals are registered together with it, writes take effect one clock
+	# cycle later.
+	registeredAddrDecoder = False
+
 	# Output directory where to write VHDL register map implementation.
 	outDir = ""
 
+	# Number of processes generating register blocks. Blocks are generated
+	# one after another when set to 1.
+	jobs = 1
+
+	# Directory with cache of loaded IP-XACT components. When set, XML parsing
+	# is skipped if the specification did not change since last run.
+	cacheDir = None
+
+	# When set to "True" only files whose inputs changed since last run are
+	# regenerated. Fingerprints of inputs are kept in a manifest within
+	# output directory.
+	incremental = False
+
+	# When set to "True" generated files are streamed to temporary files
+	# while they are generated, instead of being kept in memory until they
+	# are complete.
+	streamOutput = False
+
+	# Path of JSON report with durations of generation phases (load,
+	# construct, write_* methods, commit). Phases are timed only when set.
+	timingReport = None
+
+	# Profiler run during generation when timing report is enabled:
+	# "cprofile" or "tracemalloc". Its results are part of the timing report.
+	profile = None
+
 
 	# Variable for loaded license Text
 	lic_text = ""
 
+	# Loaded manifest with fingerprints of generated files
+	manifest = None
+
+	# Fingerprint of content of VHDL templates, part of fingerprint of each
+	# generated file.
+	template_fingerprint = None
+
+
+	def calc_file_fingerprint(self, vhdlGen, input_fingerprint):
+		"""
+		Calculate fingerprint of generated file from fingerprint of its
+		IP-XACT inputs, content of VHDL templates and settings of the wrapper.
+		"""
+		return calc_output_fingerprint(input_fingerprint,
+					self.template_fingerprint, vhdlGen.memMap.name,
+					self.wordWidth, str_arg_to_bool(self.registeredRead),
+					int(self.readPipelineStages),
+					str_arg_to_bool(str(self.hierAddrDecoder)),
+					str_arg_to_bool(str(self.registeredAddrDecoder)),
+					self.lic_text)
+
+
+	def is_file_up_to_date(self, file_path, fingerprint):
+		"""
+		Check if file was already generated from the same inputs. Always
+		False when incremental generation is disabled.
+		"""
+		if (not str_arg_to_bool(str(self.incremental))):
+			return False
+
+		if (is_output_up_to_date(self.manifest, file_path, fingerprint)):
+			print("Up to date, skipping: " + file_path)
+			return True
+
+		return False
+
 
 	def write_reg_map_package(self, vhdlGen, dir_path):
 		"""
 		Create package with records for register blocks within an address block.
 		"""
 		reg_map_pkg_name = os.path.join(dir_path, vhdlGen.memMap.name.lower() + "_pkg.vhd")
+
+		fingerprint = self.calc_file_fingerprint(vhdlGen,
+							vhdlGen.calc_mem_map_fingerprint())
+		if (self.is_file_up_to_date(reg_map_pkg_name, fingerprint)):
+			return
 		
-		of = open(reg_map_pkg_name, 'w')
-		vhdlGen.set_of(of)
+		with open_output(reg_map_pkg_name, vhdlGen.streamOutput) as of:
+			vhdlGen.set_of(of)
 
-		write_license(self.lic_text, '-', of)
-		vhdlGen.write_reg_map_pkg()
-		vhdlGen.commit_to_file()
+			# Output file is detached also when generation fails, so that
+			# streamed output never goes to a discarded file.
+			try:
+				write_license(self.lic_text, '-', of)
+				vhdlGen.write_reg_map_pkg()
+				with timed_phase("commit"):
+					vhdlGen.commit_to_file()
+			finally:
+				vhdlGen.set_of(None)
 
-		of.close()
+		self.manifest[os.path.basename(reg_map_pkg_name)] = fingerprint
 
 
 	def write_reg_map_implementation(self, vhdlGen, dir_path):
@@ -97,26 +216,102 @@ class VhdlRegMapGeneratorWrapper():
 		Write register map implementation. Create separate entity file for
 		each register memory block.
 		"""
+		if (int(self.jobs) > 1):
+			self.write_reg_map_implementation_parallel(vhdlGen, dir_path)
+			return
+
 		for block in vhdlGen.memMap.addressBlock:
 			print("Processing memory block: " + block.name)
 			
 			if (block.usage == "register"):
 				file_path = os.path.join(dir_path, block.name.lower() + "_reg_map.vhd")
 
-				of = open(file_path, 'w')
-				vhdlGen.set_of(of)
+				fingerprint = self.calc_file_fingerprint(vhdlGen,
+									vhdlGen.calc_block_fingerprint(block))
+				if (not self.is_file_up_to_date(file_path, fingerprint)):
+					with open_output(file_path, vhdlGen.streamOutput) as of:
+						vhdlGen.set_of(of)
 
-				write_license(self.lic_text, '-', of)
-				vhdlGen.write_reg_block(block)
-				vhdlGen.commit_to_file()
+						try:
+							write_license(self.lic_text, '-', of)
+							vhdlGen.write_reg_block(block)
+							with timed_phase("commit"):
+								vhdlGen.commit_to_file()
+						finally:
+							vhdlGen.set_of(None)
 
-				of.close()
+					self.manifest[os.path.basename(file_path)] = fingerprint
 
 			else:
 				print("Skipping unsupported block type: " + block.usage)
 
 			print("\n")
 
+		self.print_entity_template_cache_stats(
+				vhdlGen.hdlGen.get_entity_template_cache_stats())
+
+
+	def print_entity_template_cache_stats(self, stats):
+		"""
+		Print hits and misses of entity template cache.
+		"""
+		print("Entity template cache: {} hits, {} misses".format(
+				stats["hits"], stats["misses"]))
+
+
+	def write_reg_map_implementation_parallel(self, vhdlGen, dir_path):
+		"""
+		Write register map implementation with register blocks generated
+		by a pool of "jobs" processes. Files are written in order of blocks
+		within the memory map.
+		"""
+		block_indices = []
+		fingerprints = []
+		for (i, block) in enumerate(vhdlGen.memMap.addressBlock):
+			if (block.usage != "register"):
+				print("Skipping unsupported block type: " + block.usage)
+				continue
+
+			file_path = os.path.join(dir_path, block.name.lower() + "_reg_map.vhd")
+			fingerprint = self.calc_file_fingerprint(vhdlGen,
+								vhdlGen.calc_block_fingerprint(block))
+			if (self.is_file_up_to_date(file_path, fingerprint)):
+				continue
+
+			print("Processing memory block: " + block.name)
+			block_indices.append(i)
+			fingerprints.append(fingerprint)
+
+		# Output file of the generator can't be passed to worker processes.
+		vhdlGen.set_of(None)
+
+		with ProcessPoolExecutor(max_workers=int(self.jobs),
+								 initializer=init_reg_block_worker,
+								 initargs=(vhdlGen,)) as pool:
+			with timed_phase("generate_blocks"):
+				results = list(pool.map(gen_reg_block_worker, block_indices))
+
+		# Each worker process has its own cache, sum statistics of all blocks
+		# with statistics of this process.
+		stats = vhdlGen.hdlGen.get_entity_template_cache_stats()
+		texts = []
+		for (text, blockStats) in results:
+			texts.append(text)
+			for key in stats:
+				stats[key] += blockStats[key]
+
+		for (i, text, fingerprint) in zip(block_indices, texts, fingerprints):
+			block = vhdlGen.memMap.addressBlock[i]
+			file_path = os.path.join(dir_path, block.name.lower() + "_reg_map.vhd")
+
+			with open_output(file_path, vhdlGen.streamOutput) as of:
+				write_license(self.lic_text, '-', of)
+				of.write(text)
+
+			self.manifest[os.path.basename(file_path)] = fingerprint
+
+		self.print_entity_template_cache_stats(stats)
+
 
 	def copy_reg_map_sources(self, vhdlGen, dir_path, destDir):
 		"""
@@ -127,47 +322,86 @@ class VhdlRegMapGeneratorWrapper():
 			dest_path = os.path.join(ROOT_PATH, destDir)
 			dest_path = os.path.join(dest_path, os.path.basename(templ_path))
 
-			copyfile(src_path, dest_path)
+			with open(src_path, 'rb') as f:
+				commit_output(dest_path, f.read())
 
 
-	def do_update(self):
+	def generate(self, component):
+		"""
+		Generate register map implementation from already loaded IP-XACT
+		component.
+		"""
+		# Create new VHDL register map generator
+		with timed_phase("construct"):
+			vhdlGen = VhdlRegMapGenerator(component, self.memMap, self.wordWidth)
 
-		with open(self.xactSpec) as f:
-			name = None
-			offset = 0
+		# Timed methods can't be passed to worker processes, blocks generated
+		# in parallel are timed as a whole.
+		if (int(self.jobs) <= 1):
+			time_generator_methods(vhdlGen)
 
-			# Load IP-Xact component
-			component = Component()
-			component.load(f)
+		# Load license text
+		self.lic_text = ""
+		if (self.licPath != ""):
+			self.lic_text = load_license(self.licPath)
 
-			# Create new VHDL register map generator
-			vhdlGen = VhdlRegMapGenerator(component, self.memMap, self.wordWidth)
+		# Check output directory
+		dir_path = os.path.join(ROOT_PATH, self.outDir)
+		if (not os.path.isdir(dir_path)):
+			print("ERROR: " + dir_path + " is not a directory")
+			sys.exit(1)
 
-			# Load license text
-			self.lic_text = ""
-			if (self.licPath != ""):
-				self.lic_text = load_license(self.licPath)
+		# Configure registered / non-registered read
+		if (str_arg_to_bool(self.registeredRead)):
+			vhdlGen.registered_read = True
+		else:
+			vhdlGen.registered_read = False
 
-			# Check output directory
-			dir_path = os.path.join(ROOT_PATH, self.outDir)
-			if (not os.path.isdir(dir_path)):
-				print("ERROR: " + dir_path + " is not a directory")
-				sys.exit(1)
+		# Configure read data pipeline
+		vhdlGen.read_pipeline_stages = int(self.readPipelineStages)
 
-			# Configure registered / non-registered read
-			if (str_arg_to_bool(self.registeredRead)):
-				vhdlGen.registered_read = True
-			else:
-				vhdlGen.registered_read = False
+		# Configure streaming of generated files
+		vhdlGen.streamOutput = str_arg_to_bool(str(self.streamOutput))
+
+		# Configure address decoder
+		vhdlGen.addr_dec_hierarchical = str_arg_to_bool(str(self.hierAddrDecoder))
+		vhdlGen.addr_dec_registered = str_arg_to_bool(str(self.registeredAddrDecoder))
+
+		# Load fingerprints of previously generated files
+		manifest_path = os.path.join(dir_path, vhdlGen.memMap.name.lower() +
+										"_reg_map.manifest.json")
+		self.manifest = {}
+		if (str_arg_to_bool(str(self.incremental))):
+			self.manifest = load_manifest(manifest_path)
+		self.template_fingerprint = vhdlGen.calc_template_fingerprint()
+
+		# Create common package for whole address map
+		self.write_reg_map_package(vhdlGen, dir_path)
+
+		# Create implementation of each register block within address map
+		self.write_reg_map_implementation(vhdlGen, dir_path)
+
+		if (str_arg_to_bool(str(self.incremental))):
+			store_manifest(manifest_path, self.manifest)
+
+		# Copy source templates to destination directory
+		self.copy_reg_map_sources(vhdlGen, dir_path, self.outDir)
+
+
+	def do_update(self):
+
+		start_phase_timing(self.timingReport != None, self.profile)
+
+		# Load IP-Xact component
+		with timed_phase("load"):
+			component = load_component(self.xactSpec, self.cacheDir)
 
-			# Create common package for whole address map
-			self.write_reg_map_package(vhdlGen, dir_path)
+		with timed_phase("generate"):
+			self.generate(component)
 
-			# Create implementation of each register block within address map
-			self.write_reg_map_implementation(vhdlGen, dir_path)
+		print_output_summary()
 
-			# Copy source templates to destination directory
-			self.copy_reg_map_sources(vhdlGen, dir_path, self.outDir)
+		stop_phase_timing(self.timingReport)
 
 
 	if __name__ == '__main__':
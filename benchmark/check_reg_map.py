@@ -0,0 +1,408 @@
+################################################################################
+##
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Regression checks of generated register map RTL. Register blocks are
+##   generated from synthetic IP-XACT components of various sizes and
+##   options, and structure of the generated RTL is checked against models
+##   of the generated logic.
+##
+##   Run from directory containing "pyXact_generator":
+##      python -m pyXact_generator.benchmark.check_reg_map
+##
+##	Revision history:
+##      18.10.2026  First implementation
+##
+################################################################################
+
+import argparse
+import sys
+import io
+import re
+import copy
+
+from pyXact_generator.benchmark.synth_component import create_component
+
+from pyXact_generator.ip_xact.addr_generator import ACCESS_READ, ACCESS_WRITE
+from pyXact_generator.ip_xact.vhdl_reg_map_generator import VhdlRegMapGenerator
+
+
+MEM_MAP_NAME = "CHECK_MAP"
+
+# Sizes of synthetic components: [blocks, registers within each block].
+# Blocks have at least two words, register blocks with single word are not
+# supported by the generator (their address is empty).
+SIZES = [[1, 2], [1, 3], [1, 17], [2, 40], [1, 200]]
+
+
+# Errors found by checks
+errors = []
+
+def expect(condition, message):
+	"""
+	Record error with given message when condition does not hold.
+	"""
+	if (not condition):
+		errors.append(message)
+
+
+def create_reg_map_gen(component, wordWidth=32, **options):
+	"""
+	Create VHDL register map generator of synthetic component with given
+	attributes set (e.g. read_pipeline_stages=2).
+	"""
+	vhdlGen = VhdlRegMapGenerator(component, MEM_MAP_NAME, wordWidth)
+	for (name, value) in options.items():
+		setattr(vhdlGen, name, value)
+	return vhdlGen
+
+
+def gen_reg_block(vhdlGen, block):
+	"""
+	Generate register block and return its text.
+	"""
+	of = io.StringIO()
+	vhdlGen.set_of(of)
+	vhdlGen.write_reg_block(block)
+	vhdlGen.commit_to_file()
+	vhdlGen.set_of(None)
+	return of.getvalue()
+
+
+def get_instance_generics(text, instName):
+	"""
+	Get generic map of component instance within generated RTL as dictionary
+	of generic name and its value. Returns None if there is no such instance.
+	"""
+	start = text.find(instName + " :")
+	if (start < 0):
+		return None
+	end = text.find("port map", start)
+
+	return dict(re.findall(r"(\w+)\s+=>\s+([^\s,]+)", text[start:end]))
+
+
+def check_read_pipeline():
+	"""
+	Check split of read data multiplexor to pipeline levels. Each readable
+	word must be selected by exactly one path through the levels, address
+	bits must be split evenly among the levels, and each level must decode
+	some address bits as long as there are enough of them.
+	"""
+	for [blocks, regs] in SIZES:
+		component = create_component(blocks=blocks, regs=regs,
+									 memMapName=MEM_MAP_NAME)
+
+		for stages in range(1, 6):
+			vhdlGen = create_reg_map_gen(component,
+										 read_pipeline_stages=stages)
+
+			for block in vhdlGen.memMap.addressBlock:
+				name = "{} regs, {} stages, {}".format(regs, stages, block.name)
+				levels = vhdlGen.calc_read_pipeline_levels(block)
+				[high_addr_bit, low_addr_bit] = vhdlGen.calc_addr_indices(block)
+				addr_width = high_addr_bit - low_addr_bit + 1
+
+				expect(len(levels) == stages + 1,
+					   "{}: {} levels".format(name, len(levels)))
+
+				# Address bits are split evenly, first levels decode the
+				# lowest bits.
+				widths = []
+				next_bit = low_addr_bit
+				for level in levels:
+					width = 0
+					if (level["addr_bits"] != None):
+						[high, low] = level["addr_bits"]
+						expect(low == next_bit, "{}: level decodes bits {}..{}, "
+							   "expected from {}".format(name, high, low, next_bit))
+						width = high - low + 1
+					widths.append(width)
+					next_bit += width
+
+				expect(sum(widths) == addr_width, "{}: levels decode {} "
+					   "bits out of {}".format(name, sum(widths), addr_width))
+				expect(max(widths) - min(widths) <= 1 and
+					   widths == sorted(widths, reverse=True),
+					   "{}: uneven split of address bits {}".format(name, widths))
+				if (addr_width >= len(levels)):
+					expect(min(widths) > 0, "{}: level without address bits "
+						   "{}".format(name, widths))
+
+				# Follow each readable word through the levels
+				[low_addr, high_addr] = vhdlGen.calc_blk_wrd_span(block, ACCESS_READ)
+				addr_shift = vhdlGen.calc_addr_width_from_size(vhdlGen.wrdWidthByte)
+				for addr in range(low_addr, high_addr + 1, vhdlGen.wrdWidthByte):
+					index = addr >> addr_shift
+					for (level, width) in zip(levels, widths):
+						group = level["groups"].get(index >> width, [])
+						expect(index in group, "{}: word {:#x} not selected by "
+							   "its level output".format(name, addr))
+						index >>= width
+
+				for (i, level) in enumerate(levels):
+					mask = (1 << widths[i]) - 1
+					for group in level["groups"].values():
+						sels = [index & mask for index in group]
+						expect(len(sels) == len(set(sels)), "{}: level {} selects "
+							   "multiple inputs by single value".format(name, i))
+
+				expect(len(levels[-1]["groups"]) == 1,
+					   "{}: last level has multiple outputs".format(name))
+
+				# Generated RTL has a register stage between each two levels
+				text = gen_reg_block(vhdlGen, block)
+				for stage in range(1, stages + 2):
+					count = text.count("read_pipe_{}_proc : process".format(stage))
+					expected = 1
+					if (stage > stages):
+						expected = 0
+					expect(count == expected, "{}: {} processes of pipeline "
+						   "stage {}".format(name, count, stage))
+				expect("r_data_valid <= read_q{};".format(stages) in text,
+					   "{}: read data valid not driven by last stage".format(name))
+
+
+def check_addr_decoder():
+	"""
+	Check instance of address decoder. Hierarchical decoder must be used
+	whenever it was requested and there are at least 2 address bits, with
+	groups of low address bits within the address width. Decoding of each
+	address by groups (see "address_decoder_hier.vhd") must select the same
+	words as flat decoding.
+	"""
+	for [blocks, regs] in SIZES:
+		component = create_component(blocks=blocks, regs=regs,
+									 memMapName=MEM_MAP_NAME)
+
+		for hierarchical in [False, True]:
+			for registered in [False, True]:
+				vhdlGen = create_reg_map_gen(component,
+								addr_dec_hierarchical=hierarchical,
+								addr_dec_registered=registered)
+
+				for block in vhdlGen.memMap.addressBlock:
+					name = "{} regs, hierarchical {}, registered {}, {}".format(
+								regs, hierarchical, registered, block.name)
+					addr_width = vhdlGen.calc_wrd_address_width(block)
+					entries = vhdlGen.calc_blk_wrd_count(block)
+
+					entity = "address_decoder"
+					if (hierarchical and addr_width >= 2):
+						entity = "address_decoder_hier"
+
+					text = gen_reg_block(vhdlGen, block)
+					generics = get_instance_generics(text,
+									entity + "_" + block.name.lower() + "_comp")
+					expect(generics != None,
+						   "{}: no instance of {}".format(name, entity))
+					if (generics == None):
+						continue
+
+					expect(generics.get("address_width") == str(addr_width) and
+						   generics.get("address_entries") == str(entries),
+						   "{}: invalid decoder size {}".format(name, generics))
+					expect(generics.get("registered_out") == str(registered).lower(),
+						   "{}: invalid registered_out {}".format(name, generics))
+
+					# Words of the address vector, first word on the lowest bits
+					addr_vect = vhdlGen.calc_addr_vect_value(block)
+					expect(len(addr_vect) == addr_width * entries,
+						   "{}: address vector of {} bits".format(name, len(addr_vect)))
+					words = [int(addr_vect[i:i + addr_width], 2) for i in
+							 range(len(addr_vect) - addr_width, -1, -addr_width)]
+					expect(len(words) == len(set(words)),
+						   "{}: duplicate addresses in address vector".format(name))
+
+					if (entity != "address_decoder_hier"):
+						expect(not "low_width" in generics,
+							   "{}: low_width of flat decoder".format(name))
+						continue
+
+					low_width = int(generics.get("low_width", 0))
+					expect(1 <= low_width <= addr_width - 1,
+						   "{}: invalid low_width {}".format(name, low_width))
+
+					low_mask = (1 << low_width) - 1
+					for addr in range(2 ** addr_width):
+						flat = [i for (i, word) in enumerate(words) if word == addr]
+						hier = [i for (i, word) in enumerate(words)
+								if (word >> low_width == addr >> low_width and
+									word & low_mask == addr & low_mask)]
+						expect(flat == hier, "{}: address {} decoded as {}, "
+							   "expected {}".format(name, addr, hier, flat))
+
+
+def create_flat_component(component):
+	"""
+	Create copy of synthetic component with each register array written
+	out as separate registers named <array_name>_<index>, placed register
+	size apart.
+	"""
+	flat = copy.deepcopy(component)
+	for memMap in flat.memoryMaps.memoryMap:
+		for block in memMap.addressBlock:
+			registers = []
+			for reg in block.register:
+				dim = max(reg.dim + [1])
+				if (reg.dim == []):
+					registers.append(reg)
+					continue
+
+				for i in range(dim):
+					element = copy.copy(reg)
+					element.name = "{}_{}".format(reg.name, i)
+					element.addressOffset = reg.addressOffset + i * reg.size // 8
+					element.dim = []
+					registers.append(element)
+			block.register = registers
+	return flat
+
+
+def check_reg_arrays():
+	"""
+	Check register arrays ("dim"). Arrays must be expanded to the same
+	registers as if their elements were written out one by one, without
+	modifying loaded component. Elements inherit lock of their array.
+	Arrays of whole aligned words are generated by single "for generate"
+	loop, other arrays element by element.
+	"""
+	for [blocks, regs] in SIZES[1:]:
+		component = create_component(blocks=blocks, regs=regs, arrays=3,
+									 locks=regs // 4 + 1,
+									 memMapName=MEM_MAP_NAME)
+		flat = create_flat_component(component)
+		locked = set([regLock.reg_name for regLock in
+					  component.vendorExtensions.regLocks.regLock])
+		srcBlocks = component.memoryMaps.memoryMap[0].addressBlock
+		loaded = [[[reg.name, reg.addressOffset, list(reg.dim)]
+				   for reg in block.register] for block in srcBlocks]
+
+		for wordWidth in [32, 64]:
+			vhdlGen = create_reg_map_gen(component, wordWidth)
+			flatGen = create_reg_map_gen(flat, wordWidth)
+
+			expect(loaded == [[[reg.name, reg.addressOffset, list(reg.dim)]
+								for reg in block.register] for block in srcBlocks],
+				   "{} regs: loaded component was modified".format(regs))
+
+			for (block, flatBlock) in zip(vhdlGen.memMap.addressBlock,
+										  flatGen.memMap.addressBlock):
+				name = "{} regs, {} bit words, {}".format(regs, wordWidth,
+														  block.name)
+
+				expected = [[reg.name, reg.addressOffset, reg.size, reg.access]
+							for reg in flatBlock.register]
+				expanded = [[reg.name, reg.addressOffset, reg.size, reg.access]
+							for reg in block.register]
+				expect(expanded == expected, "{}: arrays expanded to {}, "
+					   "expected {}".format(name, expanded, expected))
+
+				expect(vhdlGen.calc_addr_vect_value(block) ==
+					   flatGen.calc_addr_vect_value(flatBlock),
+					   "{}: address vector differs from flat registers".format(name))
+
+				# Arrays of whole words with register instances (writable or
+				# with access signalling) are generated by loops
+				loops = []
+				for reg in block.register:
+					base = vhdlGen.get_reg_array_base(reg)
+					if (base == None):
+						continue
+
+					lock = vhdlGen.get_reg_lock(reg)[0]
+					expect(lock == str(base.name in locked).lower(),
+						   "{}: {} has lock {}".format(name, reg.name, lock))
+
+					compact = (base.size == wordWidth and
+							   base.addressOffset % (wordWidth // 8) == 0)
+					step = vhdlGen.calc_reg_array_step(block, reg)
+					expect((step != None) == compact, "{}: {} generated by loop: "
+						   "{}".format(name, reg.name, step != None))
+					if (compact and reg.dimIndex == 0 and
+						(vhdlGen.reg_has_access_type(reg, ACCESS_WRITE) or
+						 vhdlGen.is_reg_write_indicate(reg) or
+						 vhdlGen.is_reg_read_indicate(reg))):
+						loops.append("{}_gen : for i in 0 to {} generate".format(
+										base.name.lower(), len(reg.dimElements) - 1))
+
+				text = gen_reg_block(vhdlGen, block)
+				for loop in loops:
+					expect(text.count(loop) == 1,
+						   "{}: missing loop \"{}\"".format(name, loop))
+				count = len(re.findall(r"_gen : for i in", text))
+				expect(count == len(loops), "{}: {} loops, expected {}".format(
+						name, count, len(loops)))
+
+
+# Checks. Each check generates register blocks and records found errors.
+CHECKS = {
+	"read_pipeline"		: check_read_pipeline,
+	"addr_decoder"		: check_addr_decoder,
+	"reg_arrays"		: check_reg_arrays,
+}
+
+
+def parse_args():
+	parser = argparse.ArgumentParser(
+				description="Regression checks of generated register map RTL.")
+	parser.add_argument('--checks', dest='checks', default=",".join(CHECKS),
+				help="Comma separated checks: " + ", ".join(CHECKS))
+	return parser.parse_args()
+
+
+if __name__ == '__main__':
+	args = parse_args()
+
+	checks = args.checks.split(",")
+	for name in checks:
+		if (name not in CHECKS):
+			print("ERROR: Unknown check: " + name)
+			sys.exit(1)
+
+	failed = False
+	for name in checks:
+		# Generators print progress, keep check output clean.
+		stdout = sys.stdout
+		sys.stdout = io.StringIO()
+		try:
+			CHECKS[name]()
+		finally:
+			sys.stdout = stdout
+
+		if (len(errors) == 0):
+			print(name + ": OK")
+			continue
+
+		print(name + ": FAILED")
+		for error in errors:
+			print("ERROR: " + error)
+		errors.clear()
+		failed = True
+
+	if (failed):
+		sys.exit(1)
@@ -0,0 +1,243 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##   
+##   Benchmark of register map generators. Runs each generator separately on
+##   synthetic IP-XACT components of given sizes and stores timing results
+##   as JSON.
+##
+##   Run from directory containing "pyXact_generator":
+##      python -m pyXact_generator.benchmark.run_benchmarks \
+##          --sizes 100,1000,10000 --output results.json
+##
+##	Revision history:
+##      18.10.2026  First implementation
+##
+################################################################################
+
+import argparse
+import sys
+import time
+import os
+import io
+import json
+import platform
+import datetime
+
+from pyXact_generator.gen_lib import TOOL_VERSION
+from pyXact_generator.benchmark.synth_component import create_component
+
+from pyXact_generator.ip_xact.vhdl_reg_map_generator import VhdlRegMapGenerator
+from pyXact_generator.ip_xact.vhdl_tb_addr_generator import VhdlTbAddrGenerator
+from pyXact_generator.ip_xact.h_addr_generator import HeaderAddrGenerator
+from pyXact_generator.ip_xact.kern_h_addr_generator import KernHeaderAddrGenerator
+from pyXact_generator.ip_xact.lyx_addr_generator import LyxAddrGenerator
+
+
+MEM_MAP_NAME = "BENCH_MAP"
+
+WORD_WIDTH = 32
+
+
+def bench_reg_block(component):
+	"""
+	Generate VHDL register map entity of each address block.
+	"""
+	vhdlGen = VhdlRegMapGenerator(component, MEM_MAP_NAME, WORD_WIDTH)
+	vhdlGen.set_of(io.StringIO())
+	for block in vhdlGen.memMap.addressBlock:
+		vhdlGen.write_reg_block(block)
+		vhdlGen.commit_to_file()
+
+
+def bench_reg_map_pkg(component):
+	"""
+	Generate VHDL package with register map records.
+	"""
+	vhdlGen = VhdlRegMapGenerator(component, MEM_MAP_NAME, WORD_WIDTH)
+	vhdlGen.set_of(io.StringIO())
+	vhdlGen.write_reg_map_pkg()
+	vhdlGen.commit_to_file()
+
+
+def bench_header(component):
+	"""
+	Generate C header with unions of registers.
+	"""
+	headerGen = HeaderAddrGenerator(component, MEM_MAP_NAME, WORD_WIDTH)
+	headerGen.set_of(io.StringIO())
+	headerGen.prefix = "bench"
+	headerGen.create_addrMap_package("bench")
+	headerGen.commit_to_file()
+
+
+def bench_kern_header(component):
+	"""
+	Generate Linux kernel style C header.
+	"""
+	headerGen = KernHeaderAddrGenerator(component, MEM_MAP_NAME, WORD_WIDTH)
+	headerGen.set_of(io.StringIO())
+	headerGen.prefix = "bench"
+	headerGen.create_addrMap_package("bench")
+	headerGen.commit_to_file()
+
+
+def bench_lyx(component):
+	"""
+	Generate LyX documentation of register map.
+	"""
+	lyxGen = LyxAddrGenerator(component, MEM_MAP_NAME, WORD_WIDTH,
+								genRegions=True, genFiDesc=True)
+	lyxGen.set_of(io.StringIO())
+	lyxGen.config = {"skip_conditional" : False, "parameters" : {}}
+	lyxGen.write_mem_map_both()
+	lyxGen.lyxGen.commit_append_lines_all()
+	lyxGen.commit_to_file()
+
+
+def bench_vhdl_tb(component):
+	"""
+	Generate VHDL testbench package with register addresses.
+	"""
+	vhdlGen = VhdlTbAddrGenerator(component, MEM_MAP_NAME, WORD_WIDTH)
+	vhdlGen.set_of(io.StringIO())
+	vhdlGen.create_addrMap_package("bench_pkg")
+	vhdlGen.commit_to_file()
+
+
+# Benchmarked stages. Each stage is a function generating output of single
+# generator from given component.
+STAGES = {
+	"vhdl_reg_map.write_reg_block"		: bench_reg_block,
+	"vhdl_reg_map.write_reg_map_pkg"	: bench_reg_map_pkg,
+	"header"							: bench_header,
+	"kern_header"						: bench_kern_header,
+	"lyx.write_mem_map_both"			: bench_lyx,
+	"vhdl_tb"							: bench_vhdl_tb,
+}
+
+
+def time_stage(stage, component, repeat):
+	"""
+	Run benchmark stage "repeat" times. Returns dictionary with duration
+	of each run (in seconds) and its minimum, mean and maximum.
+	"""
+	runs = []
+	for i in range(repeat):
+		start = time.perf_counter()
+		stage(component)
+		runs.append(time.perf_counter() - start)
+
+	return {"min" : min(runs), "mean" : sum(runs) / len(runs),
+			"max" : max(runs), "runs" : runs}
+
+
+def run_benchmarks(sizes, blocks, fields, enums, locks, params, repeat,
+				   stages, log=sys.stderr):
+	"""
+	Run benchmark stages on synthetic components with given total counts
+	of registers. Returns results as dictionary ready to be stored as JSON.
+	"""
+	results = []
+
+	for size in sizes:
+		regs = max(1, size // blocks)
+		config = {"blocks" : blocks, "registers_per_block" : regs,
+				  "registers" : regs * blocks, "fields" : fields,
+				  "enums" : enums, "locks" : locks, "params" : params}
+		component = create_component(blocks=blocks, regs=regs, fields=fields,
+									 enums=enums, locks=locks, params=params,
+									 memMapName=MEM_MAP_NAME)
+
+		timings = {}
+		for name in stages:
+			log.write("{} registers: {}\n".format(regs * blocks, name))
+
+			# Generators print progress, keep benchmark output clean.
+			stdout = sys.stdout
+			sys.stdout = io.StringIO()
+			try:
+				timings[name] = time_stage(STAGES[name], component, repeat)
+			finally:
+				sys.stdout = stdout
+
+			log.write("    min {:.6f} s, mean {:.6f} s\n".format(
+						timings[name]["min"], timings[name]["mean"]))
+
+		results.append({"config" : config, "stages" : timings})
+
+	return {"tool_version" : TOOL_VERSION,
+			"python" : platform.python_version(),
+			"platform" : platform.platform(),
+			"timestamp" : datetime.datetime.now().isoformat(),
+			"repeat" : repeat,
+			"results" : results}
+
+
+def parse_args():
+	parser = argparse.ArgumentParser(
+				description="Benchmark of register map generators.")
+	parser.add_argument('--sizes', dest='sizes', default="100,1000,10000",
+				help="Comma separated total counts of registers")
+	parser.add_argument('--blocks', dest='blocks', type=int, default=4,
+				help="Number of address blocks")
+	parser.add_argument('--fields', dest='fields', type=int, default=4,
+				help="Number of fields within each register")
+	parser.add_argument('--enums', dest='enums', type=int, default=2,
+				help="Number of enumerated values of first field of register")
+	parser.add_argument('--locks', dest='locks', type=int, default=0,
+				help="Number of lockable registers")
+	parser.add_argument('--params', dest='params', type=int, default=0,
+				help="Number of parameters for conditional registers")
+	parser.add_argument('--repeat', dest='repeat', type=int, default=3,
+				help="Number of runs of each stage")
+	parser.add_argument('--stages', dest='stages', default=",".join(STAGES),
+				help="Comma separated benchmark stages: " + ", ".join(STAGES))
+	parser.add_argument('--output', dest='output', default=None,
+				help="Output JSON file (standard output when not given)")
+	return parser.parse_args()
+
+
+if __name__ == '__main__':
+	args = parse_args()
+
+	stages = args.stages.split(",")
+	for name in stages:
+		if (name not in STAGES):
+			print("ERROR: Unknown benchmark stage: " + name)
+			sys.exit(1)
+
+	results = run_benchmarks([int(size) for size in args.sizes.split(",")],
+							 args.blocks, args.fields, args.enums, args.locks,
+							 args.params, args.repeat, stages)
+
+	text = json.dumps(results, indent=4)
+	if (args.output == None):
+		print(text)
+	else:
+		with open(args.output, 'w') as f:
+			f.write(text + "\n")
@@ -0,0 +1,203 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##   
+##   Generator of synthetic IP-XACT components for benchmarking. Creates
+##   objects with the same attributes as components loaded by ipyxact, so
+##   that generators can be run on register maps of any size without XML.
+##
+##	Revision history:
+##      18.10.2026  First implementation
+##      18.10.2026  Register arrays ("dim").
+##
+################################################################################
+
+import random
+
+
+class SynthObject():
+	"""
+	Generic object with attributes given as keyword arguments. Stands for
+	any IP-XACT element (component, address block, register, field ...).
+	"""
+	def __init__(self, **kwargs):
+		self.__dict__.update(kwargs)
+
+
+# Register sizes (in bits) cycled through within address blocks, so that
+# several registers share a memory word.
+REG_SIZES = [32, 16, 16, 8, 8, 16, 32]
+
+# Register access types cycled through within address blocks.
+REG_ACCESSES = ["read-write", "read-only", "write-only", "read-write",
+				"read-writeOnce"]
+
+
+def create_fields(rnd, reg_name, size, fields, enums):
+	"""
+	Create bit fields of a register. Register is split to "fields" fields of
+	approximately the same width. First field carries "enums" enumerated
+	values (limited by width of the field).
+	"""
+	fields = max(1, min(fields, size))
+	width = size // fields
+	field_list = []
+
+	for i in range(fields):
+		bit_width = width
+		if (i == fields - 1):
+			bit_width = size - i * width
+
+		enum_count = 0
+		if (i == 0):
+			enum_count = min(enums, 2 ** bit_width)
+
+		enum_values = []
+		if (enum_count > 0):
+			enum_values = [SynthObject(enumeratedValue=[
+				SynthObject(name="{}_F{}_E{}".format(reg_name, i, j), value=j,
+							description="Enumerated value {}".format(j))
+				for j in range(enum_count)])]
+
+		field_list.append(SynthObject(
+				name="F{}".format(i),
+				bitOffset=i * width,
+				bitWidth=bit_width,
+				resets=SynthObject(reset=SynthObject(
+						value=rnd.randrange(2 ** bit_width))),
+				enumeratedValues=enum_values,
+				modifiedWriteValue=rnd.choice(["", "", "clear"]),
+				readAction=rnd.choice(["", "", "", "modify"]),
+				description="Field {} of register {}".format(i, reg_name)))
+
+	return field_list
+
+
+def create_component(blocks=1, regs=32, fields=4, enums=2, locks=0,
+					 params=0, arrays=0, arrayDim=4, memMapName="BENCH_MAP",
+					 seed=0):
+	"""
+	Create synthetic IP-XACT component with single memory map.
+	Arguments:
+		blocks		Number of register address blocks.
+		regs		Number of registers within each address block.
+		fields		Number of bit fields within each register.
+		enums		Number of enumerated values of first field of each
+					register.
+		locks		Number of lockable registers (regLock vendor extension).
+		params		Number of parameters used as "isPresent" conditions
+					of registers.
+		arrays		Number of register arrays ("dim") within each address
+					block. Counted among "regs" registers.
+		arrayDim	Number of elements of each register array.
+		memMapName	Name of the memory map.
+		seed		Seed of random reset values and field attributes.
+	"""
+	rnd = random.Random(seed)
+	total = blocks * regs
+
+	parameters = [SynthObject(parameterId="ID_PARAM_{}".format(i),
+							  name="PARAM_{}".format(i))
+				  for i in range(params)]
+	reg_locks = []
+	addr_blocks = []
+	base = 0
+
+	for b in range(blocks):
+		registers = []
+		offset = 0
+		block_arrays = 0
+
+		for r in range(regs):
+			index = b * regs + r
+			size = REG_SIZES[index % len(REG_SIZES)]
+			size_bytes = size // 8
+
+			# Align register to its size and keep it within single word
+			if (offset % size_bytes != 0):
+				offset += size_bytes - offset % size_bytes
+			if (offset % 4 + size_bytes > 4):
+				offset += 4 - offset % 4
+
+			name = "B{}_REG{}".format(b, r)
+
+			# Spread locks and conditional registers evenly over the map
+			if (locks > 0 and index % max(1, total // locks) == 0 and
+				len(reg_locks) < locks):
+				reg_locks.append(SynthObject(reg_name=name,
+										description="Locked by test mode",
+										lock_signal="test_mode"))
+			is_present = ""
+			if (params > 0 and index % max(1, total // params) == 0):
+				is_present = parameters[(index // max(1, total // params)) %
+										params].parameterId
+
+			# Spread register arrays evenly over the block. Elements follow
+			# each other, register size apart.
+			dim = []
+			if (arrays > 0 and r % max(1, regs // arrays) == 0 and
+				block_arrays < arrays):
+				dim = [arrayDim]
+				block_arrays += 1
+
+			registers.append(SynthObject(
+					name=name,
+					addressOffset=offset,
+					size=size,
+					access=REG_ACCESSES[index % len(REG_ACCESSES)],
+					isPresent=is_present,
+					dim=dim,
+					description="Register {}".format(name),
+					field=create_fields(rnd, name, size, fields, enums)))
+			offset += size_bytes * max(dim + [1])
+
+		# Range is power of 2 covering all registers of the block. Base
+		# address is aligned to the range.
+		blk_range = 4
+		while (blk_range < offset):
+			blk_range *= 2
+		if (base % blk_range != 0):
+			base += blk_range - base % blk_range
+
+		addr_blocks.append(SynthObject(name="BLOCK_{}".format(b),
+									   baseAddress=base,
+									   range=blk_range,
+									   width=32,
+									   usage="register",
+									   displayName="Block {}".format(b),
+									   description="Synthetic block {}".format(b),
+									   register=registers))
+		base += blk_range
+
+	mem_map = SynthObject(name=memMapName, displayName=memMapName,
+						  description="Synthetic memory map",
+						  addressBlock=addr_blocks)
+
+	return SynthObject(memoryMaps=SynthObject(memoryMap=[mem_map]),
+					   parameters=SynthObject(parameter=parameters),
+					   vendorExtensions=SynthObject(
+							regLocks=SynthObject(regLock=reg_locks)))
@@ -41,6 +41,17 @@ import importlib.util
 import os
 import inspect
 import math
+import hashlib
+import pickle
+import io
+import json
+import contextlib
+import functools
+import datetime
+import platform
+import cProfile
+import pstats
+import tracemalloc
 
 ################################################################################
 # File path to the local repo of the PyXact framework
@@ -48,13 +59,425 @@ import math
 ROOT_PATH = os.path.dirname(os.path.abspath(__file__))
 PYXACT_PATH = "./pyXact_generator/ipyxact_parser"
 
+################################################################################
+# Version of the generator. Part of the key of loaded component cache, so that
+# components cached by different version of the tool are never used.
+################################################################################
+TOOL_VERSION = "1.1.0"
+
 sys.path.insert(0, PYXACT_PATH)
 from ipyxact.ipyxact import Component
 from license_updater import *
 
 
-def open_output(output):
-	return open(output, 'w')
+################################################################################
+# State of timing of generation phases (see "start_phase_timing"). Phases
+# are keyed by path of nested phase names (e.g. "generate/write_reg_block").
+################################################################################
+phase_timing = {"enabled" : False, "profile" : None, "profiler" : None,
+				"stack" : [], "phases" : {}, "start" : None}
+
+def start_phase_timing(enabled, profile=None):
+	"""
+	Start timing of generation phases. Timings of previous run are cleared.
+	Arguments:
+		enabled		When False, phases are not timed and profiler is not run.
+		profile		Optional profiler to run during whole generation:
+					"cprofile" or "tracemalloc".
+	"""
+	phase_timing["enabled"] = enabled
+	phase_timing["profile"] = None
+	phase_timing["profiler"] = None
+	phase_timing["stack"] = []
+	phase_timing["phases"] = {}
+	phase_timing["start"] = time.perf_counter()
+
+	if (not enabled or profile == None):
+		return
+
+	if (profile == "cprofile"):
+		phase_timing["profiler"] = cProfile.Profile()
+		phase_timing["profiler"].enable()
+	elif (profile == "tracemalloc"):
+		tracemalloc.start()
+	else:
+		print("WARNING: Unknown profiler: {}, profiling disabled".format(profile))
+		return
+
+	phase_timing["profile"] = profile
+
+@contextlib.contextmanager
+def timed_phase(name):
+	"""
+	Context manager measuring duration of generation phase. Phases can be
+	nested, duration of a phase includes durations of its nested phases.
+	Repeated phases are accumulated.
+	"""
+	if (not phase_timing["enabled"]):
+		yield
+		return
+
+	phase_timing["stack"].append(name)
+	key = "/".join(phase_timing["stack"])
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		duration = time.perf_counter() - start
+		phase_timing["stack"].pop()
+		if (key not in phase_timing["phases"]):
+			phase_timing["phases"][key] = {"time" : 0.0, "calls" : 0}
+		phase_timing["phases"][key]["time"] += duration
+		phase_timing["phases"][key]["calls"] += 1
+
+def time_generator_methods(generator):
+	"""
+	Time each "write_*" method of generator object as a separate phase.
+	Methods are replaced on the object only, not on its class.
+	"""
+	if (not phase_timing["enabled"]):
+		return
+
+	for name in dir(generator):
+		method = getattr(generator, name)
+		if (not name.startswith("write_") or not callable(method)):
+			continue
+
+		def timed_method(*args, _name=name, _method=method, **kwargs):
+			with timed_phase(_name):
+				return _method(*args, **kwargs)
+
+		setattr(generator, name, functools.wraps(method)(timed_method))
+
+def get_profile_report(limit=30):
+	"""
+	Stop profiler and return its "limit" most significant entries.
+	"""
+	if (phase_timing["profile"] == "cprofile"):
+		phase_timing["profiler"].disable()
+		stats = pstats.Stats(phase_timing["profiler"])
+		entries = []
+		for (func, stat) in stats.stats.items():
+			(cc, nc, tt, ct, callers) = stat
+			entries.append({"function" : "{}:{}({})".format(*func),
+							"calls" : nc, "tottime" : tt, "cumtime" : ct})
+		entries.sort(key=lambda e: e["cumtime"], reverse=True)
+		return {"type" : "cprofile", "functions" : entries[:limit]}
+
+	if (phase_timing["profile"] == "tracemalloc"):
+		snapshot = tracemalloc.take_snapshot()
+		(current, peak) = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+		entries = []
+		for stat in snapshot.statistics("lineno")[:limit]:
+			frame = stat.traceback[0]
+			entries.append({"location" : "{}:{}".format(frame.filename,
+											frame.lineno),
+							"size" : stat.size, "count" : stat.count})
+		return {"type" : "tracemalloc", "current" : current, "peak" : peak,
+				"allocations" : entries}
+
+	return None
+
+def stop_phase_timing(report_path):
+	"""
+	Stop timing of generation phases and store the report as JSON to
+	"report_path". Nothing is done when timing was not enabled.
+	"""
+	if (not phase_timing["enabled"]):
+		return
+
+	report = {"tool_version" : TOOL_VERSION,
+			  "python" : platform.python_version(),
+			  "timestamp" : datetime.datetime.now().isoformat(),
+			  "argv" : sys.argv,
+			  "total" : time.perf_counter() - phase_timing["start"],
+			  "phases" : phase_timing["phases"],
+			  "profile" : get_profile_report()}
+	phase_timing["enabled"] = False
+
+	with open(report_path, 'w') as f:
+		json.dump(report, f, indent=4)
+		f.write("\n")
+	print("Timing report written to: " + report_path)
+
+
+################################################################################
+# Outputs committed since last summary. Split to outputs whose content changed
+# (and were written) and outputs which were left untouched.
+################################################################################
+output_summary = {"changed" : [], "unchanged" : []}
+
+def commit_output(path, content):
+	"""
+	Write content to output file only if it differs from content of the file
+	on disk. Changed file is replaced atomically via temporary file in the
+	same directory. Unchanged file keeps its modification time, so that
+	HDL / SW builds depending on it are not restarted.
+	Returns True if the file was written, False otherwise.
+	"""
+	with timed_phase("write_output"):
+		return write_output(path, content)
+
+def write_output(path, content):
+	"""
+	Write content to output file if it changed (see "commit_output").
+	"""
+	if (type(content) == str):
+		content = content.encode()
+
+	if (os.path.isfile(path)):
+		with open(path, 'rb') as f:
+			old_hash = hashlib.sha256(f.read()).digest()
+		if (old_hash == hashlib.sha256(content).digest()):
+			output_summary["unchanged"].append(path)
+			return False
+
+	tmp_path = "{}.{}.tmp".format(path, os.getpid())
+	with open(tmp_path, 'wb') as f:
+		f.write(content)
+	os.replace(tmp_path, path)
+
+	output_summary["changed"].append(path)
+	return True
+
+def print_output_summary():
+	"""
+	Print which outputs were changed since last summary and clear the
+	summary.
+	"""
+	print("Changed outputs ({}):".format(len(output_summary["changed"])))
+	for path in output_summary["changed"]:
+		print("    " + path)
+	print("Unchanged outputs: {}".format(len(output_summary["unchanged"])))
+
+	output_summary["changed"] = []
+	output_summary["unchanged"] = []
+
+def calc_output_fingerprint(*items):
+	"""
+	Calculate fingerprint of generated output from fingerprints of its
+	inputs and generator settings. Tool version is always included.
+	"""
+	return hashlib.sha256(repr([TOOL_VERSION, items]).encode()).hexdigest()
+
+def get_manifest_path(output):
+	"""
+	Get path of manifest with fingerprint of a single output file.
+	"""
+	return output + ".manifest.json"
+
+def load_manifest(path):
+	"""
+	Load manifest with fingerprints of generated outputs. Manifest maps
+	output file name to fingerprint of inputs it was generated from.
+	Empty manifest is returned if it does not exist or is not readable.
+	"""
+	if (not os.path.isfile(path)):
+		return {}
+
+	try:
+		with open(path, 'r') as f:
+			return json.load(f)
+	except ValueError:
+		print("WARNING: Invalid manifest, regenerating all outputs: " + path)
+		return {}
+
+def store_manifest(path, manifest):
+	"""
+	Store manifest with fingerprints of generated outputs.
+	"""
+	commit_output(path, json.dumps(manifest, indent=4, sort_keys=True) + "\n")
+
+def is_output_up_to_date(manifest, output, fingerprint):
+	"""
+	Check if output exists and was generated from inputs with given
+	fingerprint.
+	"""
+	return (os.path.isfile(output) and
+			manifest.get(os.path.basename(output)) == fingerprint)
+
+def check_output_up_to_date(output, fingerprint):
+	"""
+	Check if single output file was already generated from inputs with given
+	fingerprint. Fingerprint is kept in manifest next to the output file.
+	"""
+	manifest = load_manifest(get_manifest_path(output))
+	if (is_output_up_to_date(manifest, output, fingerprint)):
+		print("Up to date, skipping: " + output)
+		return True
+	return False
+
+def update_output_fingerprint(output, fingerprint):
+	"""
+	Store fingerprint of inputs of single output file into manifest next to
+	the output file.
+	"""
+	store_manifest(get_manifest_path(output),
+				   {os.path.basename(output) : fingerprint})
+
+class OutputFile(io.StringIO):
+	"""
+	Output file buffered in memory. Content is committed to the file upon
+	close, only when it differs from the file on disk (see "commit_output").
+	Content is discarded when closed due to an exception.
+	"""
+	def __init__(self, path):
+		super().__init__()
+		self.path = path
+
+	def close(self):
+		if (not self.closed):
+			commit_output(self.path, self.getvalue())
+		super().close()
+
+	def discard(self):
+		super().close()
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		if (exc_type == None):
+			self.close()
+		else:
+			self.discard()
+		return False
+
+class StreamOutputFile():
+	"""
+	Output file streamed to a temporary file in the same directory. Only
+	the buffer of the file is kept in memory. Upon close, the temporary file
+	replaces the output file, only when content differs (see
+	"commit_output"). Content is discarded when closed due to an exception.
+	"""
+	def __init__(self, path):
+		self.path = path
+		self.tmp_path = "{}.{}.tmp".format(path, os.getpid())
+		self.file = open(self.tmp_path, 'w', encoding="utf-8", newline="")
+		self.hash = hashlib.sha256()
+		self.closed = False
+
+	def write(self, text):
+		self.hash.update(text.encode())
+		return self.file.write(text)
+
+	def writelines(self, lines):
+		for line in lines:
+			self.write(line)
+
+	def close(self):
+		if (not self.closed):
+			self.file.close()
+			self.closed = True
+			with timed_phase("write_output"):
+				replace_output(self.path, self.tmp_path, self.hash.digest())
+
+	def discard(self):
+		if (not self.closed):
+			self.file.close()
+			self.closed = True
+			os.remove(self.tmp_path)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		if (exc_type == None):
+			self.close()
+		else:
+			self.discard()
+		return False
+
+def hash_file(path):
+	"""
+	Calculate SHA-256 digest of file content. File is read by blocks.
+	"""
+	file_hash = hashlib.sha256()
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(1 << 20), b""):
+			file_hash.update(block)
+	return file_hash.digest()
+
+def replace_output(path, tmp_path, new_hash):
+	"""
+	Replace output file by already written temporary file if their content
+	differs (see "commit_output"). Temporary file is removed otherwise.
+	"""
+	if (os.path.isfile(path) and hash_file(path) == new_hash):
+		os.remove(tmp_path)
+		output_summary["unchanged"].append(path)
+		return False
+
+	os.replace(tmp_path, path)
+	output_summary["changed"].append(path)
+	return True
+
+def open_output(output, stream=False):
+	"""
+	Open output file. Output is kept in memory until the file is closed
+	(see "OutputFile"), or streamed to disk when "stream" is set (see
+	"StreamOutputFile").
+	"""
+	if (stream):
+		return StreamOutputFile(output)
+	return OutputFile(output)
+
+def parse_component(path):
+	"""
+	Parse IP-XACT component from specification file.
+	"""
+	with open(path) as f:
+		component = Component()
+		component.load(f)
+	return component
+
+def calc_component_cache_key(path):
+	"""
+	Calculate key of loaded component cache from content of IP-XACT
+	specification file and tool version.
+	"""
+	with open(path, 'rb') as f:
+		spec_hash = hashlib.sha256(f.read())
+	spec_hash.update(TOOL_VERSION.encode())
+	return spec_hash.hexdigest()
+
+def load_component(path, cacheDir=None):
+	"""
+	Load IP-XACT component from specification file. If "cacheDir" is given,
+	loaded component is stored there in binary format. Further loads of the
+	same specification content (by the same tool version) are read from the
+	cache and XML parsing is skipped.
+	"""
+	if (cacheDir == None):
+		return parse_component(path)
+
+	cache_path = os.path.join(cacheDir, calc_component_cache_key(path) + ".pickle")
+
+	if (os.path.isfile(cache_path)):
+		try:
+			with open(cache_path, 'rb') as f:
+				return pickle.load(f)
+		except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+			print("WARNING: Invalid component cache: " + cache_path)
+
+	component = parse_component(path)
+
+	# Write to temporary file first, so that parallel builds never see
+	# partially written cache. Temporary file is removed on any failure,
+	# component which can't be cached is still returned.
+	os.makedirs(cacheDir, exist_ok=True)
+	tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+	try:
+		with open(tmp_path, 'wb') as f:
+			pickle.dump(component, f, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(tmp_path, cache_path)
+	except BaseException as err:
+		if (os.path.isfile(tmp_path)):
+			os.remove(tmp_path)
+		if (not isinstance(err, (pickle.PicklingError, TypeError,
+								 AttributeError, RecursionError, OSError))):
+			raise
+		print("WARNING: Component can't be cached: {}".format(err))
+
+	return component
 
 def split_string(input, size):
 	return [input[start:start+size] for start in range(0, len(input), size)]
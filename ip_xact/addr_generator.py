@@ -31,12 +31,29 @@
 ##
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		18.10.2026	Register arrays ("dim") are expanded to their elements.
+##		18.10.2026	Identical enumerated value sets of fields are shared.
+##		18.10.2026	Parameters, register locks and registers are indexed.
+##		18.10.2026	Register access types normalized to flags.
+##		18.10.2026	Output can be streamed to the output file.
 ##
 ################################################################################
 
 from abc import ABCMeta, abstractmethod
 
 import math
+import bisect
+import hashlib
+import copy
+
+from pyXact_generator.languages.gen_base import BaseGenerator
+
+# Register access type flags. Access type of each register is normalized
+# to a combination of these flags (see "calc_reg_access").
+ACCESS_ANY = 0x0
+ACCESS_READ = 0x1
+ACCESS_WRITE = 0x2
+ACCESS_WRITE_ONCE = 0x4
 
 class IpXactAddrGenerator(metaclass=ABCMeta):
 
@@ -52,21 +69,157 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 	pyXactComp = None	
 	
 	of = None
+
+	# When set to "True" output of language generators is streamed to the
+	# output file while it is generated (see "set_of").
+	streamOutput = False
+
+	# Word layout indices of address blocks. Keyed by address block and
+	# register access type flags (see "get_blk_wrd_layout").
+	wrdLayouts = None
+
+	# Bit masks of registers. Keyed by register (see "get_reg_masks").
+	regMasks = None
+
+	# Sets of enumerated values shared by fields of the memory map. Keyed by
+	# register and field (see "get_field_enum_set").
+	fieldEnumSets = None
+
+	# Names of component parameters. Keyed by parameter ID
+	# (see "parameter_lookup").
+	parameterNames = None
+
+	# Register lock properties. Keyed by register name (see "get_reg_lock").
+	regLocks = None
+
+	# Registers of memory map. Keyed by address offset of field map register
+	# (see "addr_reg_lookup").
+	fieldRegAddrs = None
+
+	# Access type flags of registers. Keyed by register (see "get_reg_access").
+	regAccesses = None
 	
 	def __init__(self, pyXactComp, memMap, wordWidth):
 		self.wrdWidthBit = wordWidth
 		self.wrdWidthByte = int(wordWidth / 8)
+		self.wrdLayouts = {}
+		self.regMasks = {}
+		self.regAccesses = {}
 
 		if (not pyXactComp.memoryMaps):
 			return None
 
 		for map_inst in pyXactComp.memoryMaps.memoryMap:
 			if map_inst.name == memMap:
-				self.memMap = map_inst
+				self.memMap = self.expand_reg_arrays(map_inst)
+
+		if (self.memMap != None):
+			for block in self.memMap.addressBlock:
+				for reg in block.register:
+					self.get_reg_access(reg)
 
 		self.pyXactComp = pyXactComp		
 
 
+	def get_reg_dim(self, reg):
+		"""
+		Get number of elements of register array ("dim" property). Returns 1
+		for registers which are not arrays. Multiple "dim" values describe
+		multi-dimensional array, which is flattened.
+		"""
+		dim = getattr(reg, "dim", None)
+		if (dim == None or dim == "" or dim == []):
+			return 1
+
+		if (type(dim) != list):
+			dim = [dim]
+
+		count = 1
+		for d in dim:
+			count *= int(d)
+		return count
+
+
+	def create_reg_array_elements(self, reg):
+		"""
+		Create elements of register array. Elements are copies of the register
+		named <reg_name>_<index>, placed one after another (register size
+		apart). Each element has attributes:
+			dimBase			Original register array object
+			dimIndex		Index of the element within the array
+			dimElements		List of all elements of the array
+		Returns list with the register itself if it is not an array.
+		"""
+		dim = self.get_reg_dim(reg)
+		if (dim == 1):
+			return [reg]
+
+		stride = (int(reg.size) + 7) // 8
+		elements = []
+		for i in range(dim):
+			element = copy.copy(reg)
+			element.name = "{}_{}".format(reg.name, i)
+			element.addressOffset = reg.addressOffset + i * stride
+			element.dim = None
+			element.dimBase = reg
+			element.dimIndex = i
+			element.dimElements = elements
+			elements.append(element)
+
+		return elements
+
+
+	def expand_reg_arrays(self, memMap):
+		"""
+		Replace register arrays within memory map by their elements, so that
+		each element is processed as separate register. Returns the memory map
+		itself if it has no register arrays, otherwise its copy (loaded
+		component is not modified).
+		"""
+		has_arrays = False
+		for block in memMap.addressBlock:
+			for reg in block.register:
+				if (self.get_reg_dim(reg) > 1):
+					has_arrays = True
+
+		if (not has_arrays):
+			return memMap
+
+		expMap = copy.copy(memMap)
+		expMap.addressBlock = []
+		for block in memMap.addressBlock:
+			expBlock = copy.copy(block)
+			expBlock.register = []
+			for reg in block.register:
+				expBlock.register.extend(self.create_reg_array_elements(reg))
+			expMap.addressBlock.append(expBlock)
+
+		return expMap
+
+
+	def get_reg_array_base(self, reg):
+		"""
+		Get register array of which the register is an element. Returns None
+		for registers which are not elements of register array.
+		"""
+		return getattr(reg, "dimBase", None)
+
+
+	def is_reg_array_compact(self, reg, wrdWidthByte):
+		"""
+		Check if register array element can be described together with other
+		elements of its array: each element occupies whole word of
+		"wrdWidthByte" bytes, so all elements have the same layout within
+		their words.
+		"""
+		base = self.get_reg_array_base(reg)
+		if (base == None):
+			return False
+
+		return (int(base.size) == wrdWidthByte * 8 and
+				base.addressOffset % wrdWidthByte == 0)
+
+
 	def commit_to_file(self, of, text):
 		""" 
 		Write a text into the output file
@@ -81,11 +234,25 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 	
 	def set_of(self, of):
 		""" 
-		Sets the output file to the internal output file of instance
+		Sets the output file to the internal output file of instance. When
+		output is streamed, language generators write their output directly
+		to the output file.
 		Arguments:
 			of		Output file to set
 		"""
 		self.of = of
+
+		if (self.streamOutput):
+			for lanGen in self.get_lan_generators():
+				lanGen.set_sink(of)
+
+
+	def get_lan_generators(self):
+		"""
+		Get language generators used by this generator.
+		"""
+		return [gen for gen in vars(self).values()
+				if isinstance(gen, BaseGenerator)]
 	
 	
 	def move_till_text(self, of, text):
@@ -102,38 +269,102 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 				break
 
 
-	def get_regs_from_word(self, word_addr, block):
+	def build_blk_wrd_layout(self, block, accesses):
 		"""
-		Create list of registers within given memory word address
+		Build word layout index of an address block. Only registers with all
+		given access type flags are considered for word span, word count and word
+		indices. Word address to register mapping contains all registers.
 		"""
-		regs_in_wrd = []
-		for reg in sorted(block.register, key=lambda a: a.addressOffset):
-			reg_wrd_addr = reg.addressOffset - reg.addressOffset % self.wrdWidthByte;
+		regs = sorted(block.register, key=lambda a: a.addressOffset)
 
-			if (reg_wrd_addr == word_addr):
-				regs_in_wrd.append(reg)
+		# Registers within each memory word
+		regs_in_wrd = {}
+		for reg in regs:
+			wrd_addr = self.align_addr_to_wrd(reg.addressOffset)
+			regs_in_wrd.setdefault(wrd_addr, []).append(reg)
 
-			# Exit upon last possible register (further are for sure in higher 
-			# words), no need to search further
-			if (reg.addressOffset > (word_addr + self.wrdWidthByte)):
-				break
+		# Words occupied by registers of given access types
+		low_addr = block.range
+		high_addr = 0
+		occupied = []
+		for reg in regs:
+			if (not (self.reg_has_access_type(reg, accesses))):
+				continue
+
+			wrd_addr = self.align_addr_to_wrd(reg.addressOffset)
+
+			if (reg.addressOffset < low_addr):
+				low_addr = wrd_addr
+
+			if (reg.addressOffset > high_addr):
+				high_addr = wrd_addr
+
+			if (not occupied or occupied[-1] < wrd_addr):
+				occupied.append(wrd_addr)
+
+		# Index of memory word of each register, counted only over words
+		# occupied by registers of given access types.
+		wrd_index = {}
+		for reg in regs:
+			wrd_addr = self.align_addr_to_wrd(reg.addressOffset)
+			if (wrd_addr < low_addr or wrd_addr > high_addr or
+				(wrd_addr - low_addr) % self.wrdWidthByte != 0):
+				wrd_index[id(reg)] = None
+			else:
+				wrd_index[id(reg)] = bisect.bisect_right(occupied, wrd_addr)
+
+		return {"block" : block,
+				"regs_in_wrd" : regs_in_wrd,
+				"span" : [low_addr, high_addr],
+				"count" : len(occupied),
+				"wrd_index" : wrd_index}
+
+
+	def get_blk_wrd_layout(self, block, accesses=ACCESS_ANY):
+		"""
+		Get word layout index of an address block. Index is built upon first
+		query for given block and access type flags. It contains:
+			"regs_in_wrd"	Word address -> list of registers within the word
+			"span"			[low_addr, high_addr] of words with registers of
+							given access types.
+			"count"			Number of words with registers of given access
+							types.
+			"wrd_index"		Register id -> index of memory word with the
+							register (as returned by "get_wrd_index").
+		"""
+		key = (id(block), accesses)
+		layout = self.wrdLayouts.get(key)
+
+		if (layout == None or layout["block"] is not block):
+			layout = self.build_blk_wrd_layout(block, accesses)
+			self.wrdLayouts[key] = layout
 
-		return regs_in_wrd
+		return layout
+
+
+	def get_regs_from_word(self, word_addr, block):
+		"""
+		Create list of registers within given memory word address
+		"""
+		regs_in_wrd = self.get_blk_wrd_layout(block)["regs_in_wrd"]
+		return list(regs_in_wrd.get(word_addr, []))
 
 
 	def addr_reg_lookup(self, fieldReg):
 		""" 
 		Search the "memMap" for register with the same address offset aligned
-		to memory word and return it.
+		to memory word and return it. Registers are indexed only once.
 		Arguments:
 			fieldReg	Register from the field map to search for in the address
 						map.
 		"""
-		for block in self.memMap.addressBlock:
-			for reg in block.register:
-				if (reg.addressOffset * 4 == fieldReg.addressOffset):
-					return reg
-		return None
+		if (self.fieldRegAddrs == None):
+			self.fieldRegAddrs = {}
+			for block in self.memMap.addressBlock:
+				for reg in block.register:
+					self.fieldRegAddrs.setdefault(reg.addressOffset * 4, reg)
+
+		return self.fieldRegAddrs.get(fieldReg.addressOffset)
 
 
 	def align_addr_to_wrd(self, addr):
@@ -143,19 +374,48 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		return math.floor(addr - (addr % self.wrdWidthByte))
 
 
+	def calc_reg_access(self, reg):
+		"""
+		Calculate access type flags of register from its IP-XACT access type:
+			read-only		ACCESS_READ
+			write-only		ACCESS_WRITE
+			read-write		ACCESS_READ | ACCESS_WRITE
+			writeOnce		ACCESS_WRITE | ACCESS_WRITE_ONCE
+			read-writeOnce	ACCESS_READ | ACCESS_WRITE | ACCESS_WRITE_ONCE
+		"""
+		flags = ACCESS_ANY
+		if ("read" in reg.access):
+			flags |= ACCESS_READ
+		if ("write" in reg.access):
+			flags |= ACCESS_WRITE
+		if ("writeOnce" in reg.access):
+			flags |= ACCESS_WRITE_ONCE
+		return flags
+
+
+	def get_reg_access(self, reg):
+		"""
+		Return access type flags of register (see "calc_reg_access"). Flags
+		of all registers within memory map are calculated when generator is
+		created.
+		"""
+		access = self.regAccesses.get(id(reg))
+		if (access == None or access[0] is not reg):
+			access = (reg, self.calc_reg_access(reg))
+			self.regAccesses[id(reg)] = access
+		return access[1]
+
+
 	def reg_is_access_type(self, reg, accesses):
 		"""
 		Check if register is explicitly of given access type. If input
 		access type is sub-set of register access type, False is returned.
 		E.g.:
-			register access type: read-writeOnce
-		    searched access type: write-Once
+			register access type: ACCESS_READ | ACCESS_WRITE | ACCESS_WRITE_ONCE
+		    searched access type: ACCESS_WRITE | ACCESS_WRITE_ONCE
 			False is returned		
 		"""
-		for access in accesses:
-			if (access == reg.access):
-				return True
-		return False		
+		return self.get_reg_access(reg) == accesses
 
 
 	def reg_has_access_type(self, reg, accesses):
@@ -163,14 +423,11 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		Check if register contains given access type. If input access type
 		is sub-set of register acces type, True is returned.
 		E.g.:
-			register access type: read-writeOnce
-		    searched access type: write-Once
+			register access type: ACCESS_READ | ACCESS_WRITE | ACCESS_WRITE_ONCE
+		    searched access type: ACCESS_WRITE | ACCESS_WRITE_ONCE
 			True is returned
 		"""
-		for access in accesses:
-			if (access in reg.access):
-				return True
-		return False
+		return (self.get_reg_access(reg) & accesses) == accesses
 
 
 	def is_reg_write_indicate(self, reg):
@@ -198,7 +455,7 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		return False
 
 
-	def calc_blk_wrd_span(self, block, accesses=[""]):
+	def calc_blk_wrd_span(self, block, accesses=ACCESS_ANY):
 		"""
 		Calculate minimal address span for address block with registers of
 		given access types.
@@ -206,115 +463,77 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 			[low_addr, high_addr] - Lowest higher addresses within a block
 				with registers of given access types.
 		"""
-		low_addr = block.range
-		high_addr = 0
+		return list(self.get_blk_wrd_layout(block, accesses)["span"])
 
-		for reg in block.register:
-			if (not (self.reg_has_access_type(reg, accesses))):
-				continue
-
-			if (reg.addressOffset < low_addr):
-				low_addr = self.align_addr_to_wrd(reg.addressOffset) 
-
-			if (reg.addressOffset > high_addr):
-				high_addr = self.align_addr_to_wrd(reg.addressOffset)
 
-		return [low_addr, high_addr]
-
-
-	def calc_blk_wrd_count(self, block, accesses=[""]):
+	def calc_blk_wrd_count(self, block, accesses=ACCESS_ANY):
 		"""
 		Calculate number of memory words in a block occupied by a registers
 		of this block.
 		Arguments:
 			block       Block object
-			accesses    List of register access types that should be considered.
+			accesses    Register access type flags that should be considered.
 						If not specified, every register is considered.
 		"""
-		cnt = 0
-		highestWrd = -1
-		for reg in sorted(block.register, key=lambda a: a.addressOffset):
-
-			# Check if register is of given Access type
-			if (not (self.reg_has_access_type(reg, accesses))):
-				continue
-
-			act_wrd = self.align_addr_to_wrd(reg.addressOffset)
-
-			if (highestWrd < act_wrd):
-				highestWrd = act_wrd
-				cnt = cnt + 1
+		return self.get_blk_wrd_layout(block, accesses)["count"]
 
-		return cnt
 
-
-	def get_wrd_index(self, block, reg, accesses=[""]):
+	def get_wrd_index(self, block, reg, accesses=ACCESS_ANY):
 		"""
 		Calculate index of memory word which contains given register. Take
 		into account only registers with given access types.
 		"""
-		index = 0
-
-		# Check each word in the memory block
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block, accesses)
-		high_addr += self.wrdWidthByte
-
-		for wrd_addr in range(low_addr, high_addr, self.wrdWidthByte):
-			
-			# Check that on this memory word, there is a register exisiting
-			# with a given access type            
-			for s_reg in sorted(block.register, key=lambda a: a.addressOffset): 
-
-				# Skip registers whose access type we are not interested in
-				if (not self.reg_has_access_type(s_reg, accesses)):
-					continue;
-
-				# Check that register resides within this word
-				aligned_reg_addr = self.align_addr_to_wrd(s_reg.addressOffset)
-				if (aligned_reg_addr == wrd_addr):
-					index += 1
-					break
-
-			# If register word address is matching the actually searched
-			# address, we the index holds the
-			searched_addr = self.align_addr_to_wrd(reg.addressOffset)
-			if (searched_addr == wrd_addr):
-				return index
-
-		return None
+		return self.get_blk_wrd_layout(block, accesses)["wrd_index"].get(id(reg))
 
 
 	def parameter_lookup(self, uid):
 		"""
 		Search for paramater in loaded IP-XACT component. Returns name of
-		the parameter if found, false otherwise.
+		the parameter if found, None otherwise. Parameters are indexed only
+		once.
 		"""
-		for parameter in self.pyXactComp.parameters.parameter:
-			if (parameter.parameterId == uid):
-				return parameter.name
+		if (self.parameterNames == None):
+			self.parameterNames = {}
+			for parameter in self.pyXactComp.parameters.parameter:
+				self.parameterNames.setdefault(parameter.parameterId,
+											   parameter.name)
 
-		return None
+		return self.parameterNames.get(uid)
 
 
 	def get_reg_lock(self, reg):
 		"""
 		Search for Vendor extension 'regLock' property on given register.
+		Register locks are indexed only once. Elements of register array
+		without lock of their own inherit lock of the whole array.
         Returns:
             [has_lock, lock_description, lock_signal]
             has_lock - 'true' if register is lockable, 'false' otherwise
             lock_signal - name of signal used to lock access to the registers!
 		"""
-		for regLock in self.pyXactComp.vendorExtensions.regLocks.regLock:
-			if (regLock.reg_name == reg.name):
-				return ["true", regLock.description, regLock.lock_signal]
+		if (self.regLocks == None):
+			self.regLocks = {}
+			for regLock in self.pyXactComp.vendorExtensions.regLocks.regLock:
+				self.regLocks.setdefault(regLock.reg_name,
+						("true", regLock.description, regLock.lock_signal))
+
+		lock = self.regLocks.get(reg.name)
+		base = self.get_reg_array_base(reg)
+		if (lock == None and base != None):
+			lock = self.regLocks.get(base.name)
+		if (lock == None):
+			lock = ("false", None, "'0'")
 
-		return ["false", None, "'0'"]
+		return list(lock)
 
 
 	def calc_addr_width_from_size(self, size):
 		"""
+		Calculate number of address bits necessary to address "size" items
+		(ceil(log2(size))). Exact integer arithmetic is used, so that sizes
+		which are powers of 2 never round up.
 		"""
-		return math.ceil(math.log(size, 2))
+		return (int(size) - 1).bit_length()
 
 
 	def calc_wrd_address_width(self, block):
@@ -327,25 +546,217 @@ class IpXactAddrGenerator(metaclass=ABCMeta):
 		return addr_width
 
 
+	def calc_reg_masks(self, reg):
+		"""
+		Calculate bit masks of register. Bit 0 of each mask corresponds to
+		bit 0 of the register. Returns dictionary with:
+			"implemented"	Bits covered by register fields.
+			"reset"			Reset value of register. Bits of fields without
+							reset value are 0.
+			"readable"		Implemented bits if register is readable, 0 otherwise.
+			"writable"		Implemented bits if register is writable, 0 otherwise.
+			"fields"		List with field covering each bit of the register.
+							None for bits without field.
+		"""
+		implemented = 0
+		reset = 0
+		fields = [None] * reg.size
+
+		for field in sorted(reg.field, key=lambda a: a.bitOffset):
+			field_mask = ((1 << field.bitWidth) - 1) << field.bitOffset
+			implemented |= field_mask
+
+			if (field.resets != None and field.resets.reset != None):
+				reset |= (int(field.resets.reset.value) << field.bitOffset) & field_mask
+
+			for i in range(field.bitOffset,
+						   min(field.bitOffset + field.bitWidth, reg.size)):
+				if (fields[i] == None):
+					fields[i] = field
+
+		size_mask = (1 << reg.size) - 1
+		implemented &= size_mask
+
+		readable = 0
+		if (self.reg_has_access_type(reg, ACCESS_READ)):
+			readable = implemented
+
+		writable = 0
+		if (self.reg_has_access_type(reg, ACCESS_WRITE)):
+			writable = implemented
+
+		return {"implemented" : implemented, "reset" : reset & size_mask,
+				"readable" : readable, "writable" : writable, "fields" : fields}
+
+
+	def get_reg_masks(self, reg):
+		"""
+		Return bit masks of register (see "calc_reg_masks"). Masks are
+		calculated only once for each register.
+		"""
+		masks = self.regMasks.get(id(reg))
+		if (masks == None or masks[0] is not reg):
+			masks = (reg, self.calc_reg_masks(reg))
+			self.regMasks[id(reg)] = masks
+		return masks[1]
+
+
+	def calc_wrd_masks(self, regs):
+		"""
+		Calculate bit masks of memory word from masks of registers within
+		the word (see "calc_reg_masks"). Bit 0 of each mask corresponds to
+		bit 0 of the memory word. Items of "fields" list are tuples
+		(register, field).
+		"""
+		masks = {"implemented" : 0, "reset" : 0, "readable" : 0,
+				 "writable" : 0, "fields" : [None] * self.wrdWidthBit}
+
+		for reg in regs:
+			shift = (reg.addressOffset % self.wrdWidthByte) * 8
+			reg_masks = self.get_reg_masks(reg)
+
+			for key in ["implemented", "reset", "readable", "writable"]:
+				masks[key] |= reg_masks[key] << shift
+
+			for (i, field) in enumerate(reg_masks["fields"]):
+				if (field != None and shift + i < self.wrdWidthBit and
+					masks["fields"][shift + i] == None):
+					masks["fields"][shift + i] = (reg, field)
+
+		return masks
+
+
 	def calc_reg_rstval_mask(self, reg):
 		"""
 		Calculate mask or reset values for given register. Reset mask contains
 		value of reset after "res_n" input is released.
 		"""
-		# Suppose all registers are reset to zero
-		rst_mask = ["0" for x in range(reg.size)]
+		# std_logic_vector is written MSB first, surround by ""
+		return '"{:0{}b}"'.format(self.get_reg_masks(reg)["reset"], reg.size)
 
-		# Go through fields and replace each bit index by a reset value
-		for field in sorted(reg.field, key=lambda a: a.bitOffset):
-			if (field.resets == None):
-				continue;
-			remainder = field.resets.reset.value
-			for j in range(field.bitWidth):
-				if (remainder % 2 == 1):
-					rst_mask[field.bitOffset + j] = "1"				
-				remainder = int(remainder / 2)
-
-		# Reverse the list, since std_logic_vector has opposite order than list!
-		# Concat values and surround by ""
-		return '"' + ''.join(rst_mask[::-1]) + '"'
 
+	def calc_enum_set_key(self, field):
+		"""
+		Calculate key of enumerated values of IP-XACT field object. Fields
+		with structurally identical enumerated values (the same width, names,
+		values and descriptions) have the same key. Returns None if field has
+		no enumerated values.
+		"""
+		values = []
+		for es in field.enumeratedValues:
+			for e in sorted(es.enumeratedValue, key=lambda x: x.value):
+				values.append((e.name, e.value, e.description))
+
+		if (values == []):
+			return None
+		return (field.bitWidth, tuple(values))
+
+
+	def build_field_enum_sets(self):
+		"""
+		Find sets of enumerated values of all fields within the memory map.
+		Each set is a dictionary with:
+			"values"	Enumerated values sorted by value.
+			"owner"		Tuple (register, field) of first field with the set.
+						Shared definition of the set is emitted for it.
+			"fields"	List of tuples (register, field) with the set.
+		"""
+		enumSets = {}
+		self.fieldEnumSets = {}
+
+		for block in self.memMap.addressBlock:
+			for reg in sorted(block.register, key=lambda a: a.addressOffset):
+				for field in sorted(reg.field, key=lambda a: a.bitOffset):
+					key = self.calc_enum_set_key(field)
+					if (key == None):
+						continue
+
+					enumSet = enumSets.get(key)
+					if (enumSet == None):
+						values = []
+						for es in field.enumeratedValues:
+							values += sorted(es.enumeratedValue,
+											 key=lambda x: x.value)
+						enumSet = {"values" : values, "owner" : (reg, field),
+								   "fields" : []}
+						enumSets[key] = enumSet
+
+					enumSet["fields"].append((reg, field))
+					self.fieldEnumSets[(id(reg), id(field))] = enumSet
+
+
+	def get_field_enum_set(self, reg, field):
+		"""
+		Return set of enumerated values of IP-XACT field object within given
+		register (see "build_field_enum_sets"). Sets are searched only once
+		for whole memory map. Returns None if field has no enumerated values.
+		"""
+		if (self.fieldEnumSets == None):
+			self.build_field_enum_sets()
+		return self.fieldEnumSets.get((id(reg), id(field)))
+
+
+	def is_enum_set_owner(self, reg, field):
+		"""
+		Check if shared definition of enumerated values of a field is emitted
+		for this field. False for fields which only refer to it.
+		"""
+		enumSet = self.get_field_enum_set(reg, field)
+		if (enumSet == None):
+			return False
+		(ownerReg, ownerField) = enumSet["owner"]
+		return ownerReg is reg and ownerField is field
+
+
+	def get_block_fingerprint_items(self, block):
+		"""
+		Collect all properties of an address block which affect generated
+		outputs: block attributes, registers, fields, enumerated values,
+		register locks and parameters of conditionally present registers.
+		"""
+		items = [block.name, block.baseAddress, block.range, block.width,
+				 block.usage, block.displayName, block.description]
+
+		for reg in sorted(block.register, key=lambda a: a.addressOffset):
+			items.append([reg.name, reg.addressOffset, reg.size, reg.access,
+						  reg.isPresent, reg.description, self.get_reg_lock(reg)])
+
+			if (reg.isPresent != ""):
+				items.append(self.parameter_lookup(reg.isPresent))
+
+			for field in sorted(reg.field, key=lambda a: a.bitOffset):
+				rst_val = None
+				if (field.resets != None and field.resets.reset != None):
+					rst_val = field.resets.reset.value
+
+				items.append([field.name, field.bitOffset, field.bitWidth,
+							  rst_val, field.modifiedWriteValue,
+							  field.readAction, field.description])
+
+				for es in field.enumeratedValues:
+					for e in sorted(es.enumeratedValue, key=lambda x: x.value):
+						items.append([e.name, e.value, e.description])
+
+		return items
+
+
+	def calc_block_fingerprint(self, block):
+		"""
+		Calculate stable fingerprint (SHA-256 hex digest) of an address block.
+		Fingerprint changes whenever anything within the block changes.
+		"""
+		items = self.get_block_fingerprint_items(block)
+		return hashlib.sha256(repr(items).encode()).hexdigest()
+
+
+	def calc_mem_map_fingerprint(self):
+		"""
+		Calculate stable fingerprint (SHA-256 hex digest) of the memory map
+		and all its address blocks.
+		"""
+		items = [self.memMap.name, self.memMap.displayName,
+				 self.memMap.description, self.wrdWidthBit]
+		for block in self.memMap.addressBlock:
+			items.append(self.calc_block_fingerprint(block))
+
+		return hashlib.sha256(repr(items).encode()).hexdigest()
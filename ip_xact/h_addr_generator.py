@@ -30,11 +30,16 @@
 ## 
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		18.10.2026	Added inline field accessors as alternative to unions.
+##		18.10.2026	Register arrays described once, addressed by macros.
+##		18.10.2026	Identical field enums are declared only once.
+##		18.10.2026	"_update" helpers only for readable and writable words.
 ##
 ################################################################################
 
 from abc import ABCMeta, abstractmethod
 from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+from pyXact_generator.ip_xact.addr_generator import ACCESS_READ, ACCESS_WRITE
 
 from pyXact_generator.languages.gen_h import HeaderGenerator
 from pyXact_generator.languages.declaration import LanDeclaration
@@ -44,27 +49,67 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 	headerGen = None
 	prefix	= ""
 
+	# Width of C word type used to access the register map. Words of wider
+	# buses are split to 64 bit C words (largest standard C integer type).
+	cWrdWidthBit = None
+	cWrdWidthByte = None
+
+	# When set to "True" each register field gets "_MASK" and "_SHIFT" macros
+	# and static inline get / set / prep helpers instead of bitfield unions.
+	# Each readable and writable memory word gets "_update" helper which
+	# writes any combination of its fields by single read-modify-write.
+	field_accessors = False
+
 	def __init__(self, pyXactComp, memMap, wrdWidthBit):
 		super().__init__(pyXactComp, memMap, wrdWidthBit)
 		self.headerGen = HeaderGenerator()
+		self.cWrdWidthBit = min(self.wrdWidthBit, 64)
+		self.cWrdWidthByte = self.cWrdWidthBit // 8
 	
 	
 	def commit_to_file(self):
-		for line in self.headerGen.out :
-			self.of.write(line)
+		self.headerGen.write_output(self.of)
 	
 
+	def get_reg_c_name(self, reg):
+		"""
+		Get name of register used in C identifiers. Elements of register
+		arrays which occupy whole C words are described only once, by the
+		first element named by the register array.
+		"""
+		if (self.is_reg_array_compact(reg, self.cWrdWidthByte)):
+			return self.get_reg_array_base(reg).name
+		return reg.name
+
+
+	def is_reg_described(self, reg):
+		"""
+		Check if register has its own union (field accessors) and field enums.
+		Only the first element of register arrays which occupy whole C words
+		is described.
+		"""
+		return (not self.is_reg_array_compact(reg, self.cWrdWidthByte) or
+				reg.dimIndex == 0)
+
+
 	def create_reg_field_decl(self, reg, field):
 		"""
 		Create declaration object from IP-XACT register and field object.
+		Fields of register array elements sharing a C word are suffixed by
+		index of the element.
 		"""
-		fieldDecl = LanDeclaration(name=field.name.lower(), value=0)
-		fieldDecl.type = "uint{}_t".format(self.wrdWidthBit)
+		name = field.name.lower()
+		if (self.get_reg_array_base(reg) != None and
+			not self.is_reg_array_compact(reg, self.cWrdWidthByte)):
+			name += "_{}".format(reg.dimIndex)
+
+		fieldDecl = LanDeclaration(name=name, value=0)
+		fieldDecl.type = "uint{}_t".format(self.cWrdWidthBit)
 		fieldDecl.bitWidth = field.bitWidth
 		fieldDecl.gap = 2
 		fieldDecl.alignLen = 40
 		fieldDecl.bitIndex = field.bitOffset + \
-			((int(reg.addressOffset)*8) % self.wrdWidthBit)
+			((int(reg.addressOffset)*8) % self.cWrdWidthBit)
 		fieldDecl.intType = "bitfield"
 
 		return fieldDecl
@@ -73,7 +118,7 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 	def write_reg_group_union(self, regGroup):
 		"""
 		Write group of IP-XACT register objects as a single union to generator
-		output. Group of registers should reside within the same memory word.
+		output. Group of registers should reside within the same C word.
 
 		Example of union with 32 bit wrdWidth:
 			union <joined_name> {
@@ -100,20 +145,20 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 				fieldDecl = self.create_reg_field_decl(reg, field)
 				fieldDecl.comment = None
 				if (i == 0):
-					fieldDecl.comment = reg.name.upper()
+					fieldDecl.comment = self.get_reg_c_name(reg).upper()
 
 				fielDecls.append(fieldDecl)
 
 			# Append register name to the union name
-			unName += reg.name.lower()
+			unName += self.get_reg_c_name(reg).lower()
 			if (j != len(regGroup) - 1):
 				unName += "_"
 
 		enumDecl = []
 
 		# Create declaration of u<wrd_width> union member
-		unsigned_decl = LanDeclaration("u{}".format(self.wrdWidthBit), value=0)
-		unsigned_decl.type = "uint{}_t".format(self.wrdWidthBit)
+		unsigned_decl = LanDeclaration("u{}".format(self.cWrdWidthBit), value=0)
+		unsigned_decl.type = "uint{}_t".format(self.cWrdWidthBit)
 		unsigned_decl.gap = 1
 
 		# Append declarations to the list of declarations within an enum
@@ -124,39 +169,136 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		self.headerGen.wr_nl()
 
 
-	def create_field_enum_decls(self, field):
+	def write_field_accessors(self, reg, field):
+		"""
+		Write "_MASK" and "_SHIFT" macros and static inline get / set / prep
+		helpers of IP-XACT field object. Mask and shift are relative to the
+		C word which contains the register. Helpers are named:
+			<prefix>_<register_name>_<field_name>_get
+			<prefix>_<register_name>_<field_name>_set
+			<prefix>_<register_name>_<field_name>_prep
+		"""
+		wrdType = "uint{}_t".format(self.cWrdWidthBit)
+		suffix = "U"
+		if (self.cWrdWidthBit > 32):
+			suffix = "ULL"
+
+		name = (self.prefix + "_" + self.get_reg_c_name(reg) + "_" + field.name).lower()
+		shift = field.bitOffset + (reg.addressOffset % self.cWrdWidthByte) * 8
+		mask = ((1 << field.bitWidth) - 1) << shift
+		maskName = name.upper() + "_MASK"
+		shiftName = name.upper() + "_SHIFT"
+
+		self.headerGen.write_macro(maskName, hex(mask) + suffix)
+		self.headerGen.write_macro(shiftName, shift)
+
+		# Value of the field within a word
+		self.headerGen.create_inline_function(name + "_get", wrdType,
+			[wrdType + " wrd"],
+			["return (wrd & {}) >> {};".format(maskName, shiftName)])
+
+		# Field value shifted to its position within a word
+		self.headerGen.create_inline_function(name + "_prep", wrdType,
+			[wrdType + " val"],
+			["return (val << {}) & {};".format(shiftName, maskName)])
+
+		# Word with the field replaced by new value
+		self.headerGen.create_inline_function(name + "_set", wrdType,
+			[wrdType + " wrd", wrdType + " val"],
+			["return (wrd & ~{}) | {}_prep(val);".format(maskName, name)])
+
+
+	def write_reg_group_accessors(self, regGroup):
+		"""
+		Write field accessors of group of IP-XACT register objects within the
+		same C word, followed by "_update" helper of the word. Update helper
+		replaces bits selected by mask, so that multiple fields (masks and
+		"_prep" values OR-ed together) are written by single read-modify-write:
+			<joined_name>_update(addr, A_MASK | B_MASK, a_prep(x) | b_prep(y));
+		Update helper is written only when all registers of the word can be
+		read and at least one can be written. Write-only registers can't be
+		read back, so read-modify-write would overwrite their fields.
+		Arguments:
+			regGroup 	List of IP-XACT register objects.
+		"""
+		wrdType = "uint{}_t".format(self.cWrdWidthBit)
+		grpName = self.prefix + "_" + \
+					"_".join([self.get_reg_c_name(reg).lower() for reg in regGroup])
+
+		for reg in regGroup:
+			self.headerGen.write_comment(self.get_reg_c_name(reg).upper(), 0, small=True)
+			for field in sorted(reg.field, key=lambda a: a.bitOffset):
+				self.write_field_accessors(reg, field)
+			self.headerGen.wr_nl()
+
+		readable = all([self.reg_has_access_type(reg, ACCESS_READ)
+						for reg in regGroup])
+		writeable = any([self.reg_has_access_type(reg, ACCESS_WRITE)
+						 for reg in regGroup])
+		if (not readable or not writeable):
+			return
+
+		self.headerGen.create_inline_function(grpName + "_update", "void",
+			["volatile {} *addr".format(wrdType), wrdType + " mask",
+			 wrdType + " val"],
+			["*addr = (*addr & ~mask) | (val & mask);"])
+		self.headerGen.wr_nl()
+
+
+	def create_field_enum_decls(self, enumSet):
 		"""
 		Create declaration objects for enumerated values of IP-XACT field object.
+		Arguments:
+			enumSet		Set of enumerated values of the field (see
+						"get_field_enum_set").
 		"""
 		enum_decls = []
 		
-		if (len(field.enumeratedValues[0].enumeratedValue) > 0):
-			for es in field.enumeratedValues:
-				for (i,e) in enumerate(sorted(es.enumeratedValue, key=lambda x: x.value)):
-					enum_decl = LanDeclaration((e.name).upper(), e.value)
-					enum_decl.intType = "enum"
-					enum_decls.append(enum_decl)
+		for e in enumSet["values"]:
+			enum_decl = LanDeclaration((e.name).upper(), e.value)
+			enum_decl.intType = "enum"
+			enum_decls.append(enum_decl)
 
 		return enum_decls
 
 
+	def get_field_enum_name(self, reg, field):
+		"""
+		Get name of C enum with enumerated values of IP-XACT field object.
+		"""
+		return (self.prefix + "_" + self.get_reg_c_name(reg) + "_" + field.name).lower()
+
+
 	def write_reg_field_enums(self, reg):
 		"""
 		Write enumerated values of all register fields within IP-XACT register
 		object as C enums. Name  of the C enum is:
 			<prefix>_<register_name>_<field_name>
+		Fields with the same enumerated values as an earlier field don't
+		declare their own enum (its values would be redeclared), they refer
+		to the enum of the earlier field.
 		"""
 		for (i,field) in enumerate(sorted(reg.field, key=lambda a: a.bitOffset)):
 
 			# Skip field if there are no enums
-			if (field.enumeratedValues == []):
+			enumSet = self.get_field_enum_set(reg, field)
+			if (enumSet == None):
+				continue
+
+			enum_name = self.get_field_enum_name(reg, field)
+
+			# Refer to the enum of first field with the same enums
+			if (not self.is_enum_set_owner(reg, field)):
+				(ownerReg, ownerField) = enumSet["owner"]
+				self.headerGen.write_comment("{}: see enum {}".format(enum_name,
+					self.get_field_enum_name(ownerReg, ownerField)), 0, small=True)
+				self.headerGen.wr_nl()
 				continue
 
 			# Create declaration objects for each enumerated value of field
-			enum_elements = self.create_field_enum_decls(field)
+			enum_elements = self.create_field_enum_decls(enumSet)
 
 			# Write enum to the output file
-			enum_name = (self.prefix + "_" + reg.name + "_" + field.name).lower()
 			self.headerGen.create_enum(enum_name, enum_elements)
 			self.headerGen.wr_nl()
 
@@ -165,7 +307,7 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		"""
 		Sort list of IP-XACT register objects into groups. Each group is
 		represented by a list. Each list contains registers located within
-		a single memory word.
+		a single C word.
 		"""
 		regGroups = [[]]
 		lowInd = 0
@@ -174,8 +316,8 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		for reg in sorted(regs, key=lambda a: a.addressOffset):
 
 			# We hit the register aligned create new group
-			if (reg.addressOffset >= lowInd + self.wrdWidthByte):
-				lowInd = reg.addressOffset - reg.addressOffset % 4
+			if (reg.addressOffset >= lowInd + self.cWrdWidthByte):
+				lowInd = reg.addressOffset - reg.addressOffset % self.cWrdWidthByte
 				regGroups.append([])
 
 			regGroups[-1].append(reg)
@@ -187,18 +329,24 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 		"""
 		Write registers from IP-XACT registers object into generator output.
 		Following artifacts are written:
-			- union for each memory word with registers
+			- union for each memory word with registers (field accessors
+			  when "field_accessors" is set)
 			- enums for each enumerated values of register fields
 		"""
-		# First sort the registerinto word-aligned groups.
-		regGroups = self.sort_regs_to_wrd_groups(regs)
+		# First sort the registerinto word-aligned groups. Skip elements of
+		# register arrays described by the first element.
+		regGroups = self.sort_regs_to_wrd_groups(
+						[reg for reg in regs if self.is_reg_described(reg)])
 
 		# Write each group
 		for regGroup in regGroups:
 
-			# Create union for each group of registers within a single memory
-			# word.
-			self.write_reg_group_union(regGroup)
+			# Create union (or field accessors) for each group of registers
+			# within a single memory word.
+			if (self.field_accessors):
+				self.write_reg_group_accessors(regGroup)
+			else:
+				self.write_reg_group_union(regGroup)
 
 			# Create enums for fields of registers.
 			for reg in regGroup:
@@ -223,20 +371,56 @@ class HeaderAddrGenerator(IpXactAddrGenerator):
 	def write_mem_map_addr_enum(self):
 		"""
 		Write addresses of registers within "memBlock" IP-XACT memory block as
-		enum to generator output.
+		enum to generator output. Register arrays have single entry with
+		address of the first element, addresses of elements are given by
+		macros (see "write_reg_array_macros").
 		"""
 		cmnt = "{} memory map".format(self.memMap.name)
 		self.headerGen.write_comment(cmnt, 0, small=True)
 		decls = []
+		arrays = []
 		
 		for block in self.memMap.addressBlock:
 			for reg in sorted(block.register, key=lambda a: a.addressOffset):
+				base = self.get_reg_array_base(reg)
+				if (base != None):
+					if (reg.dimIndex != 0):
+						continue
+					arrays.append(reg)
+					reg = base
+
 				decls.append(LanDeclaration((self.prefix + "_" + reg.name).upper(), 
 								value=reg.addressOffset+block.baseAddress,
 								intType="enum"))
 		
 		self.headerGen.create_enum(self.prefix.lower() + "_" + self.memMap.name.lower(),
 										decls)
+
+		for reg in arrays:
+			self.write_reg_array_macros(self.prefix + "_", reg)
+
+
+	def write_reg_array_macros(self, prefix, reg):
+		"""
+		Write macros with number of elements of register array, distance
+		between elements and address of element:
+			<prefix><array_name>_COUNT
+			<prefix><array_name>_STRIDE
+			<prefix><array_name>_ADDR(i)
+		Arguments:
+			prefix		Prefix of macro names, the same as of address enum.
+			reg			First element of the register array.
+		"""
+		name = (prefix + self.get_reg_array_base(reg).name).upper()
+		stride = reg.dimElements[1].addressOffset - reg.addressOffset
+
+		self.headerGen.wr_nl()
+		self.headerGen.write_comment("{} register array".format(
+										self.get_reg_array_base(reg).name), 0)
+		self.headerGen.write_macro(name + "_COUNT", len(reg.dimElements))
+		self.headerGen.write_macro(name + "_STRIDE", hex(stride))
+		self.headerGen.write_macro(name + "_ADDR(i)",
+			"({} + (i) * {}_STRIDE)".format(name, name))
 	
 	
 	def create_addrMap_package(self, name):
@@ -30,11 +30,14 @@
 ## 
 ##	Revision history:
 ##		29.05.2021	First implementation
+##		18.10.2026	Added Linux regmap access tables and register defaults.
+##		18.10.2026	Register arrays described once, addressed by macros.
 ##
 ################################################################################
 
 from abc import ABCMeta, abstractmethod
 from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+from pyXact_generator.ip_xact.addr_generator import ACCESS_READ, ACCESS_WRITE
 
 from pyXact_generator.languages.gen_h import HeaderGenerator
 from pyXact_generator.languages.declaration import LanDeclaration
@@ -45,19 +48,48 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 	headerGen = None
 	prefix	= ""
 
+	# Width of C word type used to access the register map. Words of wider
+	# buses are split to 64 bit C words (largest standard C integer type).
+	cWrdWidthBit = None
+	cWrdWidthByte = None
+
+	# When set to "True" Linux regmap tables are written: readable, writeable,
+	# volatile and precious register ranges and reset defaults of cacheable
+	# registers.
+	regmap_tables = False
+
 	def __init__(self, pyXactComp, memMap, wrdWidthBit):
 		super().__init__(pyXactComp, memMap, wrdWidthBit)
 		self.headerGen = HeaderGenerator()
+		self.cWrdWidthBit = min(self.wrdWidthBit, 64)
+		self.cWrdWidthByte = self.cWrdWidthBit // 8
 
 	def commit_to_file(self):
-		for line in self.headerGen.out :
-			self.of.write(line)
+		self.headerGen.write_output(self.of)
+
+	def get_reg_c_name(self, reg):
+		"""
+		Get name of register used in C identifiers. Elements of register
+		arrays which occupy whole C words are described only once, by the
+		first element named by the register array.
+		"""
+		if self.is_reg_array_compact(reg, self.cWrdWidthByte):
+			return self.get_reg_array_base(reg).name
+		return reg.name
+
+	def is_reg_described(self, reg):
+		"""
+		Check if register has its own field macros. Only the first element of
+		register arrays which occupy whole C words is described.
+		"""
+		return (not self.is_reg_array_compact(reg, self.cWrdWidthByte) or
+				reg.dimIndex == 0)
 
 	def sort_regs_to_wrd_groups(self, regs):
 		"""
 		Sort list of IP-XACT register objects into groups. Each group is
 		represented by a list. Each list contains registers located within
-		a single memory word.
+		a single C word.
 		"""
 		regGroups = [[]]
 		lowInd = 0
@@ -66,8 +98,8 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 		for reg in sorted(regs, key=lambda a: a.addressOffset):
 
 			# We hit the register aligned create new group
-			if (reg.addressOffset >= lowInd + self.wrdWidthByte):
-				lowInd = reg.addressOffset - reg.addressOffset % 4
+			if (reg.addressOffset >= lowInd + self.cWrdWidthByte):
+				lowInd = reg.addressOffset - reg.addressOffset % self.cWrdWidthByte
 				regGroups.append([])
 
 			regGroups[-1].append(reg)
@@ -77,14 +109,24 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 	def write_mem_map_addr_enum(self):
 		"""
 		Write addresses of registers within "memBlock" IP-XACT memory block as
-		enum to generator output.
+		enum to generator output. Register arrays have single entry with
+		address of the first element, addresses of elements are given by
+		macros (see "write_reg_array_macros").
 		"""
 		cmnt = "{} memory map".format(self.memMap.name)
 		self.headerGen.write_comment(cmnt, 0, small=True)
 		decls = []
+		arrays = []
 
 		for block in self.memMap.addressBlock:
 			for reg in sorted(block.register, key=lambda a: a.addressOffset):
+				base = self.get_reg_array_base(reg)
+				if base != None:
+					if reg.dimIndex != 0:
+						continue
+					arrays.append(reg)
+					reg = base
+
 				decls.append(LanDeclaration(("CTUCANFD_" + reg.name).upper(),
 											value=reg.addressOffset + block.baseAddress,
 											intType="enum"))
@@ -92,11 +134,35 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 		self.headerGen.create_enum(self.prefix.lower() + "_" + self.memMap.name.lower(),
 								   decls)
 
+		for reg in arrays:
+			self.write_reg_array_macros("CTUCANFD_", reg)
+		if len(arrays) > 0:
+			self.headerGen.wr_nl()
+
+	def write_reg_array_macros(self, prefix, reg):
+		"""
+		Write macros with number of elements of register array, distance
+		between elements and address of element:
+			<prefix><array_name>_COUNT
+			<prefix><array_name>_STRIDE
+			<prefix><array_name>_ADDR(i)
+		"""
+		name = (prefix + self.get_reg_array_base(reg).name).upper()
+		stride = reg.dimElements[1].addressOffset - reg.addressOffset
+
+		self.headerGen.wr_nl()
+		self.headerGen.write_comment("{} register array".format(
+										self.get_reg_array_base(reg).name), 0)
+		self.headerGen.write_macro(name + "_COUNT", len(reg.dimElements))
+		self.headerGen.write_macro(name + "_STRIDE", hex(stride))
+		self.headerGen.write_macro(name + "_ADDR(i)",
+			"({} + (i) * {}_STRIDE)".format(name, name))
+
 	def write_reg_group(self, reg_group):
 		# Write comment with memory word
 		comment = ""
 		for (j,reg) in enumerate(reg_group):
-			comment = "{} {}".format(comment, reg.name.upper())
+			comment = "{} {}".format(comment, self.get_reg_c_name(reg).upper())
 		comment += " register"
 		if len(reg_group) > 0:
 			comment += "s"
@@ -106,7 +172,7 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 		reg_base_name = ""
 		for (j,reg) in enumerate(reg_group):
 			# Append register name to the union name
-			reg_base_name += reg.name.upper()
+			reg_base_name += self.get_reg_c_name(reg).upper()
 			break
 		reg_base_name = "REG_{}".format(reg_base_name)
 
@@ -116,17 +182,28 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 				# Write address
 				#self.headerGen.write_macro(reg_base_name, hex(reg.addressOffset).upper())
 
+			# Elements of register arrays sharing a word have the same fields,
+			# name them by the element.
+			reg_name = reg_base_name
+			if self.get_reg_array_base(reg) != None and j > 0:
+				reg_name = "REG_{}".format(self.get_reg_c_name(reg).upper())
+
 			for (i, field) in enumerate(sorted(reg.field, key=lambda a: a.bitOffset)):
-				field_name = "{}_{}".format(reg_base_name, field.name)
+				field_name = "{}_{}".format(reg_name, field.name)
 
-				offset = field.bitOffset + (reg.addressOffset % 4) * 8
+				offset = field.bitOffset + (reg.addressOffset % self.cWrdWidthByte) * 8
 				# Single fields -> BIT(INDEX)
 				# Multiple fields -> GENMASK(HIGH, LOW)
+				# 64 bit words -> BIT_ULL, GENMASK_ULL
+				suffix = ""
+				if self.cWrdWidthBit > 32:
+					suffix = "_ULL"
 				field_val = None
 				if field.bitWidth == 1:
-					field_val = "BIT({})".format(offset)
+					field_val = "BIT{}({})".format(suffix, offset)
 				else:
-					field_val = "GENMASK({}, {})".format(offset + field.bitWidth - 1, offset)
+					field_val = "GENMASK{}({}, {})".format(suffix,
+								offset + field.bitWidth - 1, offset)
 
 
 				self.headerGen.write_macro(field_name, field_val)
@@ -143,19 +220,148 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 			self.headerGen.write_comment(block.name + " memory region", 0, small=False)
 			self.headerGen.wr_nl()
 
-			# Sort registers to groups by memory word.
-			reg_groups = self.sort_regs_to_wrd_groups(block.register)
+			# Sort registers to groups by memory word. Skip elements of
+			# register arrays described by the first element.
+			reg_groups = self.sort_regs_to_wrd_groups(
+							[reg for reg in block.register if self.is_reg_described(reg)])
 			for reg_group in reg_groups:
 				self.write_reg_group(reg_group)
 
 			return
 	
+	def get_regmap_wrds(self):
+		"""
+		Collect C words with registers from all register blocks of the memory
+		map. Returns list of tuples (address, registers) sorted by address.
+		"""
+		wrds = []
+		for block in self.memMap.addressBlock:
+
+			# Skip memory blocks.
+			if block.usage == "memory":
+				continue
+
+			for reg_group in self.sort_regs_to_wrd_groups(block.register):
+				if len(reg_group) == 0:
+					continue
+				addr = reg_group[0].addressOffset
+				addr = block.baseAddress + addr - addr % self.cWrdWidthByte
+				wrds.append((addr, reg_group))
+
+		return sorted(wrds, key=lambda a: a[0])
+
+	def calc_regmap_wrd(self, reg_group):
+		"""
+		Calculate regmap properties of C word from registers within the word.
+		Returns dictionary with:
+			"readable"	At least one register can be read.
+			"writeable"	At least one register can be written.
+			"volatile"	Value of the word is changed by hardware (read-only
+						registers, fields with "readAction" or
+						"modifiedWriteValue"), it can't be cached.
+			"precious"	Read of the word has side effects ("readAction").
+			"reset"		Reset value of the word.
+		"""
+		wrd = {"readable" : False, "writeable" : False, "volatile" : False,
+			   "precious" : False, "reset" : 0}
+
+		for reg in reg_group:
+			readable = self.reg_has_access_type(reg, ACCESS_READ)
+			writeable = self.reg_has_access_type(reg, ACCESS_WRITE)
+			wrd["readable"] |= readable
+			wrd["writeable"] |= writeable
+
+			# Registers which can't be written hold status of hardware
+			if readable and not writeable:
+				wrd["volatile"] = True
+
+			for field in reg.field:
+				if field.readAction:
+					wrd["precious"] |= readable
+					wrd["volatile"] = True
+				if field.modifiedWriteValue:
+					wrd["volatile"] = True
+
+			shift = (reg.addressOffset % self.cWrdWidthByte) * 8
+			wrd["reset"] |= self.get_reg_masks(reg)["reset"] << shift
+
+		return wrd
+
+	def calc_regmap_ranges(self, addrs):
+		"""
+		Merge sorted list of word addresses to ranges of consecutive words.
+		Returns list of [first_address, last_address] (both inclusive).
+		"""
+		ranges = []
+		for addr in addrs:
+			if len(ranges) > 0 and ranges[-1][1] + self.cWrdWidthByte == addr:
+				ranges[-1][1] = addr
+			else:
+				ranges.append([addr, addr])
+		return ranges
+
+	def write_regmap_table(self, table_name, addrs):
+		"""
+		Write regmap range array and access table with given word addresses.
+		"""
+		ranges_name = table_name + "_ranges"
+		self.headerGen.wr_line("static const struct regmap_range {}[] __maybe_unused = {{\n"
+							   .format(ranges_name))
+		for (low, high) in self.calc_regmap_ranges(addrs):
+			self.headerGen.wr_line("\tregmap_reg_range({}, {}),\n"
+								   .format(hex(low), hex(high)))
+		self.headerGen.wr_line("};\n")
+		self.headerGen.wr_nl()
+
+		self.headerGen.wr_line("static const struct regmap_access_table {} __maybe_unused = {{\n"
+							   .format(table_name))
+		self.headerGen.wr_line("\t.yes_ranges = {},\n".format(ranges_name))
+		self.headerGen.wr_line("\t.n_yes_ranges = ARRAY_SIZE({}),\n".format(ranges_name))
+		self.headerGen.wr_line("};\n")
+		self.headerGen.wr_nl()
+
+	def write_regmap_tables(self):
+		"""
+		Write Linux regmap tables of the memory map:
+			1. Register stride, value width and highest register address.
+			2. Reset defaults of cacheable (readable, writeable, non-volatile)
+			   words.
+			3. Readable, writeable, volatile and precious access tables.
+		"""
+		name = (self.prefix + "_" + self.memMap.name).lower()
+		wrds = [(addr, self.calc_regmap_wrd(reg_group))
+				for (addr, reg_group) in self.get_regmap_wrds()]
+
+		self.headerGen.write_comment(self.memMap.name + " regmap tables", 0, small=False)
+		self.headerGen.wr_nl()
+
+		self.headerGen.write_macro(name.upper() + "_REG_STRIDE", self.cWrdWidthByte)
+		self.headerGen.write_macro(name.upper() + "_VAL_BITS", self.cWrdWidthBit)
+		if len(wrds) > 0:
+			self.headerGen.write_macro(name.upper() + "_MAX_REGISTER", hex(wrds[-1][0]))
+		self.headerGen.wr_nl()
+
+		self.headerGen.wr_line("static const struct reg_default {}_reg_defaults[] __maybe_unused = {{\n"
+							   .format(name))
+		for (addr, wrd) in wrds:
+			if wrd["readable"] and wrd["writeable"] and not wrd["volatile"]:
+				self.headerGen.wr_line("\t{{ .reg = {}, .def = {} }},\n"
+									   .format(hex(addr), hex(wrd["reset"])))
+		self.headerGen.wr_line("};\n")
+		self.headerGen.wr_nl()
+
+		for table in ["readable", "writeable", "volatile", "precious"]:
+			addrs = [addr for (addr, wrd) in wrds if wrd[table]]
+			self.write_regmap_table("{}_{}_table".format(name, table), addrs)
+
 	def create_addrMap_package(self, name):
 		"""
 		Create C header file package for "memMap" IP-XACT memory block.
 		Package contains for each register within memory block:
 			1. Define with register address offset.
 			2. Defines for each register field.
+		Linux regmap tables of the memory map are appended when
+		"regmap_tables" is set.
 		"""
 		self.headerGen.wr_nl()
 		self.headerGen.write_comment("This file is autogenerated, DO NOT EDIT!", 0, small=True)
@@ -165,6 +371,8 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 		self.headerGen.wr_nl()
 
 		self.headerGen.write_include("linux/bits.h")
+		if self.regmap_tables:
+			self.headerGen.write_include("linux/regmap.h")
 		self.headerGen.wr_nl()
 
 		# Write memory map address enum
@@ -177,4 +385,9 @@ class KernHeaderAddrGenerator(IpXactAddrGenerator):
 			print("Writing kernel header of '%s' register map" % self.memMap.name)
 			self.write_memory_map()
 
+		# Write regmap tables
+		if self.memMap and self.regmap_tables:
+			print("Writing regmap tables of '%s' register map" % self.memMap.name)
+			self.write_regmap_tables()
+
 		self.headerGen.commit_append_line(1)
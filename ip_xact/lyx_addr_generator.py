@@ -31,6 +31,8 @@
 ## 
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		18.10.2026	Register arrays described by single section.
+##		18.10.2026	Text of identical field enums is created only once.
 ##
 ################################################################################
 
@@ -58,19 +60,23 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 	# Top level configuration (parsed from YAML config)
 	config = None
 
+	# Text with enumerated values of fields. Keyed by set of enumerated
+	# values shared by the fields (see "reg_append_short_enums").
+	enumTexts = None
+
 	def __init__(self, pyXactComp, memMap, wrdWidthBit, genRegions=True,
 					genFiDesc=True):
 		super().__init__(pyXactComp, memMap, wrdWidthBit)
 
 		self.lyxGen = LyxGenerator()
+		self.enumTexts = {}
 
 		self.genFieldDesc = str_arg_to_bool(str(genFiDesc))
 		self.genRegions = str_arg_to_bool(str(genRegions))
 	
 
 	def commit_to_file(self):
-		for line in self.lyxGen.out :
-			self.of.write(line)
+		self.lyxGen.write_output(self.of)
 
 
 	def is_reg_present(self, reg):
@@ -96,24 +102,40 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 		return False
 
 
-	def reg_append_short_enums(self, field):
+	def get_doc_reg_name(self, reg):
+		"""
+		Get name of register used in documentation. Elements of register
+		arrays are documented together under name of the register array.
+		"""
+		base = self.get_reg_array_base(reg)
+		if (base != None):
+			return base.name
+		return reg.name
+
+
+	def reg_append_short_enums(self, field, reg):
 		"""
         Create line with enums for given register field. Enum name and description
-        are addedd to each line.
+        are addedd to each line. Text is created only once for all fields with
+        the same enumerated values.
 		"""
-		appendText = ""
-		if (field.enumeratedValues == []):
-			return appendText
+		enumSet = self.get_field_enum_set(reg, field)
+		if (enumSet == None):
+			return ""
 
-		if (len(field.enumeratedValues[0].enumeratedValue) > 0):
-			for es in field.enumeratedValues:
-				for (i,e) in enumerate(sorted(es.enumeratedValue, key=lambda x: x.value)):
-					appendText += "\n\\begin_inset Newline newline\n\\end_inset\n"
-					binSize = "{:0" + "{}".format(field.bitWidth) + "b}"
-					binFmt = binSize.format(e.value)
-					appendText += "		0b{}  - {} - {}".format(binFmt, e.name,
-						e.description)
+		appendText = self.enumTexts.get(id(enumSet))
+		if (appendText != None):
+			return appendText
 
+		appendText = ""
+		binSize = "{:0" + "{}".format(field.bitWidth) + "b}"
+		for e in enumSet["values"]:
+			appendText += "\n\\begin_inset Newline newline\n\\end_inset\n"
+			binFmt = binSize.format(e.value)
+			appendText += "		0b{}  - {} - {}".format(binFmt, e.name,
+				e.description)
+
+		self.enumTexts[id(enumSet)] = appendText
 		return appendText
 
 
@@ -125,7 +147,7 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 		for field in sorted(reg.field, key=lambda a: a.bitOffset):
 			self.lyxGen.insert_layout("Description")
 			descText = field.description
-			descText += self.reg_append_short_enums(field)
+			descText += self.reg_append_short_enums(field, reg)
 			self.lyxGen.wr_line("{} {}\n".format(field.name, descText))
 			self.lyxGen.commit_append_line(1)
 
@@ -133,36 +155,30 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 	def getBit(self, val, bitIndex):
 		"""
 		"""
-		tmp = "{0:032b}".format(val)
-		return tmp[31 - bitIndex]
+		return str((val >> bitIndex) & 1)
 
 
 	def reg_unwrap_fields(self, reg):
 		"""
 		"""
-		retVal = [[], [], [], []]
+		retVal = [[] for i in range(int(reg.size / 8))]
 		subRegIndex = 0
 		highVal = 0
+		masks = self.get_reg_masks(reg)
 		
 		for i in range(0, int(reg.size / 8)):
 			for j in range(0, 8):
 				retVal[i].append([])
 				
-				# Check if such a field exists
-				fieldExist = False
-				for field in sorted(reg.field, key=lambda a: a.bitOffset):
-					tmp = (7 - j) + i * 8
-					if (field.bitOffset <= tmp and
-						field.bitOffset + field.bitWidth > tmp):
-						fieldExist = True
-						break;
+				# Field covering the bit (if any)
+				tmp = (7 - j) + i * 8
+				field = masks["fields"][tmp]
 				
 				# Insert the field or reserved field
-				if (fieldExist):
+				if (field != None):
 					fieldName = field.name
 					if (field.resets != None and field.resets.reset != None):
-						fieldRst = self.getBit(field.resets.reset.value, 
-											tmp - field.bitOffset)
+						fieldRst = self.getBit(masks["reset"], tmp)
 					else:
 						fieldRst = "X"
 					
@@ -244,17 +260,21 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 			- Description
 		"""
 		# Add the Section title
-		self.lyxGen.write_layout_text("Subsection", "{}\n".format(reg.name),
-											label="label")
+		self.lyxGen.write_layout_text("Subsection", "{}\n".format(
+									self.get_doc_reg_name(reg)), label="label")
 		
 		# Register type, address, size and description
 		self.lyxGen.write_layout_text("Description", "Type: {}\n".format(
 											reg.access))
 
-		# Address
+		# Address, register arrays with address of each element
+		offset = "0x{:X}".format(reg.addressOffset + block.baseAddress)
+		if (self.get_reg_array_base(reg) != None):
+			offset += " + i * 0x{:X}, i = 0 .. {}".format(
+						reg.dimElements[1].addressOffset - reg.addressOffset,
+						len(reg.dimElements) - 1)
 		self.lyxGen.write_layout_text("Description", "Offset: {}\n".format(
-									"0x{:X}".format(reg.addressOffset +
-										block.baseAddress)))
+									offset))
 
 		# Size
 		pluralAp = "s" if (reg.size > 8) else ""
@@ -293,6 +313,10 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 			if (self.is_reg_present(reg) == False):
 				continue
 
+			# Register arrays are described once, by the first element
+			if (self.get_reg_array_base(reg) != None and reg.dimIndex != 0):
+				continue
+
 			# Register header
 			self.write_reg_header(block, reg)
 
@@ -365,10 +389,10 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 		"""
 		"""
 		cells = []
-		begOff = int(reg.addressOffset % 4)
+		begOff = int(reg.addressOffset % self.wrdWidthByte)
 		for i in range(begOff, begOff + int(reg.size / 8)):
-			cells += [[row, 3 - i]]
-		text = [reg.name for i in range(self.wrdWidthByte)]
+			cells += [[row, self.wrdWidthByte - 1 - i]]
+		text = [self.get_doc_reg_name(reg) for i in range(self.wrdWidthByte)]
 		self.lyxGen.set_cells_object(table, cells, text)
 		self.lyxGen.set_cells_text_label(table, cells, ["hyperref" for i in
 											range(0, len(cells))])
@@ -380,23 +404,28 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 		self.lyxGen.write_layout_text("Section", "{}\n".format(
 										block.displayName))
 		tableLen = self.calc_block_table_len(block)
-		table = self.lyxGen.build_table(5, tableLen + 1, longTable=True)
+
+		# One column per byte of memory word, last column with address.
+		# Byte columns share the same total width for any word size.
+		addrCol = self.wrdWidthByte
+		table = self.lyxGen.build_table(addrCol + 1, tableLen + 1, longTable=True)
 
 		self.lyxGen.write_layout_text("Standard", block.description)
 
 		# Create the header
-		cells = [[0, i] for i in range(5)]
+		cells = [[0, i] for i in range(addrCol + 1)]
 		text = ["Bits [{}:{}]".format((i + 1) * 8 - 1, i * 8) 
 					for i in reversed(range(0, self.wrdWidthByte))]
 		text += ["Address offset"]
 		self.lyxGen.set_cells_object(table, cells, text)
 
-		self.lyxGen.set_columns_option(table, range(0,4),  
-							[["width", "3cm"]  for j in range(0, 4)])
-		self.lyxGen.set_column_option(table, 4, "width", "1.5cm")
+		colWidth = "{:g}cm".format(12 / self.wrdWidthByte)
+		self.lyxGen.set_columns_option(table, range(0, addrCol),  
+							[["width", colWidth]  for j in range(0, addrCol)])
+		self.lyxGen.set_column_option(table, addrCol, "width", "1.5cm")
 
 		# Pre write the addresses with "..." for reserved fields
-		cells = [[i + 1, 4] for i in range(tableLen)]
+		cells = [[i + 1, addrCol] for i in range(tableLen)]
 		text = ["..." for i in range(tableLen)]
 		self.lyxGen.set_cells_object(table, cells, text)
 
@@ -409,22 +438,22 @@ class LyxAddrGenerator(IpXactAddrGenerator):
 			if (self.is_reg_present(reg) == False):
 				continue;
 
-			regDiff = math.floor(reg.addressOffset / 4) - addr
+			regDiff = math.floor(reg.addressOffset / self.wrdWidthByte) - addr
 			if (regDiff == 1):
 				row += 1
 			elif (regDiff > 1):
 				row += 2
 			addr += regDiff
 			self.write_mem_map_reg_single(table, reg, row)
-			self.lyxGen.set_cell_object(table, row, 4, 
-						"0x{:X}".format(4 * math.floor(reg.addressOffset / 4) +
+			self.lyxGen.set_cell_object(table, row, addrCol, 
+						"0x{:X}".format(self.align_addr_to_wrd(reg.addressOffset) +
 										 block.baseAddress))				
 		
 		self.lyxGen.merge_common_fields(table, [i for i in range(1, tableLen + 1)],
-									endCol=4)
+									endCol=addrCol)
 
 		# Set header color
-		self.lyxGen.set_cells_color(table, [[0, 0], [0, 1], [0, 2], [0, 3], [0, 4]], "gray")
+		self.lyxGen.set_cells_color(table, [[0, i] for i in range(addrCol + 1)], "gray")
 
 		self.lyxGen.insert_table(table)		
 
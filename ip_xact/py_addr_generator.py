@@ -0,0 +1,284 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##
+##   Address map generator to Python module. Module contains addresses,
+##   field masks, reset values and enums of registers as precomputed
+##   constants and dictionaries, so that test harnesses don't need to parse
+##   IP-XACT at startup.
+## 
+##	Revision history:
+##		18.10.2026	First implementation
+##
+################################################################################
+
+from abc import ABCMeta, abstractmethod
+from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+
+from pyXact_generator.languages.gen_py import PythonGenerator
+from pyXact_generator.languages.declaration import LanDeclaration
+
+class PyAddrGenerator(IpXactAddrGenerator):
+
+	pyGen = None
+
+	# Prefix of constant names
+	prefix = ""
+
+	def __init__(self, pyXactComp, memMap, wrdWidthBit):
+		super().__init__(pyXactComp, memMap, wrdWidthBit)
+		self.pyGen = PythonGenerator()
+
+
+	def commit_to_file(self):
+		self.pyGen.write_output(self.of)
+
+
+	def get_const_name(self, *names):
+		"""
+		Create name of module level constant from given name parts.
+		"""
+		name = "_".join(names).upper()
+		if (self.prefix != ""):
+			name = self.prefix.upper() + "_" + name
+		return name
+
+
+	def write_classes(self):
+		"""
+		Write classes of field, register and address block objects.
+		"""
+		self.pyGen.create_structure("Field", [
+			LanDeclaration("name", None, comment="Name of the field"),
+			LanDeclaration("offset", None, comment="Bit offset within register"),
+			LanDeclaration("width", None, comment="Bit width"),
+			LanDeclaration("mask", None, comment="Mask of field bits within register"),
+			LanDeclaration("reset", None, comment="Reset value of the field"),
+			LanDeclaration("enums", None, comment="Enumerated values (name : value)")])
+		self.pyGen.wr_nl()
+		self.pyGen.wr_nl()
+
+		self.pyGen.create_structure("Register", [
+			LanDeclaration("name", None, comment="Name of the register"),
+			LanDeclaration("block", None, comment="Name of address block"),
+			LanDeclaration("address", None, comment="Address within memory map"),
+			LanDeclaration("size", None, comment="Bit size"),
+			LanDeclaration("access", None, comment="IP-XACT access type"),
+			LanDeclaration("reset", None, comment="Reset value of the register"),
+			LanDeclaration("mask", None, comment="Mask of implemented bits"),
+			LanDeclaration("word_address", None, comment="Address of memory word with register"),
+			LanDeclaration("word_shift", None, comment="Bit offset within memory word"),
+			LanDeclaration("fields", None, comment="Fields (name : Field)")])
+		self.pyGen.wr_nl()
+		self.pyGen.wr_nl()
+
+		self.pyGen.create_structure("Block", [
+			LanDeclaration("name", None, comment="Name of the address block"),
+			LanDeclaration("base_address", None, comment="Address within memory map"),
+			LanDeclaration("range", None, comment="Size in bytes"),
+			LanDeclaration("registers", None, comment="Registers of the block")])
+		self.pyGen.wr_nl()
+		self.pyGen.wr_nl()
+
+
+	def write_reg_consts(self, block, reg):
+		"""
+		Write address and reset value of IP-XACT register object and shift
+		and mask of each register field as module level constants.
+		"""
+		masks = self.get_reg_masks(reg)
+
+		self.pyGen.write_decl(LanDeclaration(self.get_const_name(reg.name, "ADDR"),
+							  block.baseAddress + reg.addressOffset))
+		self.pyGen.write_decl(LanDeclaration(self.get_const_name(reg.name, "RESET"),
+							  masks["reset"]))
+
+		for field in sorted(reg.field, key=lambda a: a.bitOffset):
+			self.pyGen.write_decl(LanDeclaration(
+					self.get_const_name(reg.name, field.name, "SHIFT"),
+					field.bitOffset, intType="decimal"))
+			self.pyGen.write_decl(LanDeclaration(
+					self.get_const_name(reg.name, field.name, "MASK"),
+					((1 << field.bitWidth) - 1) << field.bitOffset))
+
+
+	def create_field_args(self, reg, field):
+		"""
+		Create constructor arguments of Field object from IP-XACT field object.
+		"""
+		mask = ((1 << field.bitWidth) - 1) << field.bitOffset
+		reset = (self.get_reg_masks(reg)["reset"] & mask) >> field.bitOffset
+
+		enums = []
+		enumSet = self.get_field_enum_set(reg, field)
+		if (enumSet != None):
+			for e in enumSet["values"]:
+				enums.append(('"{}"'.format(e.name), hex(e.value)))
+
+		return ['"{}"'.format(field.name), str(field.bitOffset),
+				str(field.bitWidth), hex(mask), hex(reset),
+				self.pyGen.format_dict(enums, inline=True)]
+
+
+	def write_reg_object(self, block, reg):
+		"""
+		Write Register object of IP-XACT register object with its fields.
+		"""
+		masks = self.get_reg_masks(reg)
+		address = block.baseAddress + reg.addressOffset
+		wrdAddress = address - address % self.wrdWidthByte
+
+		fields = []
+		for field in sorted(reg.field, key=lambda a: a.bitOffset):
+			fields.append(('"{}"'.format(field.name), "Field({})".format(
+							", ".join(self.create_field_args(reg, field)))))
+
+		self.pyGen.create_instance(reg.name.upper(), "Register", [
+			'"{}"'.format(reg.name), '"{}"'.format(block.name),
+			hex(address), str(reg.size), '"{}"'.format(reg.access),
+			hex(masks["reset"]), hex(masks["implemented"]), hex(wrdAddress),
+			str((address % self.wrdWidthByte) * 8),
+			self.pyGen.format_dict(fields)])
+
+
+	def write_mem_map_consts(self):
+		"""
+		Write constants of all registers within the memory map.
+		"""
+		for block in self.memMap.addressBlock:
+
+			# Skip memory blocks.
+			if (block.usage == "memory"):
+				continue
+
+			self.pyGen.write_comment("{} address block".format(block.name), 0)
+			for reg in sorted(block.register, key=lambda a: a.addressOffset):
+				self.write_reg_consts(block, reg)
+			self.pyGen.wr_nl()
+
+
+	def format_tuple(self, names):
+		"""
+		Format tuple literal with given names.
+		"""
+		return "({},)".format(", ".join(names))
+
+
+	def write_mem_map_objects(self):
+		"""
+		Write Register and Block objects of all registers and address blocks
+		within the memory map and dictionaries indexing them:
+			BLOCKS		Block name -> Block
+			REGISTERS	Register name -> Register
+			ADDRESSES	Register address -> Register
+			WORDS		Memory word address -> tuple of Registers in the word
+			ARRAYS		Register array name -> tuple of its elements
+		"""
+		blocks = []
+		regs = []
+
+		for block in self.memMap.addressBlock:
+
+			# Skip memory blocks.
+			if (block.usage == "memory"):
+				continue
+
+			blockRegs = sorted(block.register, key=lambda a: a.addressOffset)
+			for reg in blockRegs:
+				self.write_reg_object(block, reg)
+				regs.append((block, reg))
+			self.pyGen.wr_nl()
+
+			blockName = self.get_const_name(block.name, "BLOCK")
+			self.pyGen.create_instance(blockName, "Block", [
+				'"{}"'.format(block.name), hex(block.baseAddress),
+				hex(block.range), self.format_tuple(
+					[reg.name.upper() for reg in blockRegs])])
+			self.pyGen.wr_nl()
+			blocks.append((block, blockName))
+
+		self.pyGen.create_dict("BLOCKS", [('"{}"'.format(block.name), name)
+							   for (block, name) in blocks])
+		self.pyGen.wr_nl()
+
+		self.pyGen.create_dict("REGISTERS", [('"{}"'.format(reg.name),
+							   reg.name.upper()) for (block, reg) in regs])
+		self.pyGen.wr_nl()
+
+		self.pyGen.create_dict("ADDRESSES", [
+							   (hex(block.baseAddress + reg.addressOffset),
+							   reg.name.upper()) for (block, reg) in regs])
+		self.pyGen.wr_nl()
+
+		words = {}
+		for (block, reg) in regs:
+			address = block.baseAddress + reg.addressOffset
+			words.setdefault(address - address % self.wrdWidthByte, []).append(reg)
+
+		self.pyGen.create_dict("WORDS", [(hex(address), self.format_tuple(
+							   [reg.name.upper() for reg in words[address]]))
+							   for address in sorted(words)])
+		self.pyGen.wr_nl()
+
+		arrays = [reg for (block, reg) in regs
+				  if self.get_reg_array_base(reg) != None and reg.dimIndex == 0]
+		self.pyGen.create_dict("ARRAYS", [
+							   ('"{}"'.format(self.get_reg_array_base(reg).name),
+							   self.format_tuple([element.name.upper()
+												  for element in reg.dimElements]))
+							   for reg in arrays])
+
+
+	def create_addrMap_package(self, name):
+		"""
+		Create Python module for "memMap" IP-XACT memory map. Module contains:
+			1. Memory word width.
+			2. Address and reset value constants of each register, shift and
+			   mask constants of each register field.
+			3. Field, Register and Block classes and their objects.
+			4. Dictionaries indexing the objects by name and address.
+		"""
+		self.pyGen.write_comment("This file is autogenerated, DO NOT EDIT!", 0)
+		self.pyGen.wr_nl()
+		self.pyGen.create_package("{} register map ({})".format(name,
+									self.memMap.name))
+		self.pyGen.wr_nl()
+
+		self.pyGen.write_decl(LanDeclaration("WORD_WIDTH", self.wrdWidthBit,
+							  alignLen=0, intType="decimal"))
+		self.pyGen.wr_nl()
+		self.pyGen.wr_nl()
+
+		self.write_classes()
+
+		if (self.memMap):
+			print("Writing constants of '%s' register map" % self.memMap.name)
+			self.write_mem_map_consts()
+			self.pyGen.wr_nl()
+
+			print("Writing objects of '%s' register map" % self.memMap.name)
+			self.write_mem_map_objects()
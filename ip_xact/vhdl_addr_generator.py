@@ -33,6 +33,7 @@
 ##		25.01.2018	First implementation
 ##      25.11.2018  Merged Address and field Maps into single map
 ##      16.03.2019  Add list of registers within a memory map.
+##      18.10.2026  Identical enumerated values are declared only once.
 ##
 ################################################################################
 
@@ -55,32 +56,41 @@ class VhdlAddrGenerator(IpXactAddrGenerator):
 		""" 
 		Commit the generator output into the output file.
 		"""
-		for line in self.vhdlGen.out :
-			self.of.write(line)
+		self.vhdlGen.write_output(self.of)
 
 
-	def write_reg_enums(self, field):
+	def write_reg_enums(self, field, reg):
 		""" 
 		Write IP-XACT register object enums as VHDL constants (std_logic) to the
-		generator output.
+		generator output. Constants of enumerated values shared by multiple
+		fields are written only for the first of them, other fields refer to it.
 		Arguments:
 			field		Register field object (parsed from pyXact) whose 
 						enums to write.
+			reg			Register object to which the field belongs.
 		"""
-		if (field.enumeratedValues == []):
+		enumSet = self.get_field_enum_set(reg, field)
+		if (enumSet == None):
 			return False
 		
 		self.vhdlGen.wr_nl()
+		if (not self.is_enum_set_owner(reg, field)):
+			(ownerReg, ownerField) = enumSet["owner"]
+			self.vhdlGen.write_comment('"{}" field enumerated values: same as '
+							'"{}" field of {} register'.format(field.name,
+							ownerField.name, ownerReg.name.upper()), 2, small=True)
+			return True
+
 		self.vhdlGen.write_comment('"{}" field enumerated values'.format(
 								field.name), 2, small=True)
-		for es in field.enumeratedValues:
-			for e in sorted(es.enumeratedValue, key=lambda x: x.value):
-				decl = LanDeclaration(e.name, e.value)
-				decl.type = "std_logic"
-				decl.bitWidth = field.bitWidth
-				decl.specifier = "constant"
-				decl.alignLen = 50
-				self.vhdlGen.write_decl(decl)
+		for e in enumSet["values"]:
+			decl = LanDeclaration(e.name, e.value)
+			decl.type = "std_logic"
+			decl.bitWidth = field.bitWidth
+			decl.specifier = "constant"
+			decl.alignLen = 50
+			self.vhdlGen.write_decl(decl)
+		return True
 
 		
 	def write_res_vals(self, field):
@@ -157,7 +167,7 @@ class VhdlAddrGenerator(IpXactAddrGenerator):
 		#Write the enums (iterate separately not to mix up fields and enums)
 		if (writeEnums == True):
 			for field in reg.field:
-				self.write_reg_enums(field)
+				self.write_reg_enums(field, reg)
 			self.vhdlGen.wr_nl()
 		
 		#Write reset values for each field
@@ -31,6 +31,7 @@
 ##
 ##	Revision history:
 ##		7.10.2018	First implementation
+##		18.10.2026	Register arrays generated by "for generate" loops.
 ##
 ################################################################################
 
@@ -38,9 +39,11 @@ import math
 import os
 import sys
 import copy
+import hashlib
 
 from abc import ABCMeta, abstractmethod
 from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+from pyXact_generator.ip_xact.addr_generator import ACCESS_READ, ACCESS_WRITE
 
 from pyXact_generator.gen_lib import *
 
@@ -55,6 +58,7 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 	# Paths of VHDL templates
 	template_sources = {}
 	template_sources["addr_dec_template_path"] = "templates/address_decoder.vhd"
+	template_sources["addr_dec_hier_template_path"] = "templates/address_decoder_hier.vhd"
 
 	template_sources["reg_rw_template_path"] = "templates/memory_reg_rw.vhd"
 	template_sources["reg_rw_lock_template_path"] = "templates/memory_reg_rw_lock.vhd"
@@ -68,8 +72,30 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 
 	of_pkg = None
 
+	# Number of register stages inserted into read data multiplexor. When 0,
+	# read data are selected by single multiplexor followed by output register.
+	# Each stage splits the multiplexor to one more level and adds one clock
+	# cycle of read latency. Valid read data are then signalled by
+	# "r_data_valid" output.
+	read_pipeline_stages = 0
+
+	# Use hierarchical address decoder. High address bits select a group of
+	# words, low bits select a word within the group. Blocks with less than
+	# 2 address bits always use flat address decoder.
+	addr_dec_hierarchical = False
+
+	# Register output of address decoder. Memory bus signals (cs, read, write,
+	# be, w_data) are registered too, so that they stay aligned with register
+	# selector. Writes to registers then take effect one clock cycle later.
+	addr_dec_registered = False
+
+	# Steps between word indices of consecutive elements of register arrays
+	# generated by "for generate" loops. Keyed by register array.
+	regArraySteps = None
+
 	def __init__(self, pyXactComp, memMap, wrdWidth):
 		super().__init__(pyXactComp, memMap, wrdWidth)
+		self.regArraySteps = {}
 
 		# By default VHDL generator is used
 		self.hdlGen = VhdlGenerator()
@@ -86,10 +112,92 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		"""
 		Commit the generator output into the output file.
 		"""
-		for line in self.hdlGen.out :
-			self.of.write(line)
+		self.hdlGen.write_output(self.of)
+		self.hdlGen.clear_output()
+
+
+	def calc_template_fingerprint(self):
+		"""
+		Calculate fingerprint (SHA-256 hex digest) of content of all VHDL
+		templates the register map is generated from.
+		"""
+		items = []
+		for templ_name in sorted(self.template_sources):
+			path = os.path.join(ROOT_PATH, self.template_sources[templ_name])
+			items.append([templ_name, hash_file(path).hex()])
+
+		return hashlib.sha256(repr(items).encode()).hexdigest()
+
+
+	def calc_reg_array_step(self, block, reg):
+		"""
+		Calculate step between indices of memory words (see "get_wrd_index")
+		of consecutive elements of register array. Returns None if register
+		is not an element of register array which can be generated by
+		"for generate" loop: elements must occupy whole memory words and
+		their word indices must be equally spaced.
+		"""
+		base = self.get_reg_array_base(reg)
+		if (base == None):
+			return None
+
+		if (id(base) in self.regArraySteps):
+			return self.regArraySteps[id(base)]
+
+		step = None
+		elements = reg.dimElements
+		if (self.is_reg_array_compact(reg, self.wrdWidthByte)):
+			indices = [self.get_wrd_index(block, element) for element in elements]
+			step = indices[1] - indices[0]
+			for i in range(1, len(indices)):
+				if (indices[i] - indices[i - 1] != step):
+					step = None
+					break
+
+		self.regArraySteps[id(base)] = step
+		return step
+
+
+	def get_reg_label(self, block, reg):
+		"""
+		Get name of register used in labels and comments. Elements of register
+		arrays generated by loop are named by the register array.
+		"""
+		if (self.calc_reg_array_step(block, reg) != None):
+			return self.get_reg_array_base(reg).name
+		return reg.name
+
+
+	def format_reg_record_entry(self, block, record, reg, entry, index=None):
+		"""
+		Format reference to entry of register record:
+			<record>.<reg_name>_<entry>
+		Entries of register arrays generated by loop are arrays indexed by
+		element index, or by "index" (loop variable) when given.
+		"""
+		ref = "{}.{}_{}".format(record, self.get_reg_label(block, reg), entry)
+		if (self.calc_reg_array_step(block, reg) != None):
+			if (index == None):
+				index = reg.dimIndex
+			ref = self.hdlGen.format_vector_index(ref, index)
+		return ref.lower()
 
-		self.hdlGen.out = []
+
+	def format_reg_sel(self, block, reg, index=None):
+		"""
+		Format address decoder output which selects memory word with register.
+		Within loop of register array, word index is calculated from loop
+		variable "index".
+		"""
+		reg_sel_index = self.get_wrd_index(block, reg) - 1
+		if (index != None):
+			step = self.calc_reg_array_step(block, reg)
+			if (step == 1):
+				reg_sel_index = "{} + {}".format(reg_sel_index, index)
+			else:
+				reg_sel_index = "{} + {} * {}".format(reg_sel_index, index, step)
+
+		return self.hdlGen.format_vector_index("reg_sel", reg_sel_index)
 
 
 	def create_reg_ports(self, block, signDict):
@@ -132,27 +240,23 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		Calculate address vector value for address decoder for reach register
 		word.
 		"""
-		vect_val = ""
+		vect_vals = []
 		addr_entry_width = self.calc_wrd_address_width(block)
 
-		# Check if register is present on a given word, if yes, append it to the
-		# vector.
+		# Append address of each word with registers to the vector. Words
+		# with no registers are skipped.
 		[low_addr, high_addr] = self.calc_blk_wrd_span(block)
-		high_addr += self.wrdWidthByte
-
-		for wrd_addr in range(low_addr, high_addr, self.wrdWidthByte):
-			regs_in_wrd = self.get_regs_from_word(wrd_addr, block)
+		regs_in_wrd = self.get_blk_wrd_layout(block)["regs_in_wrd"]
 
-			# Word with no registers can be skipped, nothing is appended to
-			# address vector
-			if (not regs_in_wrd):
-				continue;
+		for wrd_addr in sorted(regs_in_wrd):
+			if (wrd_addr < low_addr or wrd_addr > high_addr):
+				continue
 
-			# Append address vector value
-			shifted_val = int(wrd_addr / self.wrdWidthByte)
-			vect_val = str("{:06b}".format(shifted_val)) + vect_val
+			shifted_val = wrd_addr // self.wrdWidthByte
+			vect_vals.append("{:0{}b}".format(shifted_val, addr_entry_width))
 
-		return vect_val
+		# First word is on the lowest bits of the vector
+		return "".join(reversed(vect_vals))
 
 
 	def create_addr_vect_decl(self, block, signDict):
@@ -213,6 +317,30 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		signDict["read_mux_ena"].specifier = "signal"
 
 
+	def get_bus_signal(self, name):
+		"""
+		Return name of memory bus signal aligned with output of address decoder
+		(register selector). If address decoder output is registered, memory
+		bus signals are registered too.
+		"""
+		if (self.addr_dec_registered):
+			return name + "_q"
+		return name
+
+
+	def create_bus_signal_q_decls(self, signDict):
+		"""
+		Create declarations of registered memory bus signals.
+		"""
+		for [name, width] in [["cs", 1], ["read", 1], ["write", 1],
+							  ["be", self.wrdWidthByte], ["w_data", self.wrdWidthBit]]:
+			name = self.get_bus_signal(name)
+			signDict[name] = LanDeclaration(name, value = None)
+			signDict[name].type = "std_logic"
+			signDict[name].bitWidth = width
+			signDict[name].specifier = "signal"
+
+
 	def create_write_en_int_decl(self, signDict):
 		"""
 		Create declaration of internal write enable signal gated by byte enables
@@ -258,6 +386,15 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Create declaration of internal write enable
 		self.create_write_en_int_decl(signDict)
 
+		# Create declarations of read data pipeline
+		if (self.read_pipeline_stages > 0):
+			self.create_read_pipeline_decls(block, signDict)
+
+		# Create declarations of memory bus signals aligned with registered
+		# address decoder
+		if (self.addr_dec_registered):
+			self.create_bus_signal_q_decls(signDict)
+
 
 	def create_read_wrd_from_regs(self, regs_in_wrd, block, is_last):
 		"""
@@ -268,30 +405,25 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		i = self.wrdWidthBit - 1
 		prev_padding = False
 
+		# Only readable registers are placed to read word
+		masks = self.calc_wrd_masks([reg for reg in regs_in_wrd
+									 if self.reg_has_access_type(reg, ACCESS_READ)])
+
 		while (i >= 0):
-			is_padding = True
+			is_padding = ((masks["readable"] >> i) & 1) == 0
 			index_placed = False
 
-			for reg in regs_in_wrd:
-				# Skip registers which are not readable
-				if (not (self.reg_has_access_type(reg, ["read"]))):
-					continue
-
-				for field in sorted(reg.field, key=lambda a: a.bitOffset):
-					field_low = field.bitOffset + ((reg.addressOffset % 4) * 8)
-					field_high = field.bitOffset + ((reg.addressOffset % 4) * 8) + field.bitWidth - 1
-					if field_low == i:
-						if self.reg_is_access_type(reg, ["read-write"]):
-							suffix = "_out_i."
-						else:
-							suffix = "_in."
-						read_wrd += str("\n        " + block.name + suffix + reg.name + "_" + field.name).lower()
-						index_placed = True
-
-					# Search if the bit has no field
-					for ifield in sorted(reg.field, key=lambda a: a.bitOffset):
-						if ((i >= field_low) and (i <= field_high)):
-							is_padding = False
+			# Place field which starts at this bit
+			if (masks["fields"][i] != None):
+				(reg, field) = masks["fields"][i]
+				if (field.bitOffset + (reg.addressOffset % self.wrdWidthByte) * 8 == i):
+					if self.reg_is_access_type(reg, ACCESS_READ | ACCESS_WRITE):
+						record = block.name + "_out_i"
+					else:
+						record = block.name + "_in"
+					read_wrd += "\n        " + self.format_reg_record_entry(
+									block, record, reg, field.name)
+					index_placed = True
 
 			if is_padding:
 				if not prev_padding:
@@ -321,11 +453,39 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		return [addr_hind, addr_lind]
 
 
+	def create_bus_signal_q_regs(self):
+		"""
+		Create register of memory bus signals, aligned with registered output
+		of address decoder.
+		"""
+		names = ["cs", "read", "write", "be", "w_data"]
+
+		self.hdlGen.write_comment("Memory bus signals aligned with address decoder", gap = 4)
+		self.hdlGen.wr_line(f"    bus_signal_reg_proc : process(res_n, clk_sys)\n")
+		self.hdlGen.wr_line(f"    begin\n")
+		self.hdlGen.wr_line(f"        if (res_n = '0') then\n")
+		for name in names[:3]:
+			self.hdlGen.wr_line(f"            {self.get_bus_signal(name)} <= '0';\n")
+		for name in names[3:]:
+			self.hdlGen.wr_line(f"            {self.get_bus_signal(name)} <= (others => '0');\n")
+		self.hdlGen.wr_line(f"        elsif (rising_edge(clk_sys)) then\n")
+		for name in names:
+			self.hdlGen.wr_line(f"            {self.get_bus_signal(name)} <= {name};\n")
+		self.hdlGen.wr_line(f"        end if;\n")
+		self.hdlGen.wr_line(f"    end process;\n\n")
+
+
 	def create_write_en_assign(self):
 		"""
 		"""
+		if (self.addr_dec_registered):
+			self.create_bus_signal_q_regs()
+
+		be = self.get_bus_signal("be")
+		write = self.get_bus_signal("write")
+		cs = self.get_bus_signal("cs")
 		self.hdlGen.create_signal_connection("write_en",
-						"be when (write = '1' and cs = '1') else (others => '0')", gap=4)
+						f"{be} when ({write} = '1' and {cs} = '1') else (others => '0')", gap=4)
 		self.hdlGen.wr_line("\n")
 
 
@@ -333,7 +493,13 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		"""
         Create instance of address decoder for writable registers.
 		"""
-		path = os.path.join(ROOT_PATH, self.template_sources["addr_dec_template_path"])
+		addr_width = self.calc_wrd_address_width(block)
+		hierarchical = self.addr_dec_hierarchical and addr_width >= 2
+
+		template = "addr_dec_template_path"
+		if (hierarchical):
+			template = "addr_dec_hier_template_path"
+		path = os.path.join(ROOT_PATH, self.template_sources[template])
 
 		addr_dec = self.hdlGen.load_entity_template(path)
 		addr_dec.isInstance = True
@@ -341,10 +507,17 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		addr_dec.gap = 2
 
 		# Connect generics
-		addr_dec.generics["address_width"].value = self.calc_wrd_address_width(block)
+		addr_dec.generics["address_width"].value = addr_width
 		addr_dec.generics["address_entries"].value = self.calc_blk_wrd_count(block)
 		addr_dec.generics["addr_vect"].value = "ADDR_VECT"
-		addr_dec.generics["registered_out"].value = "false"
+		if (self.addr_dec_registered):
+			addr_dec.generics["registered_out"].value = "true"
+		else:
+			addr_dec.generics["registered_out"].value = "false"
+
+		# Low half of address bits is decoded within a group
+		if (hierarchical):
+			addr_dec.generics["low_width"].value = (addr_width + 1) // 2
 
 		# Connect ports
 		addr_dec.ports["clk_sys"].value = "clk_sys"
@@ -375,9 +548,10 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		Create byte enable vector for a register. Position of register within
 		a memory word is considered.
 		"""
-		l_be_ind = reg.addressOffset % 4
+		l_be_ind = reg.addressOffset % self.wrdWidthByte
 		h_be_ind = l_be_ind + int(reg.size / 8) - 1
-		return self.hdlGen.format_vector_range("be", h_be_ind, l_be_ind)
+		return self.hdlGen.format_vector_range(self.get_bus_signal("be"),
+												h_be_ind, l_be_ind)
 
 
 	def fill_reg_inst_generics(self, reg, field, reg_inst):
@@ -400,9 +574,10 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		reg_inst.generics["reset_value"].value = '"' + rst_str + '"'
 
 
-	def fill_reg_ports(self, block, reg, field, reg_inst):
+	def fill_reg_ports(self, block, reg, field, reg_inst, index=None):
 		"""
-		Fill ports for register instance from IP-XACT register object
+		Fill ports for register instance from IP-XACT register object.
+		"index" is loop variable when register array is generated by loop.
 		"""
 		reg_inst.ports["clk_sys"].value = "clk_sys"
 		reg_inst.ports["res_n"].value = "res_n"
@@ -413,8 +588,8 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		#	reg_name = reg.name
 		#else:
 
-		reg_name = reg.name + "_" + field.orig_name
-		reg_value = block.name + "_out_i." + reg_name
+		reg_value = self.format_reg_record_entry(block, block.name + "_out_i",
+												 reg, field.orig_name, index)
 
 		if field.bitWidth == 1:
 			reg_inst.ports["reg_value"].name += "(0)"
@@ -429,21 +604,22 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		reg_inst.ports["reg_value"].value = reg_value.lower()
 
 		# Calculate data input indices within a memory word
-		start_bit = (reg.addressOffset % 4) * 8
+		start_bit = (reg.addressOffset % self.wrdWidthByte) * 8
 		l_ind = start_bit + field.bitOffset
 		h_ind = start_bit + field.bitWidth + field.bitOffset - 1
-		reg_inst.ports["data_in"].value = "w_data({} downto {})".format(h_ind, l_ind)
+		reg_inst.ports["data_in"].value = "{}({} downto {})".format(
+											self.get_bus_signal("w_data"), h_ind, l_ind)
 
 		# Calculate write enable position
-		write_en_bit = (reg.addressOffset % 4) + int(field.bitOffset/8)
+		write_en_bit = (reg.addressOffset % self.wrdWidthByte) + int(field.bitOffset/8)
 		reg_inst.ports["write"].value = "write_en({})".format(write_en_bit)
 
-		reg_sel_index = self.get_wrd_index(block, reg) - 1
-		reg_inst.ports["cs"].value = self.hdlGen.format_vector_index("reg_sel", reg_sel_index)
+		reg_inst.ports["cs"].value = self.format_reg_sel(block, reg, index)
 
 		# Connect lock signal to lockable registers
-		if (self.get_reg_lock(reg)[0] == "true"):
-			reg_inst.ports["lock"].value = self.get_reg_lock(reg)[2]
+		regLock = self.get_reg_lock(reg)
+		if (regLock[0] == "true"):
+			reg_inst.ports["lock"].value = regLock[2]
 
 
 	def split_reg_fields(self, reg):
@@ -511,17 +687,20 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		return split_fields
 
 
-	def create_reg_instance(self, block, reg):
+	def create_reg_instance(self, block, reg, index=None):
 		"""
 		Create register instance from IP-XACT register object. If "isPresent" property
         is set, parameter name is searched in IP-XACT input and it's name is used
-        as generic condition for register presence.
+        as generic condition for register presence. "index" is loop variable
+        when register array is generated by loop.
 		"""
+		reg_name = self.get_reg_label(block, reg)
+
 		# Write conditional generic expression if register isPresent property
 		# depends on IP-XACT Parameter
 		if (reg.isPresent != ""):
 			paramName = self.parameter_lookup(reg.isPresent)
-			self.hdlGen.create_if_generate(reg.name + "_present_gen_t",
+			self.hdlGen.create_if_generate(reg_name + "_present_gen_t",
 				paramName.upper(), "true", gap=4)
 
 		# Split fields if they span multiple bytes to at most 8-bit register instances
@@ -544,15 +723,15 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 			reg_inst = self.hdlGen.load_entity_template(path)
 			reg_inst.isInstance = True
 			reg_inst.intType = "entity"
-			reg_inst.value = reg.name.lower() + "_" + field.name.lower() + "_reg_comp"
+			reg_inst.value = reg_name.lower() + "_" + field.name.lower() + "_reg_comp"
 
-			self.hdlGen.write_comment(reg.name.upper() + "[" + field.name.upper() + "]", gap = 4)
+			self.hdlGen.write_comment(reg_name.upper() + "[" + field.name.upper() + "]", gap = 4)
 
 			# Fill generics of reg map component
 			self.fill_reg_inst_generics(reg, field, reg_inst)
 
 			# Fill Ports of reg map component
-			self.fill_reg_ports(block, reg, field, reg_inst)
+			self.fill_reg_ports(block, reg, field, reg_inst, index)
 
 			# Format register instances and print it
 			self.hdlGen.format_entity_decl(reg_inst)
@@ -564,7 +743,7 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		if (reg.isPresent != ""):
 			self.hdlGen.commit_append_line(1)
 			self.hdlGen.wr_line("\n")
-			self.hdlGen.create_if_generate(reg.name + "_present_gen_f",
+			self.hdlGen.create_if_generate(reg_name + "_present_gen_f",
 				paramName.upper(), "false", gap=4)
 
 			#rst_val = self.calc_reg_rstval_mask(reg)
@@ -572,7 +751,8 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 				# TODO: This is hard-coded for current CTU CAN FD!
 				#		Takes into acocunt only FILTER registers, not arbitrary reset value!
 				self.hdlGen.create_signal_connection(
-					(block.name + "_out_i." + reg.name + "_" + field.name).lower(), "(others => '0')", gap = 8)
+					self.format_reg_record_entry(block, block.name + "_out_i",
+						reg, field.name, index), "(others => '0')", gap = 8)
 
 			self.hdlGen.commit_append_line(1)
 			self.hdlGen.wr_line("\n")
@@ -586,48 +766,50 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		signaller_inst.generics["data_width"].value = reg.size
 
 
-	def fill_access_signaller_ports(self, block, reg, signaller_inst):
+	def fill_access_signaller_ports(self, block, reg, signaller_inst, index=None):
 		"""
 		Fill ports for VHDL access signaller instance from IP-XACT register
-		object.
+		object. "index" is loop variable when register array is generated by
+		loop.
 		"""
 		signaller_inst.ports["clk_sys"].value = "clk_sys"
 		signaller_inst.ports["res_n"].value = "res_n"
 
 		# Get word index from address decoder
-		reg_sel_index = self.get_wrd_index(block, reg) - 1
-		signaller_inst.ports["cs"].value = \
-			self.hdlGen.format_vector_index("reg_sel", reg_sel_index)
+		signaller_inst.ports["cs"].value = self.format_reg_sel(block, reg, index)
 
 		# Connect memory bus signals
-		signaller_inst.ports["read"].value = "read"
+		signaller_inst.ports["read"].value = self.get_bus_signal("read")
 		signaller_inst.ports["be"].value = self.calc_reg_byte_enable_vector(reg)
 
 		# Connect read access signalling
 		rd_signal = "open"
 		if (self.is_reg_read_indicate(reg)):
-			rd_signal = (block.name + "_out_i." + reg.name + "_read").lower()
+			rd_signal = self.format_reg_record_entry(block, block.name + "_out_i",
+													 reg, "read", index)
 		signaller_inst.ports["read_signal"].value = rd_signal
 
 
-	def create_access_signaller(self, block, reg):
+	def create_access_signaller(self, block, reg, index=None):
 		"""
 		Create access signaller components for registers which have this feature
-		enabled.
+		enabled. "index" is loop variable when register array is generated by
+		loop.
 		"""
+		reg_name = self.get_reg_label(block, reg)
 		path = os.path.join(ROOT_PATH, self.template_sources["access_signaller_template_path"])
 		signaller_inst = self.hdlGen.load_entity_template(path)
 		signaller_inst.isInstance = True
 		signaller_inst.intType = "entity"
-		signaller_inst.value = reg.name.lower() + "_access_signaller_comp"
+		signaller_inst.value = reg_name.lower() + "_access_signaller_comp"
 
 		# Fill generic values of access signaller
 		self.fill_access_signaller_generics(reg, signaller_inst)
 
 		# Fill ports of access signaller
-		self.fill_access_signaller_ports(block, reg, signaller_inst)
+		self.fill_access_signaller_ports(block, reg, signaller_inst, index)
 
-		self.hdlGen.write_comment(reg.name.upper() + " access signallization", gap = 4)
+		self.hdlGen.write_comment(reg_name.upper() + " access signallization", gap = 4)
 
 		# Create component of signaller
 		self.hdlGen.format_entity_decl(signaller_inst)
@@ -637,16 +819,36 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 	def create_write_reg_instances(self, block):
 		"""
 		Create VHDL instance for each writable register in a memory block.
+		Elements of register arrays are created by single "for generate" loop
+		when possible.
 		"""
 		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
 
+			if (not (self.reg_has_access_type(reg, ACCESS_WRITE) or
+					 self.is_reg_write_indicate(reg) or
+					 self.is_reg_read_indicate(reg))):
+				continue
+
+			index = None
+			if (self.calc_reg_array_step(block, reg) != None):
+				if (reg.dimIndex != 0):
+					continue
+				index = "i"
+				reg_name = self.get_reg_label(block, reg)
+				self.hdlGen.create_for_generate(reg_name.lower() + "_gen", index,
+												[0, len(reg.dimElements) - 1], gap=4)
+
 			# Create register instances for writable registers
-			if (self.reg_has_access_type(reg, ["write"])):
-				self.create_reg_instance(block, reg)
+			if (self.reg_has_access_type(reg, ACCESS_WRITE)):
+				self.create_reg_instance(block, reg, index)
 
 			# Create access signalling for registers which have access signalling enabled
 			if (self.is_reg_write_indicate(reg) or self.is_reg_read_indicate(reg)):
-				self.create_access_signaller(block, reg)
+				self.create_access_signaller(block, reg, index)
+
+			if (index != None):
+				self.hdlGen.commit_append_line(1)
+				self.hdlGen.wr_nl()
 
 
 	def create_read_data_logic(self, block):
@@ -656,7 +858,11 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 			- Byte enable masking
 			- Output register
 		"""
-		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ["read"])
+		if (self.read_pipeline_stages > 0):
+			self.create_read_data_pipeline(block)
+			return
+
+		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ACCESS_READ)
 		high_addr += self.wrdWidthByte
 
 		self.hdlGen.write_comment("Read data multiplexor", gap = 4)
@@ -673,7 +879,7 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 				is_last = True
 			wrd_value = self.create_read_wrd_from_regs(regs_in_wrd, block, is_last)
 
-			addr >>= int(math.log2(self.wrdWidthByte))
+			addr >>= self.calc_addr_width_from_size(self.wrdWidthByte)
 			self.hdlGen.wr_line(wrd_value + f' when "{addr:0{high_addr_bit-low_addr_bit+1}b}",' )
 
 		self.hdlGen.wr_line(f"\n        (others => '0') when others;\n\n")
@@ -691,6 +897,192 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		self.hdlGen.wr_line(f"    end process;\n\n")
 
 
+	def calc_read_pipeline_levels(self, block):
+		"""
+		Split read data multiplexor to "read_pipeline_stages" + 1 levels.
+		Address bits are distributed evenly among the levels, first levels
+		take the remaining bits when address width is not divisible by number
+		of levels. First level decodes the lowest address bits. Levels decode
+		no address bits (only register data) only when there are more levels
+		than address bits. Returns list of levels. Each level
+		is a dictionary with:
+			"addr_bits"	[high, low] address bits decoded by the level. None
+						if the level decodes no address bits.
+			"groups"	Dictionary with index of each level output and list
+						of indices of level inputs selected by it. Inputs of
+						first level are indices of readable words.
+		"""
+		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ACCESS_READ)
+		[high_addr_bit, low_addr_bit] = self.calc_addr_indices(block)
+		addr_shift = self.calc_addr_width_from_size(self.wrdWidthByte)
+
+		inputs = [addr >> addr_shift for addr in
+				  range(low_addr, high_addr + self.wrdWidthByte, self.wrdWidthByte)]
+
+		level_count = self.read_pipeline_stages + 1
+		addr_width = high_addr_bit - low_addr_bit + 1
+		[level_width, wide_levels] = divmod(addr_width, level_count)
+		levels = []
+		used_bits = 0
+
+		for i in range(level_count):
+			bits = level_width
+			if (i < wide_levels):
+				bits += 1
+
+			groups = {}
+			for index in inputs:
+				groups.setdefault(index >> bits, []).append(index)
+
+			addr_bits = None
+			if (bits > 0):
+				addr_bits = [low_addr_bit + used_bits + bits - 1,
+							 low_addr_bit + used_bits]
+
+			levels.append({"addr_bits" : addr_bits, "groups" : groups})
+			used_bits += bits
+			inputs = sorted(groups)
+
+		return levels
+
+
+	def create_read_pipeline_decls(self, block, signDict):
+		"""
+		Create declarations of read data pipeline signals: outputs of partial
+		multiplexors and their registers, pipelined address and read strobe.
+		"""
+		[high_addr_bit, low_addr_bit] = self.calc_addr_indices(block)
+		levels = self.calc_read_pipeline_levels(block)
+
+		names = []
+		for (i, level) in enumerate(levels[:-1]):
+			for index in level["groups"]:
+				names.append(["r_data_l{}_{}".format(i, index), self.wrdWidthBit])
+				names.append(["r_data_l{}_{}_q".format(i, index), self.wrdWidthBit])
+
+		for stage in range(1, self.read_pipeline_stages + 1):
+			names.append(["read_addr_q{}".format(stage), high_addr_bit + 1])
+			names.append(["read_q{}".format(stage), 1])
+
+		for [name, width] in names:
+			signDict[name] = LanDeclaration(name, value = None)
+			signDict[name].type = "std_logic"
+			signDict[name].bitWidth = width
+			signDict[name].specifier = "signal"
+
+
+	def create_read_mux(self, target, inputs, addr, addr_bits):
+		"""
+		Create read data multiplexor selecting one of inputs by address bits.
+		Arguments:
+			target		Name of multiplexor output signal.
+			inputs		List of [select value, input value].
+			addr		Name of address signal.
+			addr_bits	[high, low] bits of address which select input. If
+						None, there must be single input which is connected
+						directly.
+		"""
+		if (addr_bits == None):
+			self.hdlGen.wr_line(f"    {target} <= {inputs[0][1]};\n\n")
+			return
+
+		[high, low] = addr_bits
+		self.hdlGen.wr_line(f"    with {addr}({high} downto {low}) select {target} <=")
+		for [sel, value] in inputs:
+			self.hdlGen.wr_line(value + f' when "{sel:0{high-low+1}b}",')
+		self.hdlGen.wr_line(f"\n        (others => '0') when others;\n\n")
+
+
+	def create_read_data_pipeline(self, block):
+		"""
+		Create pipelined read data logic. Read data multiplexor is split to a
+		tree of partial multiplexors with registers between the levels. Read
+		strobe and address are pipelined together with read data. Byte enable
+		masking is applied in first pipeline stage.
+		"""
+		[low_addr, high_addr] = self.calc_blk_wrd_span(block, ACCESS_READ)
+		levels = self.calc_read_pipeline_levels(block)
+		addr_shift = self.calc_addr_width_from_size(self.wrdWidthByte)
+
+		# Values of readable words are inputs of first level
+		values = {}
+		for addr in range(low_addr, high_addr + self.wrdWidthByte, self.wrdWidthByte):
+			regs_in_wrd = self.get_regs_from_word(addr, block)
+			values[addr >> addr_shift] = self.create_read_wrd_from_regs(
+											regs_in_wrd, block, addr == low_addr)
+
+		for (i, level) in enumerate(levels):
+			self.hdlGen.write_comment("Read data multiplexor, level {}".format(i),
+										gap = 4)
+
+			addr = "address"
+			if (i > 0):
+				addr = "read_addr_q{}".format(i)
+
+			sel_mask = 0
+			if (level["addr_bits"] != None):
+				sel_mask = (1 << (level["addr_bits"][0] - level["addr_bits"][1] + 1)) - 1
+
+			for (index, group) in level["groups"].items():
+				target = "r_data_comb"
+				if (i < len(levels) - 1):
+					target = "r_data_l{}_{}".format(i, index)
+				inputs = [[j & sel_mask, values[j]] for j in group]
+				self.create_read_mux(target, inputs, addr, level["addr_bits"])
+
+			if (i == len(levels) - 1):
+				break
+
+			# Register outputs of the level. Next level selects from them.
+			stage = i + 1
+			prev_read = "cs and read"
+			prev_cond = "cs = '1' and read = '1'"
+			prev_addr = "address"
+			mask = " and read_data_mask_n"
+			if (stage > 1):
+				prev_read = "read_q{}".format(stage - 1)
+				prev_cond = "read_q{} = '1'".format(stage - 1)
+				prev_addr = "read_addr_q{}".format(stage - 1)
+				mask = ""
+			[high_addr_bit, low_addr_bit] = self.calc_addr_indices(block)
+
+			self.hdlGen.write_comment("Read pipeline stage {}".format(stage), gap = 4)
+			self.hdlGen.wr_line(f"    read_pipe_{stage}_proc : process(res_n, clk_sys)\n")
+			self.hdlGen.wr_line(f"    begin\n")
+			self.hdlGen.wr_line(f"        if (res_n = '0') then\n")
+			self.hdlGen.wr_line(f"            read_q{stage} <= '0';\n")
+			self.hdlGen.wr_line(f"            read_addr_q{stage} <= (others => '0');\n")
+			for index in level["groups"]:
+				self.hdlGen.wr_line(f"            r_data_l{i}_{index}_q <= (others => '0');\n")
+			self.hdlGen.wr_line(f"        elsif (rising_edge(clk_sys)) then\n")
+			self.hdlGen.wr_line(f"            read_q{stage} <= {prev_read};\n")
+			self.hdlGen.wr_line(f"            if ({prev_cond}) then\n")
+			self.hdlGen.wr_line(f"                read_addr_q{stage} <= {prev_addr}({high_addr_bit} downto 0);\n")
+			for index in level["groups"]:
+				self.hdlGen.wr_line(f"                r_data_l{i}_{index}_q <= r_data_l{i}_{index}{mask};\n")
+			self.hdlGen.wr_line(f"            end if;\n")
+			self.hdlGen.wr_line(f"        end if;\n")
+			self.hdlGen.wr_line(f"    end process;\n\n")
+
+			values = {index : "\n        r_data_l{}_{}_q".format(i, index)
+					  for index in level["groups"]}
+
+		stages = self.read_pipeline_stages
+		self.hdlGen.write_comment("Output register", gap = 4)
+		self.hdlGen.wr_line(f"    read_data_reg_proc : process(res_n, clk_sys)\n")
+		self.hdlGen.wr_line(f"    begin\n")
+		self.hdlGen.wr_line(f"        if (res_n = '0') then\n")
+		self.hdlGen.wr_line(f"            r_data <= (others => '0');\n")
+		self.hdlGen.wr_line(f"            r_data_valid <= '0';\n")
+		self.hdlGen.wr_line(f"        elsif (rising_edge(clk_sys)) then\n")
+		self.hdlGen.wr_line(f"            r_data_valid <= read_q{stages};\n")
+		self.hdlGen.wr_line(f"            if (read_q{stages} = '1') then\n")
+		self.hdlGen.wr_line(f"                r_data <= r_data_comb;\n")
+		self.hdlGen.wr_line(f"            end if;\n")
+		self.hdlGen.wr_line(f"        end if;\n")
+		self.hdlGen.wr_line(f"    end process;\n\n")
+
+
 	def create_read_data_mask_driver(self):
 		"""
 		Create driver for read data mask signal from byte enable inputs of memory
@@ -740,6 +1132,7 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		entity.intType = "entity"
 		entity.isInstance = False
 		entity.name = block.name.lower() + "_reg_map"
+		entity.generics["data_width"].value = str(self.wrdWidthBit)
 
 		# Add ports for register values
 		self.create_reg_ports(block, entity.ports)
@@ -747,6 +1140,16 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Add generics for conditionally defined components
 		self.create_reg_cond_generics(block, entity)
 
+		# Pipelined read data are not available one clock cycle after read,
+		# signal when they are valid.
+		if (self.read_pipeline_stages > 0):
+			port = LanDeclaration("r_data_valid", value=None)
+			port.direction = "out"
+			port.type = "std_logic"
+			port.bitWidth = 1
+			port.specifier = "signal"
+			entity.ports[port.name] = port
+
 		# Format entity declarations to look nice
 		self.hdlGen.format_decls(entity.ports, gap=2, alignLeft=True,
 					alignRight=False, alignLen=30, wrap=False)
@@ -777,14 +1180,14 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		reg_sel_index = self.get_wrd_index(block, reg) - 1
 
 		# Calcuate byte enable indices
-		l_be_ind = reg.addressOffset % 4
+		l_be_ind = reg.addressOffset % self.wrdWidthByte
 		h_be_ind = l_be_ind + int(reg.size / 8) - 1
 
 		be_lst = []
 		for i in range(l_be_ind, h_be_ind + 1):
 
 			be_lst.append(self.hdlGen.format_logic_op(
-						    [self.hdlGen.format_vector_index("be",i),
+						    [self.hdlGen.format_vector_index(self.get_bus_signal("be"), i),
 							 self.hdlGen.format_bin_const("1")],
 							 self.hdlGen.LogicOp.OP_COMPARE))
 
@@ -792,10 +1195,10 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 
 		op_lst = []
 		op_lst.append(self.hdlGen.format_logic_op(
-						["cs", self.hdlGen.format_bin_const("1")],
+						[self.get_bus_signal("cs"), self.hdlGen.format_bin_const("1")],
 						self.hdlGen.LogicOp.OP_COMPARE))
 		op_lst.append(self.hdlGen.format_logic_op(
-						[acc_type, self.hdlGen.format_bin_const("1")],
+						[self.get_bus_signal(acc_type), self.hdlGen.format_bin_const("1")],
 						self.hdlGen.LogicOp.OP_COMPARE))
 		op_lst.append(self.hdlGen.format_logic_op(
 						[self.hdlGen.format_vector_index("reg_sel", reg_sel_index),
@@ -829,11 +1232,11 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
 
 			# Create write psl coverage for every writable register
-			if (self.reg_has_access_type(reg, ["write"])):
+			if (self.reg_has_access_type(reg, ACCESS_WRITE)):
 				self.create_reg_access_cover_point(block, reg, "write");
 
 			# Create read psl coverage for every readable register
-			if (self.reg_has_access_type(reg, ["read"])):
+			if (self.reg_has_access_type(reg, ACCESS_READ)):
 				self.create_reg_access_cover_point(block, reg, "read");
 
 		# Add release ON
@@ -899,6 +1302,84 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		self.hdlGen.commit_append_lines_all()
 
 
+	def get_reg_array_type(self, block, reg, entry):
+		"""
+		Get name of array type of register record entry of register array
+		generated by loop.
+		"""
+		return "{}_{}_{}_t".format(block.name, self.get_reg_label(block, reg),
+								   entry).lower()
+
+
+	def create_reg_record_decl(self, block, reg, entry, bitWidth):
+		"""
+		Create declaration of register record entry (<reg_name>_<entry>).
+		Returns None for elements of register arrays generated by loop other
+		than the first one, since whole array is single entry of the record:
+			- std_logic_vector with bit for each element for 1 bit entries
+			- array of std_logic_vector (see "create_reg_array_types")
+		"""
+		decl = LanDeclaration(self.get_reg_label(block, reg) + "_" + entry, value="")
+		decl.specifier = ""
+
+		if (self.calc_reg_array_step(block, reg) != None):
+			if (reg.dimIndex != 0):
+				return None
+
+			if (bitWidth > 1):
+				decl.type = self.get_reg_array_type(block, reg, entry)
+				decl.bitWidth = 0
+			else:
+				decl.type = "std_logic_vector"
+				decl.bitWidth = len(reg.dimElements)
+			return decl
+
+		if bitWidth > 1:
+			decl.type = "std_logic_vector"
+		else:
+			decl.type = "std_logic"
+		decl.bitWidth = bitWidth
+		return decl
+
+
+	def is_reg_in_output_record(self, reg):
+		"""
+		Check if fields of register are entries of output record.
+		"""
+		return self.reg_has_access_type(reg, ACCESS_WRITE)
+
+
+	def is_reg_in_input_record(self, reg):
+		"""
+		Check if fields of register are entries of input record. All registers
+		with read, but not read-write, since read-write is register whose
+		value is written and the same value is read back.
+		"""
+		return (self.reg_has_access_type(reg, ACCESS_READ) and
+				not self.reg_is_access_type(reg, ACCESS_READ | ACCESS_WRITE))
+
+
+	def create_reg_array_types(self, block):
+		"""
+		Create array types of record entries for multi-bit fields of register
+		arrays generated by loop.
+		"""
+		for reg in sorted(block.register, key=lambda a: a.addressOffset):
+			if (self.calc_reg_array_step(block, reg) == None or reg.dimIndex != 0):
+				continue
+
+			if (not (self.is_reg_in_output_record(reg) or
+					 self.is_reg_in_input_record(reg))):
+				continue
+
+			for field in sorted(reg.field, key=lambda a: a.bitOffset):
+				if (field.bitWidth > 1):
+					self.hdlGen.create_array_type(
+						self.get_reg_array_type(block, reg, field.name),
+						len(reg.dimElements),
+						"std_logic_vector({} downto 0)".format(field.bitWidth - 1))
+
+
 	def create_output_reg_record(self, block):
 		"""
 		Create record for writable registers from IP-XACT memory block object
@@ -916,27 +1397,19 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		# Create the declarations
 		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
 
-			for field in sorted(reg.field, key=lambda a: a.bitOffset):
-				if ("write" in reg.access):
-					outDecls.append(LanDeclaration(reg.name + "_" + field.name, value=""))
-					if field.bitWidth > 1:
-						outDecls[-1].type = "std_logic_vector"
-					else:
-						outDecls[-1].type = "std_logic"
-					outDecls[-1].bitWidth = field.bitWidth
-					outDecls[-1].specifier = ""
+			decls = []
+			if (self.is_reg_in_output_record(reg)):
+				for field in sorted(reg.field, key=lambda a: a.bitOffset):
+					decls.append(self.create_reg_record_decl(block, reg,
+									field.name, field.bitWidth))
 
 			if (self.is_reg_write_indicate(reg)):
-				outDecls.append(LanDeclaration(reg.name + "_update", value=""))
-				outDecls[-1].type = "std_logic"
-				outDecls[-1].bitWidth = 1
-				outDecls[-1].specifier = ""
+				decls.append(self.create_reg_record_decl(block, reg, "update", 1))
 
 			if (self.is_reg_read_indicate(reg)):
-				outDecls.append(LanDeclaration(reg.name + "_read", value=""))
-				outDecls[-1].type = "std_logic"
-				outDecls[-1].bitWidth = 1
-				outDecls[-1].specifier = ""
+				decls.append(self.create_reg_record_decl(block, reg, "read", 1))
+
+			outDecls.extend([decl for decl in decls if decl != None])
 
 		# Format the declaration
 		self.hdlGen.format_decls(outDecls, gap=2, alignLeft=True,
@@ -956,18 +1429,13 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 
 		for i,reg in enumerate(sorted(block.register, key=lambda a: a.addressOffset)):
 
-			# All registers with read, but not read-write, since read-write is register
-			# whose value is written and the same value is read back
-			if (("read" in reg.access) and (reg.access != "read-write")):
+			if (self.is_reg_in_input_record(reg)):
 
 				for field in sorted(reg.field, key=lambda a: a.bitOffset):
-					inDecls.append(LanDeclaration(reg.name + "_" + field.name, value=""))
-					if field.bitWidth > 1:
-						inDecls[-1].type = "std_logic_vector"
-					else:
-						inDecls[-1].type = "std_logic"
-					inDecls[-1].bitWidth = field.bitWidth
-					inDecls[-1].specifier = ""
+					decl = self.create_reg_record_decl(block, reg, field.name,
+													   field.bitWidth)
+					if (decl != None):
+						inDecls.append(decl)
 
 		# Format the declaration
 		self.hdlGen.format_decls(inDecls, gap=2, alignLeft=True,
@@ -984,6 +1452,8 @@ class VhdlRegMapGenerator(IpXactAddrGenerator):
 		"""
 		self.hdlGen.wr_nl()
 
+		self.create_reg_array_types(block)
+
 		self.create_output_reg_record(block)
 
 		self.hdlGen.wr_nl()
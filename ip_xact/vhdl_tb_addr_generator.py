@@ -37,6 +37,8 @@
 
 from abc import ABCMeta, abstractmethod
 from pyXact_generator.ip_xact.addr_generator import IpXactAddrGenerator
+from pyXact_generator.ip_xact.addr_generator import (ACCESS_READ,
+	ACCESS_WRITE, ACCESS_WRITE_ONCE)
 
 from pyXact_generator.languages.gen_vhdl import VhdlGenerator
 from pyXact_generator.languages.declaration import LanDeclaration
@@ -54,8 +56,7 @@ class VhdlTbAddrGenerator(IpXactAddrGenerator):
 		""" 
 		Commit the generator output into the output file.
 		"""
-		for line in self.vhdlGen.out :
-			self.of.write(line)
+		self.vhdlGen.write_output(self.of)
 
 
 	def write_cmn_types(self):
@@ -114,31 +115,16 @@ class VhdlTbAddrGenerator(IpXactAddrGenerator):
 		Pad reset value of register with zeroes and fit it into word size.
 		Other bits of the word are 0.
 		"""
-		res_mask_reg = self.calc_reg_rstval_mask(reg).strip('"')
-		upper_pad = self.wrdWidthBit - ((reg.addressOffset % self.wrdWidthByte) * 8 + reg.size)
-		lower_pad = (reg.addressOffset % self.wrdWidthByte) * 8
-		return "0" * upper_pad + res_mask_reg + "0" * lower_pad
+		masks = self.calc_wrd_masks([reg])
+		return "{:0{}b}".format(masks["reset"], self.wrdWidthBit)
 
 
 	def get_implemented_mask(self, reg):
 		"""
 		Return register mask string with '1' if given bit is implemented and '0' if not.
 		"""
-		strMask = ["0" for x in range(0, self.wrdWidthBit)]
-		startInd = (reg.addressOffset % 4) * 8
-		endInd = startInd + reg.size
-		for i in range(startInd, endInd):
-			found = False
-			for field in reg.field:
-				if (i >= field.bitOffset and i < field.bitOffset + field.bitWidth):
-					strMask[i] = "1"
-					found = True;
-			if (not found):
-				strMask[i] = "0"
-
-		strMask.reverse()
-
-		return "".join(strMask)
+		masks = self.calc_wrd_masks([reg])
+		return "{:0{}b}".format(masks["implemented"], self.wrdWidthBit)
 
 
 	def write_addrbl_reg_list(self, addressBlock):
@@ -165,16 +151,17 @@ class VhdlTbAddrGenerator(IpXactAddrGenerator):
 			self.vhdlGen.wr_line("     size      => {},\n".format(reg.size))
 
 			reg_t_str = "reg_none"
-			if (reg.access == "read-only"):
+			access = self.get_reg_access(reg)
+			if (access == ACCESS_READ):
 				reg_t_str = "reg_read_only"
 
-			elif (reg.access == "write-only"):
+			elif (access == ACCESS_WRITE):
 				reg_t_str = "reg_write_only"
 
-			elif (reg.access == "read-write"):
+			elif (access == ACCESS_READ | ACCESS_WRITE):
 				reg_t_str = "reg_read_write"
 
-			elif (reg.access == "read-writeOnce"):
+			elif (access == ACCESS_READ | ACCESS_WRITE | ACCESS_WRITE_ONCE):
 				reg_t_str = "reg_read_write_once"
 
 			self.vhdlGen.wr_line("     reg_type  => {},\n".format(reg_t_str))
@@ -31,15 +31,32 @@
 ##
 ##	Revision history:
 ##		25.01.2018	First implementation
+##		18.10.2026	Append stack is a deque, output is kept in chunks.
+##		18.10.2026	Output can be streamed to a sink.
 ##
 ################################################################################
 
 from abc import ABCMeta, abstractmethod
+from collections import deque
 
 class BaseGenerator(metaclass=ABCMeta):
 	
-	# Generator output
+	# Generator output. Written lines are joined into chunks of "chunkLines"
+	# lines (see "get_output").
 	out = None
+
+	# Lines written to the output since the last chunk was closed
+	outChunk = None
+
+	# Number of lines joined into single chunk of the output
+	chunkLines = 1024
+
+	# Sink to which chunks of the output are streamed (see "set_sink").
+	# Output is kept in memory when None.
+	sink = None
+
+	# Function writing a chunk of the output to the sink
+	sinkWrite = None
 	
 	# Comment sign for particular language generator
 	commentSign = None
@@ -51,7 +68,8 @@ class BaseGenerator(metaclass=ABCMeta):
 	
 	def __init__(self):
 		self.out = []
-		self.appendText = []
+		self.outChunk = []
+		self.appendText = deque()
 		self.commentSign = "#"
 
 	
@@ -61,7 +79,81 @@ class BaseGenerator(metaclass=ABCMeta):
 		Arguments:
 			line		 Line to write into the output source code
 		"""
-		self.out.append(line)
+		self.outChunk.append(line)
+		if (len(self.outChunk) >= self.chunkLines):
+			self.close_out_chunk()
+
+
+	def close_out_chunk(self):
+		"""
+		Join lines written since the last chunk into a new chunk of the
+		generator output.
+		"""
+		if (self.outChunk):
+			if (self.sink == None):
+				self.out.append("".join(self.outChunk))
+			else:
+				self.sinkWrite("".join(self.outChunk))
+			self.outChunk = []
+
+
+	def set_sink(self, sink):
+		"""
+		Stream the generator output to a sink. Each chunk of the output is
+		written to the sink as soon as it is closed, only the append stack
+		and the last chunk are kept in memory. Output already kept in memory
+		is written to the sink first.
+		Arguments:
+			sink		 Object with "write" method (e.g. open output file) or
+						 function called with each chunk (e.g. "put_nowait"
+						 of asyncio queue). Output is kept in memory again
+						 when None.
+		"""
+		self.close_out_chunk()
+		self.sink = None
+		self.sinkWrite = None
+
+		if (sink == None):
+			return
+
+		if (hasattr(sink, "write")):
+			self.sinkWrite = sink.write
+		else:
+			self.sinkWrite = sink
+		self.sink = sink
+
+		for chunk in self.out:
+			self.sinkWrite(chunk)
+		self.out = []
+
+
+	def get_output(self):
+		"""
+		Return whole generator output as single string. When streaming to
+		a sink, the output is already in the sink and empty string is
+		returned.
+		"""
+		self.close_out_chunk()
+		return "".join(self.out)
+
+
+	def write_output(self, of):
+		"""
+		Write whole generator output to the output file at once. When
+		streaming to a sink, only the last chunk is written to the sink.
+		Arguments:
+			of			 Open output file
+		"""
+		self.close_out_chunk()
+		of.writelines(self.out)
+
+
+	def clear_output(self):
+		"""
+		Discard the generator output.
+		"""
+		self.out = []
+		self.outChunk = []
 
 
 	def append_line(self, line):
@@ -70,7 +162,7 @@ class BaseGenerator(metaclass=ABCMeta):
 		Arguments:
 			line		 Line to write into the output source code
 		"""
-		self.appendText.insert(0, line)
+		self.appendText.appendleft(line)
 	
 	
 	def wr_nl(self):
@@ -88,8 +180,7 @@ class BaseGenerator(metaclass=ABCMeta):
 			count		 Number of items to pop
 		"""
 		for i in range(0, min(count, len(self.appendText))):
-			self.wr_line(self.appendText[0])
-			self.appendText.pop(0)
+			self.wr_line(self.appendText.popleft())
 	
 	
 	def commit_append_lines_all(self):
@@ -31,6 +31,7 @@
 ##	
 ##	Revision history:
 ##		25.01.2018	First Implementation
+##		18.10.2026	Added static inline functions.
 ##
 ################################################################################
 
@@ -352,4 +353,20 @@ class HeaderGenerator(LanBaseGenerator):
 			self.__wr_line('#include "{}"\n'.format(file_name))
 		else:
 			self.__wr_line('#include <{}>\n'.format(file_name))
-		
+
+
+	def create_inline_function(self, name, retType, params, body):
+		"""
+		Create static inline function.
+		Arguments:
+			name		Function name
+			retType		Return type of the function
+			params		List of parameter declarations (e.g. "uint32_t val")
+			body		List of lines (statements) of the function body
+		"""
+		self.__wr_line("static inline {} {}({})\n".format(retType, name,
+							", ".join(params)))
+		self.__wr_line("{\n")
+		for line in body:
+			self.__wr_line("	{}\n".format(line))
+		self.__wr_line("}\n")
@@ -0,0 +1,215 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##   
+##   Python module generator for PyXact parsed objects from IP-Xact
+##   specification. Generated modules contain only constants, dictionaries
+##   and simple classes, so that they are imported fast.
+##	
+##	Revision history:
+##		18.10.2026	First Implementation
+##
+################################################################################
+
+from pyXact_generator.gen_lib import *
+from pyXact_generator.languages.gen_lan_base import LanBaseGenerator
+
+class PythonGenerator(LanBaseGenerator):
+
+	# Indentation of generated Python code
+	indent = "    "
+
+	def __init__(self):
+		super().__init__()
+		self.supportedTypes = ["int", "str", "dict", "list", "tuple", "object"]
+		self.typeSizes = [0, 0, 0, 0, 0, 0]
+		self.commentSign = "#"
+
+
+################################################################################
+#	Python syntax specific generation functions
+################################################################################
+
+	def write_comm_line(self, gap=0):
+		"""
+		Write Python comment line aligned to 80 characters: (gap)######
+		Arguments:
+			gap		 Number of indentation levels before the comment line
+		"""
+		self.wr_line("{}\n".format(self.indent * gap).rjust(81,
+						self.commentSign))
+
+
+	def write_comment(self, input, gap, caption=None, small=False):
+		"""
+		Write Python comment split to lines of 80 characters:
+			# COMMENT
+		Arguments:
+			gap		 Number of indentation levels before the comment
+			caption  Caption to append to the comment as last line
+			small	 So far no meaning for Python implementation
+		"""
+		spltStr = split_string(input, 77 - gap * len(self.indent))
+		if (caption != None):
+			spltStr.append(caption)
+
+		for line in spltStr:
+			self.wr_line("{}# {}\n".format(self.indent * gap, line))
+
+
+	def create_package(self, name):
+		"""
+		Create module docstring.
+		Arguments:
+			name	Module description
+		"""
+		self.wr_line('"""\n{}\n"""\n'.format(name))
+
+
+	def create_includes(self, includeList):
+		"""
+		Create Python imports.
+		Arguments:
+			includeList		List of modules to import
+		"""
+		for include in includeList:
+			self.wr_line("import {}\n".format(include))
+
+
+	def write_decl(self, decl):
+		"""
+		Write declaration as assignment of value (Python literal) to a name:
+			NAME = value
+		Arguments:
+			decl		Declaration to create
+		"""
+		if (decl.comment != None):
+			self.write_comment(decl.comment, decl.gap)
+
+		value = decl.value
+		if (type(value) == int and decl.intType != "decimal"):
+			value = hex(value)
+
+		pref = "{}{}".format(self.indent * decl.gap, decl.name)
+		self.wr_line("{} = {}\n".format(pref.ljust(decl.alignLen - 3), value))
+		return True
+
+
+	def create_enum(self, name, decls):
+		"""
+		Create enum as dictionary from names to values:
+			NAME = {
+				"ELEMENT" : value,
+			}
+		Arguments:
+			name		Dictionary name
+			decls		List of enum elements as declarations
+		"""
+		items = [('"{}"'.format(decl.name), hex(decl.value)) for decl in decls]
+		self.create_dict(name, items)
+
+
+	def format_dict(self, items, gap=0, inline=False):
+		"""
+		Format dictionary literal. Returns the literal as string.
+		Arguments:
+			items		List of (key, value) tuples. Keys and values are
+						Python expressions written as they are.
+			gap			Number of indentation levels of closing bracket
+			inline		Write all items to a single line
+		"""
+		if (inline):
+			return "{{{}}}".format(", ".join(["{} : {}".format(key, value)
+												for (key, value) in items]))
+
+		lines = ["{\n"]
+		for (key, value) in items:
+			lines.append("{}{} : {},\n".format(self.indent * (gap + 1),
+							key, value))
+		lines.append("{}}}".format(self.indent * gap))
+		return "".join(lines)
+
+
+	def create_dict(self, name, items, gap=0):
+		"""
+		Create dictionary with one item per line.
+		Arguments:
+			name		Dictionary name
+			items		List of (key, value) tuples. Keys and values are
+						Python expressions written as they are.
+			gap			Number of indentation levels
+		"""
+		self.wr_line("{}{} = {}\n".format(self.indent * gap, name,
+						self.format_dict(items, gap)))
+
+
+	def create_instance(self, name, className, args, gap=0):
+		"""
+		Create instance of a class:
+			NAME = CLASS(arg, ..., arg)
+		Arguments:
+			name		Name of the instance
+			className	Name of the class
+			args		List of constructor arguments (Python expressions)
+			gap			Number of indentation levels
+		"""
+		self.wr_line("{}{} = {}({})\n".format(self.indent * gap, name,
+						className, ", ".join(args)))
+
+
+	def create_structure(self, name, decls):
+		"""
+		Create class with "__slots__" for each declaration and constructor
+		which takes values of all slots in order of declarations:
+			class NAME:
+				__slots__ = ("first", ..., "last")
+				def __init__(self, first, ..., last):
+		Arguments:
+			name		Class name
+			decls		List of class attributes as declarations. Comments
+						of declarations describe the attributes.
+		"""
+		names = [decl.name for decl in decls]
+
+		self.wr_line("class {}:\n".format(name))
+		for decl in decls:
+			if (decl.comment != None):
+				self.write_comment("{} - {}".format(decl.name, decl.comment), 1)
+
+		self.wr_line("{}__slots__ = ({},)\n".format(self.indent,
+						", ".join(['"{}"'.format(n) for n in names])))
+		self.wr_nl()
+
+		self.wr_line("{}def __init__(self, {}):\n".format(self.indent,
+						", ".join(names)))
+		for n in names:
+			self.wr_line("{}self.{} = {}\n".format(self.indent * 2, n, n))
+		self.wr_nl()
+
+		self.wr_line("{}def __repr__(self):\n".format(self.indent))
+		self.wr_line("{}return \"{}({{}})\".format(self.{})\n".format(
+						self.indent * 2, name, names[0]))
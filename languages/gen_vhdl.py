@@ -30,6 +30,9 @@
 ##
 ##	Revision history:
 ##		16.01.2018	Implemented the script
+##		18.10.2026	Fixed "for generate" statement, added array types.
+##		18.10.2026	Entity templates parsed by single pass tokenizer of
+##					shared VHDL entity parser.
 ##
 ################################################################################
 
@@ -41,14 +44,22 @@ import os
 import inspect
 import math
 import re
+import copy
 
 from pyXact_generator.gen_lib import *
 from pyXact_generator.languages.gen_lan_base import LanBaseGenerator
 
 from pyXact_generator.languages.declaration import LanDeclaration
+from pyXact_generator.languages.vhdl_parser import VhdlEntityParser
 
 class VhdlGenerator(LanBaseGenerator):
 
+	# Process-wide cache of parsed entity templates. Keyed by path of the
+	# template, each entry holds [mtime, entity declaration].
+	entityTemplateCache = {}
+
+	# Hit / miss statistics of entity template cache
+	entityTemplateCacheStats = {"hits" : 0, "misses" : 0}
 
 	def __init__(self):
 		super().__init__()
@@ -692,20 +703,38 @@ class VhdlGenerator(LanBaseGenerator):
 
 	def create_for_generate(self, name, var, indices, gap=2):
 		"""
-		Create "for generate" VHDL statement.
+		Create "for generate" VHDL statement. End of the statement is pushed
+		to the append stack.
 		Arguments:
-			TODO
+			name		Label of the generate statement
+			var			Name of loop variable
+			indices		List with low and high index of the loop
+			gap			Number of spaces before the statement
 		"""
 
 		if (not(len(indices) == 2)):
 			print("'For generate' statement should have exactly two indices")
 
-		line = " " * gap + name + " : for " + var + " in " + indices[0]
-		line.append(" to " + indices[1] + " generate\n")
+		line = " " * gap + name + " : for " + var + " in " + str(indices[0])
+		line += " to " + str(indices[1]) + " generate\n"
 		self.__wr_line(line)
 		self.append_line(" " * gap + "end generate " + name + ";\n")
 
 
+	def create_array_type(self, name, size, elemType, gap=2):
+		"""
+		Create VHDL array type:
+			type <name> is array (0 to <size> - 1) of <elemType>;
+		Arguments:
+			name		Name of the type
+			size		Number of array elements
+			elemType	Type of array element
+			gap			Number of spaces before the declaration
+		"""
+		self.__wr_line(" " * gap + "type {} is array (0 to {}) of {};\n".format(
+						name, size - 1, elemType))
+
+
 	def is_valid_dir(self, direction):
 		"""
 		Checks if specified direction is valid in VHDL.
@@ -726,6 +755,49 @@ class VhdlGenerator(LanBaseGenerator):
 		return "".join([x for x in string if x != " "])
 
 
+	def create_entity_decl(self, entry):
+		"""
+		Create declaration object from generic or port entry of parsed
+		entity interface (see "VhdlEntityParser.parse_decl"). Ports must
+		have valid direction. If entry could not be converted, None is
+		returned.
+		"""
+		decl = LanDeclaration("new", value="")
+
+		if (entry["entry_type"] == "port"):
+			if (entry["direction"] == None):
+				return None
+			decl.specifier = "signal"
+		else:
+			decl.specifier = "constant"
+
+		decl.name = entry["name"]
+
+		if (entry["entry_type"] == "port"):
+			decl.direction = entry["direction"]
+		else:
+			# Initialized default value (for generics only)
+			decl.value = entry["def_val"]
+
+		decl.type = entry["type"]
+
+		# Process std_logic_vector specially to determine range. Vectors
+		# without range (e.g. generics) are left without boundaries.
+		if (decl.type == "std_logic_vector"):
+			if (entry["range"] != None):
+				[decl.upBound, decl.lowBound] = entry["range"]
+
+				# Calculate bitWidth, but only for integers, for strings
+				# leave only boundaries.
+				if (decl.upBound.isdigit() and decl.lowBound.isdigit()):
+					decl.bitWidth = int(decl.upBound) - int(decl.lowBound) + 1
+
+		elif (decl.type == "std_logic"):
+			decl.bitWidth = 1
+
+		return decl
+
+
 	def parse_gen_or_port(self, line):
 		"""
 		Parses input line which is a port or generic declaration into a
@@ -733,128 +805,121 @@ class VhdlGenerator(LanBaseGenerator):
 		On ports, direction must be specified. On generics, it must NOT be
 		speciffied.
 		If line could not be parsed, None is returned. Otherwise declaration
-		object is returned.
+		object of first declared name is returned.
 		Each line must start with 'signal' for port declarations, or 'constant'
 		for generic declarations.
-
 		"""
-		decl = LanDeclaration("new", value="")
-		#decl.alignRight = False
-		#decl.alignLength = 80
-		#decl.doIndent = True
-
-		# Find all separated words and numbers
-		cmn_re = re.compile("[\w]+")
-		wrds = cmn_re.findall(line)
-
-		# Allow only signal and constant prefixes
-		if (len(wrds) > 2 and
-			(wrds[0] == "signal" or wrds[0] == "constant")):
-			decl.specifier = wrds[0]
-		else:
-			return None
+		parser = VhdlEntityParser()
+		text = line.lower()
+
+		toks = []
+		for tok in parser.tokenize(text):
+			if (tok.group() == ";" or tok.group().startswith("--")):
+				break
+			toks.append(tok)
 
-		# For Ports, Direction must be valid VHDL port direction
-		if (wrds[0] == "signal" and (not self.is_valid_dir(wrds[2]))):
+		if (len(toks) == 0 or
+			(toks[0].group() != "signal" and toks[0].group() != "constant")):
 			return None
 
-		# Name is common for generics and ports
-		decl.name = wrds[1]
+		entryType = "generic"
+		if (toks[0].group() == "signal"):
+			entryType = "port"
 
-		if (wrds[0] == "signal"):
-			decl.direction = wrds[2]
-			decl.type = wrds[3]
+		entries = parser.parse_decl(text, toks, entryType)
+		if (len(entries) == 0):
+			return None
+		return self.create_entity_decl(entries[0])
 
-		if (wrds[0] == "constant"):
-			# Initialized default value (for generics only)
-			if (":=" in line):
-				decl.value = wrds[-1]
-			decl.type = wrds[2]
-
-		# Process std_logic_vector specially to determine range. Support
-		# only downto, we don't need to be too generic
-		#print("DEEEECL")
-		#print(decl.name)
-		#print(decl.type)
-		#print("\n")
-		if (decl.type == "std_logic_vector"):
-			stdv_re = re.compile("\([ ]*.+ downto .*[ ]*\)")
-			rng_spec = stdv_re.findall(line)
 
-			# Skip vectors without range (e.g. generics)
-			if (len(rng_spec) == 0):
-				return decl
+	def copy_entity_template(self, entity):
+		"""
+		Create copy of parsed entity template. Entity, its generics and
+		ports are copied, so that the caller can modify them without
+		affecting the cached template.
+		"""
+		new_entity = copy.copy(entity)
+		new_entity.ports = {key : copy.copy(port) for (key, port) in
+								entity.ports.items()}
+		new_entity.generics = {key : copy.copy(generic) for (key, generic) in
+								entity.generics.items()}
+		return new_entity
 
-			# Strip brackets and take vector boundaries
-			ths = rng_spec[0][1:-1].split("downto")
-			decl.upBound = ths[0].strip()
-			decl.lowBound = ths[1].strip()
 
-			# Calculate bitWidth, but only for integers, for strings
-			# leave only boundaries, we don't need complicated parsing logic
-			if (decl.upBound.isdigit() and decl.lowBound.isdigit()):
-				decl.bitWidth = eval(decl.upBound + " - " + decl.lowBound + "+ 1")
+	def get_entity_template_cache_stats(self):
+		"""
+		Return statistics of entity template cache as dictionary:
+			{"hits" : <hit_count>, "misses" : <miss_count>}
+		"""
+		return dict(VhdlGenerator.entityTemplateCacheStats)
 
-		elif (decl.type == "std_logic"):
-			decl.bitWidth = 1
 
-		return decl
+	def clear_entity_template_cache(self):
+		"""
+		Drop all parsed entity templates and reset cache statistics.
+		"""
+		VhdlGenerator.entityTemplateCache.clear()
+		VhdlGenerator.entityTemplateCacheStats["hits"] = 0
+		VhdlGenerator.entityTemplateCacheStats["misses"] = 0
 
 
 	def load_entity_template(self, path):
 		"""
-		Load entity template from VHDL file. Recognizes: entity name,
-		Entity ports, generics. Note that on each generic "constant"
-		must be explicitly specified. On each port "signal" must be
-		explicitly specified. Direction must be specified on each signal!
-        Parsing stops upon "architecture" definition start.
+		Load entity template from VHDL file. Each template is parsed only
+		once per process. Further calls return copy of the parsed entity
+		as long as modification time of the template does not change.
 		Return declaration object of parsed entity.
 		Arguments:
-			TODO
+			path		Path to VHDL file with entity template
 		"""
 		if (not(path.endswith(".vhd"))):
 			print("Only VHDL files are supported for parsing!")
 			return
 
-		fd = open(path)
+		mtime = os.stat(path).st_mtime_ns
+		cached = VhdlGenerator.entityTemplateCache.get(path)
 
-		# Entity name parser
-		ent_re = re.compile("^[ ]*entity[ ]*[\w]+[ ]*is$")
+		if (cached != None and cached[0] == mtime):
+			VhdlGenerator.entityTemplateCacheStats["hits"] += 1
+		else:
+			VhdlGenerator.entityTemplateCacheStats["misses"] += 1
+			cached = [mtime, self.parse_entity_template(path)]
+			VhdlGenerator.entityTemplateCache[path] = cached
 
-		# Architecture parser
-		# Upon start of architecture parsing is finished, otherwise internal
-		# signals would be parsed too!
-		architecture_re = re.compile("^[ ]*architecture[ ]+[\w]+[ ]+of[ ]+[\w]+[ ]+is[ ]*$")
+		return self.copy_entity_template(cached[1])
 
-		entity = LanDeclaration("name", value="")
-		entity.intType = "entity"
 
-		for line in fd:
-			line = line.lower()
+	def parse_entity_template(self, path):
+		"""
+		Parse entity template from VHDL file by VHDL entity parser (see
+		"VhdlEntityParser"). Recognizes: entity name, Entity ports, generics.
+		Direction must be specified on each port!
+		Return declaration object of parsed entity.
+		Arguments:
+			path		Path to VHDL file with entity template
+		"""
+		with open(path) as fd:
+			interface = VhdlEntityParser().parse(fd.read().lower())
 
-			# Finish when architecture starts
-			arch_res = architecture_re.match(line)
-			if (arch_res):
-				break
+		entity = LanDeclaration("name", value="")
+		entity.intType = "entity"
+		if (interface["name"] != None):
+			entity.name = interface["name"]
 
-			# Get name of entity
-			ent_res = ent_re.match(line)
-			if (ent_res):
-				mtch = re.compile("[\w]+").findall(line)
-				entity.name = mtch[1]
+		for entry in interface["generics"] + interface["ports"]:
+			if (entry["entry_type"] == "section"):
+				continue
 
-			# Parse ports or generics
-			port_or_gen = self.parse_gen_or_port(line)
-			if (port_or_gen == None):
+			decl = self.create_entity_decl(entry)
+			if (decl == None):
 				continue
 
-			if (port_or_gen.specifier == "signal"):
-				entity.ports[port_or_gen.name] = port_or_gen
+			if (decl.specifier == "signal"):
+				entity.ports[decl.name] = decl
 
-			elif (port_or_gen.specifier == "constant"):
-				entity.generics[port_or_gen.name] = port_or_gen
+			elif (decl.specifier == "constant"):
+				entity.generics[decl.name] = decl
 
-		fd.close()
 		return entity
 
 
@@ -0,0 +1,307 @@
+################################################################################                                                     
+## 
+## Register map generation tool
+##
+## Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+##
+## Permission is hereby granted, free of charge, to any person obtaining a copy
+## of this SW component and associated documentation files (the "Component"),
+## to deal in the Component without restriction, including without limitation
+## the rights to use, copy, modify, merge, publish, distribute, sublicense,
+## and/or sell copies of the Component, and to permit persons to whom the
+## Component is furnished to do so, subject to the following conditions:
+##
+## The above copyright notice and this permission notice shall be included in
+## all copies or substantial portions of the Component.
+##
+## THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+## IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+## FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+## AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+## LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+## IN THE COMPONENT.
+##
+###############################################################################
+
+###############################################################################
+##   
+##   Parser of VHDL entity interface. Shared by loading of entity templates
+##   and by generation of documentation of entity interfaces.
+##
+##   Entity is parsed in single pass over tokens of the source code.
+##   Supports following VHDL entity declaration features:
+##      1. Generics and Ports, declarations may span multiple lines and
+##         declare multiple names.
+##      2. Comments per port/generic above the generic/port declaration,
+##         or on the same line behind it.
+##      3. Sections in ports/generics which are started and finished by
+##         comment line solely of '-' character.
+##      4. Range of std_logic_vector given by "downto".
+##      5. Direction of port.
+##	
+##	Revision history:
+##		18.10.2026	First Implementation
+##		18.10.2026	Comments and sections of ports / generics, shared with
+##					documentation of entity interfaces.
+##
+################################################################################
+
+import re
+
+# Tokens of VHDL source code: comments, string and character literals,
+# compound delimiters, words (identifiers, keywords, numbers) and single
+# character delimiters.
+VHDL_TOKEN_RE = re.compile(r"--[^\n]*|\"[^\"\n]*\"|'.'|:=|<=|=>|\w+|[^\s\w]")
+
+# Comment which starts or finishes a section of ports / generics
+VHDL_SECTION_RE = re.compile(r"-{4,}")
+
+# Valid directions of VHDL ports
+VHDL_PORT_DIRS = ["in", "out", "inout", "buffer", "linkage"]
+
+# Object class keywords allowed in front of port / generic declaration
+VHDL_OBJECT_CLASSES = ["signal", "constant"]
+
+
+class VhdlEntityParser():
+
+	def tokenize(self, text):
+		"""
+		Split VHDL source code into tokens (see "VHDL_TOKEN_RE"). Yields
+		match objects of tokens, so that original text between tokens can
+		be sliced from the source code.
+		Arguments:
+			text		VHDL source code
+		"""
+		return VHDL_TOKEN_RE.finditer(text)
+
+
+	def get_comment_text(self, comment):
+		"""
+		Get text of comment without leading and trailing '-' and spaces.
+		"""
+		return comment.strip("-").strip()
+
+
+	def get_text(self, text, firstTok, lastTok):
+		"""
+		Get source code from first to last token (inclusive). Whitespace
+		(e.g. line breaks of multi-line declarations) is collapsed to single
+		space.
+		"""
+		return " ".join(text[firstTok.start():lastTok.end()].split())
+
+
+	def parse_decl(self, text, toks, entryType):
+		"""
+		Parse tokens of single port or generic declaration (without comments
+		and terminating ";") into entries, one entry for each declared name.
+		Each entry is a dictionary with:
+			"entry_type"	"generic" or "port"
+			"name"			Name of generic / port
+			"direction"		Direction of port, None if not given or if
+							entry is generic.
+			"type"			Type mark (e.g. "std_logic_vector")
+			"subtype"		Subtype indication as written in the source code
+							(e.g. "std_logic_vector(7 downto 0)")
+			"range"			[upper bound, lower bound] of "downto" range as
+							written in the source code, None if there is no
+							such range.
+			"def_val"		Default value as written in the source code,
+							empty string if not given.
+			"comment"		Comment of the entry.
+		Text taken from the source code has whitespace collapsed (see
+		"get_text").
+		Empty list is returned if tokens could not be parsed.
+		Arguments:
+			text		VHDL source code the tokens were taken from
+			toks		Token match objects (see "tokenize")
+			entryType	"generic" or "port"
+		"""
+		wrds = [tok.group() for tok in toks]
+		lwrds = [wrd.lower() for wrd in wrds]
+
+		if (not ":" in wrds):
+			return []
+		colon = wrds.index(":")
+
+		start = 0
+		if (len(wrds) > 0 and lwrds[0] in VHDL_OBJECT_CLASSES):
+			start = 1
+		names = [wrd for wrd in wrds[start:colon] if wrd != ","]
+		pos = colon + 1
+
+		direction = None
+		if (entryType == "port" and pos < len(wrds) and
+			lwrds[pos] in VHDL_PORT_DIRS):
+			direction = wrds[pos]
+			pos += 1
+
+		if (len(names) == 0 or pos >= len(wrds)):
+			return []
+
+		# Subtype indication ends by default value
+		end = len(wrds)
+		def_val = ""
+		if (":=" in wrds):
+			end = wrds.index(":=")
+			if (end + 1 < len(wrds)):
+				def_val = self.get_text(text, toks[end + 1], toks[-1])
+			if (end <= pos):
+				return []
+
+		# Range of vector, only "downto" ranges are supported
+		vect_range = None
+		if (pos + 1 < end and wrds[pos + 1] == "("):
+			depth = 0
+			downto = None
+			for i in range(pos + 1, end):
+				if (wrds[i] == "("):
+					depth += 1
+				elif (wrds[i] == ")"):
+					depth -= 1
+				elif (lwrds[i] == "downto" and depth == 1):
+					downto = i
+				if (depth == 0):
+					break
+
+			if (depth == 0 and downto != None and pos + 2 < downto and
+				downto + 1 < i):
+				vect_range = [self.get_text(text, toks[pos + 2], toks[downto - 1]),
+							  self.get_text(text, toks[downto + 1], toks[i - 1])]
+
+		entries = []
+		for name in names:
+			entries.append({"entry_type" : entryType,
+							"name" : name,
+							"direction" : direction,
+							"type" : wrds[pos],
+							"subtype" : self.get_text(text, toks[pos], toks[end - 1]),
+							"range" : vect_range,
+							"def_val" : def_val,
+							"comment" : ""})
+		return entries
+
+
+	def parse(self, text):
+		"""
+		Parse interface of first entity within VHDL source code. Parsing
+		finishes at the end of the entity declaration. Returns dictionary:
+			"name"			Name of the entity, None if there is no entity.
+			"generics"		List of generic and section entries
+			"ports"			List of port and section entries
+		Generic and port entries are described in "parse_decl". Section
+		entries have "entry_type" set to "section" and "comment" with text
+		of the section. Comments of entries are given by comment lines
+		above the entry (since last entry or section) and by comment behind
+		the entry on the same line.
+		Arguments:
+			text		VHDL source code
+		"""
+		entity = {"name" : None, "generics" : [], "ports" : []}
+
+		# Entries of currently parsed port / generic list
+		entries = None
+		entryType = None
+
+		# Tokens of declaration being parsed and depth of brackets within
+		# the port / generic list.
+		declToks = []
+		depth = 0
+
+		# Comments of next entry, True when within section
+		comments = []
+		inSection = False
+
+		# Last entries and line end of their declaration (for comments on
+		# the same line behind the declaration)
+		lastEntries = []
+		lastEnd = 0
+
+		# Last two words before "is" of entity
+		prev = [None, None]
+
+		for tok in self.tokenize(text):
+			wrd = tok.group()
+			lwrd = wrd.lower()
+
+			# Outside of port / generic list
+			if (entries == None):
+				if (wrd.startswith("--")):
+					continue
+
+				if (entity["name"] == None):
+					if (lwrd == "architecture"):
+						break
+					if (lwrd == "is" and prev[0] == "entity"):
+						entity["name"] = prev[1]
+					prev = [prev[1], lwrd if lwrd == "entity" else wrd]
+					continue
+
+				if (lwrd == "end" or lwrd == "begin"):
+					break
+
+				if (lwrd == "generic" or lwrd == "port"):
+					entryType = lwrd
+					entries = entity[lwrd + "s"]
+				continue
+
+			# Comments within port / generic list
+			if (wrd.startswith("--")):
+				cmnt = self.get_comment_text(wrd)
+
+				if (VHDL_SECTION_RE.match(wrd)):
+					if (inSection):
+						entries.append({"entry_type" : "section",
+										"comment" : " ".join(comments)})
+					comments = []
+					inSection = not inSection
+
+				elif (lastEntries and not "\n" in text[lastEnd:tok.start()]):
+					for entry in lastEntries:
+						entry["comment"] = " ".join(
+							[c for c in [entry["comment"], cmnt] if c])
+
+				elif (cmnt):
+					comments.append(cmnt)
+				continue
+
+			lastEntries = []
+
+			if (wrd == "("):
+				depth += 1
+				if (depth == 1):
+					continue
+			elif (wrd == ")"):
+				depth -= 1
+
+			# Declaration ends by ";" or by end of port / generic list
+			if ((wrd == ";" and depth == 1) or depth == 0):
+				if (declToks):
+					lastEntries = self.parse_decl(text, declToks, entryType)
+					lastEnd = tok.end()
+					for entry in lastEntries:
+						entry["comment"] = " ".join(comments)
+					entries += lastEntries
+					declToks = []
+					comments = []
+
+				if (depth == 0):
+					entries = None
+					lastEntries = []
+				continue
+
+			declToks.append(tok)
+
+		return entity
+
+
+	def parse_file(self, path):
+		"""
+		Parse interface of entity within VHDL file (see "parse").
+		Arguments:
+			path		Path to VHDL file
+		"""
+		with open(path) as fd:
+			return self.parse(fd.read())
@@ -0,0 +1,193 @@
+--------------------------------------------------------------------------------
+--
+-- Register map generation tool
+--
+-- Copyright (C) 2018 Ondrej Ille <ondrej.ille@gmail.com>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this SW component and associated documentation files (the "Component"),
+-- to deal in the Component without restriction, including without limitation
+-- the rights to use, copy, modify, merge, publish, distribute, sublicense,
+-- and/or sell copies of the Component, and to permit persons to whom the
+-- Component is furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in
+-- all copies or substantial portions of the Component.
+--
+-- THE COMPONENT IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHTHOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+-- FROM, OUT OF OR IN CONNECTION WITH THE COMPONENT OR THE USE OR OTHER DEALINGS
+-- IN THE COMPONENT.
+--
+--------------------------------------------------------------------------------
+
+--------------------------------------------------------------------------------
+-- Purpose:
+--   Hierarchical address decoder. High address bits are decoded to one-hot
+--   group select, low address bits are decoded to one-hot select within a
+--   group. Each address entry is AND of its group select and low select, so
+--   no full address width comparator is needed per entry.
+--------------------------------------------------------------------------------
+-- Revision History:
+--    18.10.2026   Created file
+--------------------------------------------------------------------------------
+
+Library ieee;
+USE IEEE.std_logic_1164.all;
+USE IEEE.numeric_std.ALL;
+
+entity address_decoder_hier is
+    generic(
+
+        -- Width of address input
+        constant address_width         :     natural;
+
+        -- Number of address entries to decode
+        constant address_entries       :     natural;
+
+        -- Addresses to be decoded joined to single address vector. This is
+        -- beneficial since there can be gaps in addresses between extra logic!
+        constant addr_vect             :     std_logic_vector;
+
+        -- Number of low address bits decoded within a group. Remaining high
+        -- bits select the group. Must be between 1 and address_width - 1.
+        constant low_width             :     natural := 4;
+
+        -- Choose betweed registered/ non-registered output
+        constant registered_out        :     boolean := false
+    );
+    port(
+        ------------------------------------------------------------------------
+        -- Clock and reset
+        ------------------------------------------------------------------------
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Address input
+        ------------------------------------------------------------------------
+        signal address                :in   std_logic_vector(address_width - 1 downto 0);
+
+        ------------------------------------------------------------------------
+        -- Enable input
+        ------------------------------------------------------------------------
+        signal enable                 :in   std_logic;
+
+        ------------------------------------------------------------------------
+        -- Output, one-hot coded. In logic 1 for each valid address
+        ------------------------------------------------------------------------
+        signal addr_dec               :out  std_logic_vector(address_entries - 1 downto 0)
+    );
+
+end entity address_decoder_hier;
+
+
+architecture rtl of address_decoder_hier is
+
+    -- Number of high address bits selecting a group
+    constant high_width               :   natural := address_width - low_width;
+
+    -- One-hot coded group select (high address bits)
+    signal group_sel                  :   std_logic_vector(
+                                                2 ** high_width - 1 downto 0);
+
+    -- One-hot coded select within a group (low address bits)
+    signal low_sel                    :   std_logic_vector(
+                                                2 ** low_width - 1 downto 0);
+
+    -- Internal one-hot coded signal of address decoder
+    signal addr_dec_i                 :   std_logic_vector(
+                                                address_entries - 1 downto 0);
+
+    -- Address after masking by enable input
+    signal addr_dec_enabled_i          :   std_logic_vector(
+                                                address_entries - 1 downto 0);
+
+begin
+
+    ---------------------------------------------------------------------------
+    -- Group select from high address bits
+    ---------------------------------------------------------------------------
+    group_sel_gen : for i in 0 to 2 ** high_width - 1 generate
+        group_sel(i) <= '1' when (address(address_width - 1 downto low_width) =
+                                  std_logic_vector(to_unsigned(i, high_width)))
+                            else
+                        '0';
+    end generate group_sel_gen;
+
+    ---------------------------------------------------------------------------
+    -- Select within a group from low address bits
+    ---------------------------------------------------------------------------
+    low_sel_gen : for i in 0 to 2 ** low_width - 1 generate
+        low_sel(i) <= '1' when (address(low_width - 1 downto 0) =
+                                std_logic_vector(to_unsigned(i, low_width)))
+                          else
+                      '0';
+    end generate low_sel_gen;
+
+    ---------------------------------------------------------------------------
+    -- Address entries - AND of group select and select within a group
+    ---------------------------------------------------------------------------
+    addr_dec_gen : for i in 0 to address_entries - 1 generate
+        constant entry : std_logic_vector(address_width - 1 downto 0) :=
+            addr_vect((address_width * (i + 1)) - 1 downto address_width * i);
+        constant group_ind : natural :=
+            to_integer(unsigned(entry(address_width - 1 downto low_width)));
+        constant low_ind : natural :=
+            to_integer(unsigned(entry(low_width - 1 downto 0)));
+    begin
+        addr_dec_i(i) <= group_sel(group_ind) and low_sel(low_ind);
+    end generate addr_dec_gen;
+
+
+    ---------------------------------------------------------------------------
+    -- Address decoder enabled / disabled - masking
+    ---------------------------------------------------------------------------
+    addr_dec_enabled_i <= addr_dec_i when (enable = '1') else
+                          (OTHERS => '0');
+
+
+    ---------------------------------------------------------------------------
+    -- Registering / Not-registering output
+    ---------------------------------------------------------------------------
+    addr_dec_reg_true_gen : if (registered_out) generate
+        addr_dec_reg_proc : process(res_n, clk_sys)
+        begin
+            if (res_n = '0') then
+                addr_dec <= (OTHERS => '0');
+
+            elsif (rising_edge(clk_sys)) then
+                addr_dec <= addr_dec_enabled_i;
+
+            end if;
+        end process;
+    end generate addr_dec_reg_true_gen;
+
+    addr_dec_reg_false_gen : if (not registered_out) generate
+        addr_dec <= addr_dec_enabled_i;
+    end generate addr_dec_reg_false_gen;
+
+
+    ---------------------------------------------------------------------------
+    -- Check that input vector length and group split are correct.
+    ---------------------------------------------------------------------------
+    -- pragma translate_off
+    -- coverage off
+    assert (addr_vect'length = address_width * address_entries)
+        report "Invalid length of address vector: " &
+                integer'image(addr_vect'length) &
+               " Length should be: " &
+                integer'image(address_width * address_entries)
+        severity failure;
+
+    assert (low_width > 0 and low_width < address_width)
+        report "Invalid width of low address bits: " &
+                integer'image(low_width)
+        severity failure;
+    -- coverage on
+    -- pragma translate_on
+
+end architecture;
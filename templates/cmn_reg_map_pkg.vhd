@@ -28,6 +28,7 @@
 -- Purpose:
 --   Common package for register map generator. Contains following components:
 --      Address decoder
+--      Hierarchical address decoder
 --      Data multiplexor
 --      Memory register
 --      Access signaller
@@ -35,6 +36,7 @@
 --------------------------------------------------------------------------------
 -- Revision history:
 --  25.11.2018   Created file
+--  18.10.2026   Added hierarchical address decoder
 --------------------------------------------------------------------------------
 
 Library ieee;
@@ -64,6 +66,27 @@ component address_decoder is
 end component address_decoder;
 
 
+--------------------------------------------------------------------------------
+-- Hierarchical address decoder
+--------------------------------------------------------------------------------
+component address_decoder_hier is
+    generic(
+        constant address_width         :     natural;
+        constant address_entries       :     natural;
+        constant addr_vect             :     std_logic_vector;
+        constant low_width             :     natural := 4;
+        constant registered_out        :     boolean := false
+    );
+    port(
+        signal clk_sys                :in   std_logic;
+        signal res_n                  :in   std_logic;
+        signal address                :in   std_logic_vector(address_width - 1 downto 0);
+        signal enable                 :in   std_logic;
+        signal addr_dec               :out  std_logic_vector(address_entries - 1 downto 0)
+    );
+end component address_decoder_hier;
+
+
 --------------------------------------------------------------------------------
 -- Data multiplexor
 --------------------------------------------------------------------------------